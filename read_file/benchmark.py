@@ -0,0 +1,120 @@
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+from scraper.utils import (
+    setup_asyncio,
+    update_image_sources,
+    read_excel_frame,
+    DEFAULT_DIR_NAME,
+)
+
+setup_asyncio()
+
+
+# 성능 측정 (네트워크 없이 엑셀 처리 시간만 비교)
+class Benchmark:
+    rows = 10000
+
+    @classmethod
+    def create_workbook(cls, file_path: Path, rows: int) -> None:
+        df = pd.DataFrame(
+            {
+                "상품번호": range(1, rows + 1),
+                "사이트": "카카오",
+                "카테고리": "식품",
+                "상품명": [f"상품 {i}" for i in range(rows)],
+                "판매가": [random.randint(1000, 100000) for _ in range(rows)],
+                "링크": [f"https://gift.kakao.com/product/{i}" for i in range(rows)],
+                "이미지소스": [
+                    ",".join(
+                        f"https://img1.kakaocdn.net/product/{i}_{j}.jpg"
+                        for j in range(4)
+                    )
+                    for i in range(rows)
+                ],
+            }
+        )
+        df.to_excel(file_path, index=False, sheet_name=DEFAULT_DIR_NAME)
+
+    @classmethod
+    async def legacy_update_image_sources(cls, file_path: Path, image_num_list):
+        # 이전 방식: pandas 로 읽고 openpyxl 로 다시 열어 행 단위로 수정
+        df = pd.read_excel(file_path, sheet_name=DEFAULT_DIR_NAME, engine="openpyxl")
+        workbook = openpyxl.load_workbook(file_path)
+        sheet = workbook[DEFAULT_DIR_NAME]
+
+        for idx, row in df.iterrows():
+            image_src = row["이미지소스"].split(",")[image_num_list[idx]]
+            cell = sheet.cell(row=idx + 2, column=df.columns.get_loc("이미지소스") + 1)
+            cell.value = image_src
+
+        workbook.save(file_path)
+
+    @classmethod
+    async def update_image_sources(cls, rows: int = rows) -> None:
+        image_num_list = [random.randint(0, 3) for _ in range(rows)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            legacy_path = Path(temp_dir) / "legacy.xlsx"
+            current_path = Path(temp_dir) / "current.xlsx"
+            cls.create_workbook(legacy_path, rows)
+            cls.create_workbook(current_path, rows)
+
+            start = time.perf_counter()
+            await cls.legacy_update_image_sources(legacy_path, image_num_list)
+            legacy_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await update_image_sources(
+                file_path=str(current_path),
+                image_num_list=image_num_list,
+                download=False,
+            )
+            current_elapsed = time.perf_counter() - start
+
+            legacy_df = pd.read_excel(legacy_path, engine="openpyxl")
+            current_df = pd.read_excel(current_path, engine="openpyxl")
+            assert legacy_df["이미지소스"].equals(current_df["이미지소스"])
+
+        print(
+            f"update_image_sources {rows}행: 이전 {legacy_elapsed:.2f}초, "
+            f"현재 {current_elapsed:.2f}초 ({legacy_elapsed / current_elapsed:.1f}배)"
+        )
+
+    @classmethod
+    async def read_excel(cls, rows: int = rows) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "read.xlsx"
+            cls.create_workbook(file_path, rows)
+
+            start = time.perf_counter()
+            pd.read_excel(file_path, sheet_name=DEFAULT_DIR_NAME, engine="openpyxl")
+            legacy_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await read_excel_frame(
+                file_path,
+                sheet_name=DEFAULT_DIR_NAME,
+                usecols=["상품번호", "이미지소스"],
+            )
+            current_elapsed = time.perf_counter() - start
+
+        print(
+            f"엑셀 로드 {rows}행: pd.read_excel {legacy_elapsed:.2f}초, "
+            f"read_excel_frame {current_elapsed:.2f}초"
+        )
+
+
+async def main():
+    await Benchmark.read_excel()
+    await Benchmark.update_image_sources()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
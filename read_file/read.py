@@ -1,10 +1,14 @@
 import asyncio
 import os
 import re
+import time
+from typing import Dict, List, Tuple
 
 import pandas as pd
+from playwright.async_api import async_playwright, Browser
 
 from scraper.scrap_crawlers import (
+    ScrapUtil,
     ScrapGiftKakao,
     ScrapNaverBrandStore,
     ScrapHM,
@@ -17,6 +21,10 @@ from scraper.utils import (
     setup_datetime,
     create_xlsx_file,
     save_to_xlsx,
+    read_excel_frame,
+    get_logger,
+    get_error_message,
+    get_product_store,
     DEFAULT_DIR_NAME,
 )
 
@@ -52,6 +60,54 @@ class Read:
             image_num_list=image_num_list,
         )
 
+    # 스크랩 결과를 링크 기준으로 조인해서 변경 사항을 컬럼 단위로 계산
+    @classmethod
+    async def apply_product_diffs(
+        cls, df: pd.DataFrame, product_details: List[dict]
+    ) -> pd.DataFrame:
+        compare_columns = ["상품명", "판매가", "옵션1", "옵션2"]
+        scraped = pd.DataFrame(product_details, columns=["링크", *compare_columns])
+        if scraped.empty:
+            return df
+
+        # 같은 링크가 여러 행이면 첫 번째 행에 반영
+        link_rows = pd.Series(df.index, index=df["링크"], name="행")
+        link_rows = link_rows[~link_rows.index.duplicated()]
+
+        scraped = scraped.drop_duplicates(subset="링크", keep="last")
+        matched = scraped.join(link_rows, on="링크", how="inner").set_index("행")
+        if matched.empty:
+            return df
+
+        rows = matched.index
+
+        def changed_rows(column: str) -> pd.Index:
+            changed = df.loc[rows, column].ne(matched[column])
+            changed = changed.astype(object).where(changed.notna(), True).astype(bool)
+            return changed[changed].index
+
+        name_rows = changed_rows("상품명")
+        df.loc[name_rows, "변경상품명"] = matched.loc[name_rows, "상품명"]
+
+        price_rows = changed_rows("판매가")
+        df.loc[price_rows, "차액"] = (
+            (df.loc[price_rows, "판매가"] - matched.loc[price_rows, "판매가"])
+            .abs()
+            .astype(object)
+        )
+        df.loc[price_rows, "판매가"] = matched.loc[price_rows, "판매가"]
+
+        option_1_rows = changed_rows("옵션1")
+        df.loc[option_1_rows, "변경옵션1"] = matched.loc[option_1_rows, "옵션1"]
+
+        option_2_rows = changed_rows("옵션2")
+        df.loc[option_2_rows, "변경옵션2"] = matched.loc[option_2_rows, "옵션2"]
+
+        # 품절 컬럼은 빈 값으로 생성
+        df.loc[rows, "품절"] = ""
+
+        return df
+
     # TODO: 엑셀 업데이트 자동화 테스트
     @classmethod
     async def update_xlsx(cls):
@@ -59,66 +115,108 @@ class Read:
         extension = ".xlsx"
         timestamp = setup_datetime()
         file_path = cls.root_path / cls.excel / f"{file_name}{extension}"
-        df = pd.read_excel(file_path)
+        df = await read_excel_frame(file_path)
 
         xlsx_site_names = df["사이트"].unique()
 
+        # 사이트 이름은 클래스 속성이라 인스턴스를 만들 필요 없음
         scrapers = {
-            ScrapGiftKakao().site_name: ScrapGiftKakao(),
-            ScrapNaverBrandStore().site_name: ScrapNaverBrandStore(),
-            ScrapHM().site_name: ScrapHM(),
-            ScrapZARA().site_name: ScrapZARA(),
+            scraper.site_name: scraper
+            for scraper in (ScrapGiftKakao, ScrapNaverBrandStore, ScrapHM, ScrapZARA)
         }
 
         new_columns = ["차액", "변경옵션1", "변경옵션2", "변경상품명", "품절"]
         for col in new_columns:
             if col not in df.columns:
-                df[col] = ""
+                df[col] = pd.Series("", index=df.index, dtype=object)
 
-        scrap_datas = []
+        scrap_datas = {}
         for xlsx_site_name in xlsx_site_names:
+            if xlsx_site_name not in scrapers:
+                print(f"업데이트를 지원하지 않는 사이트: '{xlsx_site_name}'")
+                continue
+
             filtered_df = df[df["사이트"] == xlsx_site_name]
             product_urls = [
                 {category: link}
                 for category, link in zip(filtered_df["카테고리"], filtered_df["링크"])
             ]
-            scrap_data = {xlsx_site_name: product_urls}
-            scrap_datas.append(scrap_data)
-
-        for scrap_data in scrap_datas:
-            for site_name, product_urls in scrap_data.items():
-                product_details, _ = await scrapers[site_name].update(
-                    product_urls=product_urls
+            # 목록 비교용 이전 값 (링크 -> 상품명/판매가)
+            previous = {
+                link: {
+                    "상품명": name if pd.notna(name) else None,
+                    "판매가": int(price) if pd.notna(price) else None,
+                }
+                for link, name, price in zip(
+                    filtered_df["링크"], filtered_df["상품명"], filtered_df["판매가"]
                 )
-
-                for product_detail in product_details:
-                    link = product_detail["링크"]
-                    matching_row = df[df["링크"] == link]
-
-                    if not matching_row.empty:
-                        index = matching_row.index[0]
-
-                        # Check and update 상품명
-                        if df.at[index, "상품명"] != product_detail["상품명"]:
-                            df.at[index, "변경상품명"] = product_detail["상품명"]
-
-                        # Check and update 판매가 and 차액
-                        if df.at[index, "판매가"] != product_detail["판매가"]:
-                            df.at[index, "차액"] = max(
-                                df.at[index, "판매가"], product_detail["판매가"]
-                            ) - min(df.at[index, "판매가"], product_detail["판매가"])
-                            df.at[index, "판매가"] = product_detail["판매가"]
-
-                        # Check and update 옵션1
-                        if df.at[index, "옵션1"] != product_detail["옵션1"]:
-                            df.at[index, "변경옵션1"] = product_detail["옵션1"]
-
-                        # Check and update 옵션2
-                        if df.at[index, "옵션2"] != product_detail["옵션2"]:
-                            df.at[index, "변경옵션2"] = product_detail["옵션2"]
-
-                        # 품절 컬럼은 빈 값으로 생성
-                        df.at[index, "품절"] = ""
+            }
+            # 가격/옵션 변경을 비교하는 작업이므로 상세 정보 캐시를 쓰지 않고 매번 다시 방문
+            scrap_datas[xlsx_site_name] = (
+                scrapers[xlsx_site_name](use_detail_cache=False),
+                product_urls,
+                previous,
+            )
+
+        if not scrap_datas:
+            return
+
+        async def update_site(
+            browser: Browser,
+            site_name: str,
+            scraper: ScrapUtil,
+            product_urls: List,
+            previous: Dict,
+        ) -> Tuple[str, List[dict]]:
+            try:
+                product_details, _ = await scraper.update(
+                    product_urls=product_urls, browser=browser, previous=previous
+                )
+            except Exception:
+                message = (
+                    f"'{site_name}' 업데이트 중 예외 발생\n{await get_error_message()}"
+                )
+                logger = await get_logger()
+                logger.error(message)
+                print(message)
+                product_details = []
+
+            return site_name, product_details
+
+        # 사이트별 업데이트를 브라우저 하나에서 동시에 실행하고, 끝나는 대로 반영
+        store = get_product_store()
+        started_at = time.time()
+        async with async_playwright() as p:
+            browser = await ScrapUtil.launch_browser(
+                p,
+                headless=all(
+                    scraper.headless for scraper, _, _ in scrap_datas.values()
+                ),
+            )
+            try:
+                tasks = [
+                    update_site(browser, site_name, scraper, product_urls, previous)
+                    for site_name, (
+                        scraper,
+                        product_urls,
+                        previous,
+                    ) in scrap_datas.items()
+                ]
+                for task in asyncio.as_completed(tasks):
+                    site_name, product_details = await task
+                    await cls.apply_product_diffs(df, product_details)
+                    await store.upsert_products(product_details)
+                    print(f"'{site_name}' 업데이트 반영: {len(product_details)}건")
+            finally:
+                await browser.close()
+
+        # 이번 업데이트로 이력이 추가된 상품만 인덱스로 조회
+        for change in await store.get_changes(since=started_at):
+            print(
+                f"[{change['site']}] 변경: '{change['previous_name']}' "
+                f"{change['previous_sale_price']} -> '{change['name']}' "
+                f"{change['sale_price']}, 링크: '{change['link']}'"
+            )
 
         excel_buffer = await create_xlsx_file(
             data=df.to_dict("records"), file_name=file_name, sheet_name=DEFAULT_DIR_NAME
@@ -127,4 +225,5 @@ class Read:
         await save_to_xlsx(xlsx_file=excel_buffer, output_path=output_path)
 
 
-asyncio.run(Read.update_xlsx())
+if __name__ == "__main__":
+    asyncio.run(Read.update_xlsx())
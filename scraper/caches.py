@@ -0,0 +1,382 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import re
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+# 상품과 무관한 유입 추적용 쿼리 파라미터
+TRACKING_PARAM_PATTERN = re.compile(
+    r"^(utm_.*|fbclid|gclid|dclid|msclkid|igshid|yclid|_ga|_gl|mc_[ce]id"
+    r"|nt_.*|napm|n_.*|tab_id|ref|ref_.*|referrer|source|from|trk|spm|srsltid)$",
+    re.IGNORECASE,
+)
+
+
+def normalize_image_url(image_url: str) -> str:
+    # 스킴/호스트 소문자, 기본 포트 제거, 쿼리 정렬, 프래그먼트 제거
+    image_url = urllib.parse.urljoin("https:", image_url.strip())
+    parts = urllib.parse.urlsplit(image_url)
+
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rsplit(":", 1)[-1]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rsplit(":", 1)[0]
+
+    query = urllib.parse.urlencode(
+        sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+    )
+    return urllib.parse.urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def canonicalize_url(
+    url: str, base_url: str = "", keep_params: Optional[Iterable[str]] = None
+) -> str:
+    # 상품 링크 정규화: 상대 경로 결합, 호스트 소문자/www 통일, 추적 파라미터 제거
+    # keep_params 가 주어지면 그 파라미터만 남김 (빈 값이면 쿼리 전체 제거)
+    url = urllib.parse.urljoin(base_url or "https:", url.strip())
+    parts = urllib.parse.urlsplit(url)
+
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if netloc.endswith((":80", ":443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    if netloc.startswith("m."):
+        netloc = netloc[2:]
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    params = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    if keep_params is not None:
+        keep_params = set(keep_params)
+        params = [(key, value) for key, value in params if key in keep_params]
+    else:
+        params = [
+            (key, value)
+            for key, value in params
+            if not TRACKING_PARAM_PATTERN.match(key)
+        ]
+    query = urllib.parse.urlencode(sorted(params))
+
+    return urllib.parse.urlunsplit((scheme, netloc, path, query, ""))
+
+
+def hash_content(data: Union[bytes, memoryview]) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# 이미지 디스크 캐시
+# 정규화된 URL + 변형(리사이즈 크기)을 키로 인덱스를 두고, 파일은 원본 바이트 해시로 저장함.
+# ETag/Last-Modified 는 조건부 요청에 사용하고, 전체 용량은 LRU로 제한함.
+class ImageCache:
+    def __init__(
+        self,
+        root_path: Path,
+        max_bytes: int = 2 * 1024**3,
+        max_age: float = 60 * 60 * 24,
+    ):
+        self.root_path = root_path
+        self.objects_path = root_path / "objects"
+        self.objects_path.mkdir(parents=True, exist_ok=True)
+
+        self.max_bytes = max_bytes
+        self.max_age = max_age  # 이 시간 안에 검증된 항목은 요청 없이 바로 사용
+
+        self.hits = 0
+        self.revalidated = 0
+        self.dedup = 0  # 링크는 다르지만 내용이 같아 저장된 파일을 그대로 사용
+        self.misses = 0
+        self.stores = 0
+
+        self.connection = sqlite3.connect(root_path / "index.sqlite3")
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS image_cache (
+                url_key TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                blob_name TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (url_key, variant)
+            );
+            CREATE INDEX IF NOT EXISTS idx_image_cache_accessed
+                ON image_cache (accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_image_cache_blob
+                ON image_cache (blob_name);
+            """
+        )
+
+    @classmethod
+    def url_key(cls, image_url: str) -> str:
+        return hashlib.sha256(normalize_image_url(image_url).encode()).hexdigest()
+
+    def blob_path(self, blob_name: str) -> Path:
+        return self.objects_path / blob_name[:2] / blob_name
+
+    async def lookup(self, image_url: str, variant: str) -> Optional[Dict]:
+        row = self.connection.execute(
+            "SELECT * FROM image_cache WHERE url_key = ? AND variant = ?",
+            (self.url_key(image_url), variant),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        entry = dict(row)
+        if not self.blob_path(entry["blob_name"]).exists():
+            await self.remove(entry)
+            return None
+
+        return entry
+
+    async def find_blob(self, content_hash: str, variant: str) -> Optional[str]:
+        # URL은 달라도 같은 원본 바이트로 이미 만든 결과물이 있는지 확인
+        blob_name = f"{content_hash}_{variant}"
+        return blob_name if self.blob_path(blob_name).exists() else None
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry["validated_at"] < self.max_age
+
+    @classmethod
+    def conditional_headers(cls, entry: Dict) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def store(
+        self,
+        image_url: str,
+        variant: str,
+        content_hash: str,
+        source_path: Optional[Path] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        blob_name = f"{content_hash}_{variant}"
+        blob_path = self.blob_path(blob_name)
+
+        if not blob_path.exists():
+            if source_path is None:
+                return
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            await self.link_or_copy(source_path, blob_path)
+
+        now = time.time()
+        self.connection.execute(
+            """
+            INSERT OR REPLACE INTO image_cache (
+                url_key, variant, url, content_hash, blob_name,
+                etag, last_modified, size, validated_at, accessed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self.url_key(image_url),
+                variant,
+                image_url,
+                content_hash,
+                blob_name,
+                etag,
+                last_modified,
+                blob_path.stat().st_size,
+                now,
+                now,
+            ),
+        )
+        self.connection.commit()
+
+        self.stores += 1
+        # 매번 전체 용량을 집계하지 않도록 일정 간격으로만 정리
+        if self.stores % 100 == 0:
+            await self.evict()
+
+    async def touch(self, entry: Dict, validated: bool = False) -> None:
+        now = time.time()
+        if validated:
+            self.connection.execute(
+                "UPDATE image_cache SET accessed_at = ?, validated_at = ? "
+                "WHERE url_key = ? AND variant = ?",
+                (now, now, entry["url_key"], entry["variant"]),
+            )
+        else:
+            self.connection.execute(
+                "UPDATE image_cache SET accessed_at = ? WHERE url_key = ? AND variant = ?",
+                (now, entry["url_key"], entry["variant"]),
+            )
+        self.connection.commit()
+
+    async def materialize(self, blob_name: str, target_path: Path) -> None:
+        await self.link_or_copy(self.blob_path(blob_name), target_path)
+
+    async def remove(self, entry: Dict) -> None:
+        self.connection.execute(
+            "DELETE FROM image_cache WHERE url_key = ? AND variant = ?",
+            (entry["url_key"], entry["variant"]),
+        )
+        self.connection.commit()
+        await self.unlink_orphan_blob(entry["blob_name"])
+
+    async def evict(self) -> None:
+        # 같은 파일을 여러 항목이 공유하므로 파일 단위로 용량 계산
+        (total_size,) = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM image_cache GROUP BY blob_name)"
+        ).fetchone()
+        if total_size <= self.max_bytes:
+            return
+
+        blobs = self.connection.execute(
+            """
+            SELECT blob_name, MAX(size) AS size, MAX(accessed_at) AS accessed_at
+            FROM image_cache GROUP BY blob_name ORDER BY accessed_at
+            """
+        ).fetchall()
+
+        for blob in blobs:
+            if total_size <= self.max_bytes:
+                break
+
+            self.connection.execute(
+                "DELETE FROM image_cache WHERE blob_name = ?", (blob["blob_name"],)
+            )
+            await self.unlink_orphan_blob(blob["blob_name"])
+            total_size -= blob["size"]
+
+        self.connection.commit()
+
+    async def unlink_orphan_blob(self, blob_name: str) -> None:
+        in_use = self.connection.execute(
+            "SELECT 1 FROM image_cache WHERE blob_name = ? LIMIT 1", (blob_name,)
+        ).fetchone()
+        if not in_use:
+            self.blob_path(blob_name).unlink(missing_ok=True)
+
+    @classmethod
+    async def link_or_copy(cls, source_path: Path, target_path: Path) -> None:
+        target_path.unlink(missing_ok=True)
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            # 다른 드라이브거나 하드링크를 지원하지 않는 파일 시스템
+            shutil.copyfile(source_path, target_path)
+
+    def summary(self) -> str:
+        return (
+            f"이미지 캐시 적중: {self.hits}, 재검증(304): {self.revalidated}, "
+            f"중복 내용: {self.dedup}, 미적중: {self.misses}"
+        )
+
+
+# 상품 상세 정보 캐시
+# 정규화된 상품 링크를 키로 추출 결과(상세 정보, 이미지 링크)를 저장하고, 사이트별 유효 시간이 지나면 다시 방문함.
+class DetailCache:
+    def __init__(self, db_path: Path, max_entries: int = 200000):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stores = 0
+
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS detail_cache (
+                site TEXT NOT NULL,
+                url TEXT NOT NULL,
+                category TEXT,
+                detail TEXT NOT NULL,
+                image TEXT,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (site, url)
+            );
+            CREATE INDEX IF NOT EXISTS idx_detail_cache_accessed
+                ON detail_cache (accessed_at);
+            """
+        )
+
+    async def lookup(
+        self, site: str, url: str, ttl: float
+    ) -> Optional[Tuple[Dict, Any, str]]:
+        row = self.connection.execute(
+            "SELECT * FROM detail_cache WHERE site = ? AND url = ?", (site, url)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        if time.time() - row["created_at"] >= ttl:
+            self.expired += 1
+            return None
+
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE detail_cache SET accessed_at = ? WHERE site = ? AND url = ?",
+            (time.time(), site, url),
+        )
+        self.connection.commit()
+        return json.loads(row["detail"]), json.loads(row["image"]), row["category"]
+
+    async def store(
+        self, site: str, url: str, category: str, detail: Dict, image: Any
+    ) -> None:
+        now = time.time()
+        self.connection.execute(
+            """
+            INSERT OR REPLACE INTO detail_cache (
+                site, url, category, detail, image, created_at, accessed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                site,
+                url,
+                category,
+                json.dumps(detail, ensure_ascii=False),
+                json.dumps(image, ensure_ascii=False),
+                now,
+                now,
+            ),
+        )
+        self.stores += 1
+        # 매번 개수를 세지 않도록 일정 간격으로만 정리
+        if self.stores % 1000 == 0:
+            await self.evict()
+        self.connection.commit()
+
+    async def evict(self) -> None:
+        # 오래 사용하지 않은 항목부터 max_entries 개만 남김
+        self.connection.execute(
+            """
+            DELETE FROM detail_cache WHERE rowid IN (
+                SELECT rowid FROM detail_cache ORDER BY accessed_at DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def summary(self) -> str:
+        return (
+            f"상세 정보 캐시 적중: {self.hits}, 만료: {self.expired}, "
+            f"미적중: {self.misses}"
+        )
@@ -114,6 +114,19 @@ class ScrapComponent(FletUtilComponent):
             expand=True,
         )
 
+        # 옵션
+        self.capture_images = ft.Checkbox(
+            label="브라우저 이미지 재사용 (카카오, H & M, ZARA)", value=False
+        )
+        self.resume = ft.Checkbox(label="중지된 작업 이어받기", value=False)
+        self.use_detail_cache = ft.Checkbox(label="상세 정보 캐시 사용", value=True)
+        self.archive_snapshots = ft.Checkbox(
+            label="상세 페이지 스냅샷 저장", value=False
+        )
+        self.new_only = ft.Checkbox(
+            label="신상품만 (이전에 수집한 상품 제외)", value=False
+        )
+
         self.start_button = ft.FilledButton(
             text="스크랩 작업 시작",
             on_click=self.start_scrap,
@@ -121,34 +134,32 @@ class ScrapComponent(FletUtilComponent):
         )
 
         # 종합
-        self.scrap_kakao = ft.Checkbox(label=ScrapGiftKakao().site_name, value=False)
+        self.scrap_kakao = ft.Checkbox(label=ScrapGiftKakao.site_name, value=False)
         self.scrap_naver = ft.Checkbox(
-            label=ScrapNaverBrandStore().site_name, value=False
+            label=ScrapNaverBrandStore.site_name, value=False
         )
-        self.scrap_hm = ft.Checkbox(label=ScrapHM().site_name, value=False)
-        self.scrap_zara = ft.Checkbox(label=ScrapZARA().site_name, value=False)
+        self.scrap_hm = ft.Checkbox(label=ScrapHM.site_name, value=False)
+        self.scrap_zara = ft.Checkbox(label=ScrapZARA.site_name, value=False)
 
         # 명품
         self.scrap_dior = ft.Checkbox(
-            label=ScrapDior().site_name,
+            label=ScrapDior.site_name,
             value=False,
             disabled=True,
         )  # FIXME: 안티봇
-        self.scrap_valentino = ft.Checkbox(
-            label=ScrapValentino().site_name, value=False
-        )
+        self.scrap_valentino = ft.Checkbox(label=ScrapValentino.site_name, value=False)
         self.scrap_bottegaveneta = ft.Checkbox(
-            label=ScrapBottegaveneta().site_name, value=False
+            label=ScrapBottegaveneta.site_name, value=False
         )
         self.scrap_saint_laurent = ft.Checkbox(
-            label=ScrapSaintLaurent().site_name, value=False
+            label=ScrapSaintLaurent.site_name, value=False
         )
         self.scrap_balenciaga = ft.Checkbox(
-            label=ScrapBalenciaga().site_name, value=False
+            label=ScrapBalenciaga.site_name, value=False
         )
         # 리뷰
         self.scrap_google_play_review = ft.Checkbox(
-            label=ScrapGooglePlayReView().site_name, value=False
+            label=ScrapGooglePlayReView.site_name, value=False
         )
 
     async def is_valid(self) -> Tuple[bool, str]:
@@ -212,6 +223,11 @@ class ScrapComponent(FletUtilComponent):
         await ScrapMain(
             init_product_no=int(self.init_product_no.value),
             scrap_instances=scrap_instances,
+            capture_images=self.capture_images.value,
+            resume=self.resume.value,
+            new_only=self.new_only.value,
+            use_detail_cache=self.use_detail_cache.value,
+            archive_snapshots=self.archive_snapshots.value,
         ).main()
 
     async def scrap_review_task(self):
@@ -277,6 +293,15 @@ class ScrapComponent(FletUtilComponent):
                     self.scrap_google_play_review,
                 ]
             ),
+            ft.Row(
+                controls=[
+                    self.capture_images,
+                    self.resume,
+                    self.new_only,
+                    self.use_detail_cache,
+                    self.archive_snapshots,
+                ]
+            ),
             ft.Row(controls=[self.init_product_no]),
             ft.Row(controls=[self.start_button]),
             ft.Row(controls=[self.cancel_button]),
@@ -316,6 +341,9 @@ class ImageUpdateComponent(FletUtilComponent):
             ),
             expand=True,
         )
+        self.keep_original = ft.Checkbox(
+            label="원본 이미지 유지 (리사이즈 안 함)", value=False
+        )
         self.update_image = ft.FilledButton(
             "이미지 업데이트 시작",
             on_click=self.start_image_update,
@@ -341,6 +369,7 @@ class ImageUpdateComponent(FletUtilComponent):
         await read_data_info_excel_and_download_images(
             file_path=self.selected_files.value,
             # sheet_name=self.sheet_name.value,
+            target_size=None if self.keep_original.value else (800, 800),
         )
 
     async def start_image_update(self, e):
@@ -358,6 +387,7 @@ class ImageUpdateComponent(FletUtilComponent):
             ft.Row(controls=[self.image_update_label]),
             # ft.Row(controls=[self.sheet_name]),
             ft.Row(controls=[self.selected_files, self.initialize_file]),
+            ft.Row(controls=[self.keep_original]),
             ft.Row(controls=[self.upload_file, self.update_image]),
             ft.Row(controls=[self.cancel_button]),
             ft.Row(controls=[self.progress_text]),
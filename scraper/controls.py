@@ -0,0 +1,491 @@
+import asyncio
+import json
+import os
+import random
+import time
+import urllib.parse
+from collections import Counter, defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+
+# 사이트별 상세 페이지 실패율 감시
+# 연속 실패가 consecutive_limit 회거나 최근 window 건 중 실패율이 failure_rate 이상이면 차단함.
+# 처음 차단되면 대기 시간을 줄여서(degraded) 계속 진행하고, 그 상태에서 다시 차단되면 사이트를 중단함.
+class CircuitBreaker:
+    CLOSED = "정상"
+    DEGRADED = "성능 저하"
+    OPEN = "중단"
+
+    def __init__(
+        self,
+        site_name: str,
+        consecutive_limit: int = 10,
+        failure_rate: float = 0.5,
+        window: int = 40,
+        min_samples: int = 20,
+        degraded_timeout: int = 3000,
+    ):
+        self.site_name = site_name
+        self.consecutive_limit = consecutive_limit
+        self.failure_rate = failure_rate
+        self.min_samples = min_samples
+        self.degraded_timeout = degraded_timeout  # 성능 저하 상태의 요소 대기 시간(ms)
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.recent: Deque[bool] = deque(maxlen=window)
+
+        self.successes = 0
+        self.failures = 0
+        self.skipped = 0
+        self.reasons: Counter = Counter()
+        self.trip_reason = ""
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    @property
+    def is_degraded(self) -> bool:
+        return self.state == self.DEGRADED
+
+    def record_success(self) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.recent.append(True)
+
+    def record_failure(self, error: Optional[BaseException] = None) -> str:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.recent.append(False)
+        if error is not None:
+            # 예외 종류 + 첫 줄 기준으로 묶어서 요약에 사용
+            first_line = (
+                str(error).strip().splitlines()[0] if str(error).strip() else ""
+            )
+            self.reasons[f"{type(error).__name__}: {first_line[:120]}"] += 1
+
+        trip_reason = self.check()
+        if trip_reason:
+            self.trip(trip_reason)
+        return self.state
+
+    def record_skip(self) -> None:
+        # 차단된 뒤 방문하지 않은 상품
+        self.skipped += 1
+
+    def check(self) -> str:
+        if self.consecutive_failures >= self.consecutive_limit:
+            return f"연속 실패 {self.consecutive_failures}회"
+
+        if len(self.recent) >= self.min_samples:
+            rate = self.recent.count(False) / len(self.recent)
+            if rate >= self.failure_rate:
+                return f"최근 {len(self.recent)}건 중 실패율 {rate:.0%}"
+
+        return ""
+
+    def trip(self, reason: str) -> None:
+        self.trip_reason = reason
+        self.state = self.OPEN if self.state == self.DEGRADED else self.DEGRADED
+        self.consecutive_failures = 0
+        self.recent.clear()
+        print(f"'{self.site_name}' 차단기 동작 ({reason}) -> {self.state}")
+
+    def summary(self) -> str:
+        lines = [
+            f"'{self.site_name}' 상세 페이지: 성공 {self.successes}건, 실패 {self.failures}건, "
+            f"미방문 {self.skipped}건, 상태: {self.state}"
+            + (f" ({self.trip_reason})" if self.trip_reason else "")
+        ]
+        for reason, count in self.reasons.most_common(5):
+            lines.append(f"  [{count}건] {reason}")
+        return "\n".join(lines)
+
+
+def percentile(samples, q: float) -> Optional[float]:
+    samples = sorted(samples)
+    if not samples:
+        return None
+    index = min(len(samples) - 1, max(0, round(q / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+# 사이트별 작업 지연 시간 기록 (ms)
+# 전체 실행 분포는 구간별 개수(히스토그램)로, 백분위는 최근 window 건으로 계산함.
+class LatencyRecorder:
+    BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+    LABELS = {
+        "goto": "페이지 이동",
+        "selector": "요소 대기",
+        "extract": "이동~추출 완료",
+    }
+
+    def __init__(
+        self,
+        site_name: str,
+        window: int = 500,
+        timeouts: Optional["AdaptiveTimeouts"] = None,
+    ):
+        self.site_name = site_name
+        self.timeouts = timeouts  # 기록한 값으로 사이트별 timeout 학습
+        self.samples: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self.histograms: Dict[str, List[int]] = defaultdict(
+            lambda: [0] * (len(self.BUCKETS) + 1)
+        )
+
+    def record(self, operation: str, elapsed_ms: float) -> None:
+        self.samples[operation].append(elapsed_ms)
+        if self.timeouts is not None:
+            self.timeouts.observe(self.site_name, operation, elapsed_ms)
+
+        histogram = self.histograms[operation]
+        for i, bucket in enumerate(self.BUCKETS):
+            if elapsed_ms <= bucket:
+                histogram[i] += 1
+                break
+        else:
+            histogram[-1] += 1
+
+    @contextmanager
+    def measure(self, operation: str) -> Iterator[None]:
+        # 예외 없이 끝난 경우만 기록
+        start = time.perf_counter()
+        yield
+        self.record(operation, (time.perf_counter() - start) * 1000)
+
+    def percentile(self, operation: str, q: float) -> Optional[float]:
+        return percentile(self.samples.get(operation, ()), q)
+
+    def summary(self) -> str:
+        lines = []
+        for operation, histogram in self.histograms.items():
+            total = sum(histogram)
+            label = self.LABELS.get(operation, operation)
+            lines.append(
+                f"'{self.site_name}' {label} {total}건: "
+                f"p50 {self.percentile(operation, 50):,.0f}ms, "
+                f"p90 {self.percentile(operation, 90):,.0f}ms, "
+                f"p99 {self.percentile(operation, 99):,.0f}ms"
+            )
+
+            bounds = [f"<={bucket:,}ms" for bucket in self.BUCKETS]
+            bounds.append(f">{self.BUCKETS[-1]:,}ms")
+            for bound, count in zip(bounds, histogram):
+                if count:
+                    bar = "#" * max(1, round(count / total * 40))
+                    lines.append(f"  {bound:>10} {count:>6} {bar}")
+        return "\n".join(lines)
+
+
+# 차단/과부하로 보는 응답 코드 (타임아웃도 같이 취급)
+THROTTLE_STATUSES = {403, 429, 503}
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    # playwright 의 TimeoutError 는 내장 TimeoutError 를 상속하지 않으므로 이름으로도 확인
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+
+def get_domain(url: str) -> str:
+    # 서브도메인/CDN 호스트는 같은 사이트로 묶음 (예: img1.kakaocdn.net -> kakaocdn.net)
+    host = urllib.parse.urlsplit(url).hostname or ""
+    labels = host.split(".")
+    if (
+        len(labels) >= 3
+        and len(labels[-1]) == 2
+        and labels[-2] in {"co", "com", "ne", "or", "go"}
+    ):
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # 초 단위 값만 사용 (HTTP 날짜 형식은 무시)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class RateTicket:
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+
+# 도메인별 토큰 버킷 + 동시 요청 수 제한
+# 정상 응답이 이어지면 속도와 동시 요청 수를 조금씩(가산) 올리고,
+# 403/429/503/타임아웃이 나오면 절반으로(승산) 줄임 (AIMD).
+class DomainRateLimiter:
+    def __init__(
+        self,
+        domain: str,
+        rate: float = 2.0,
+        min_rate: float = 0.2,
+        max_rate: float = 20.0,
+        concurrency: float = 2.0,
+        max_concurrency: int = 8,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        cooldown: float = 5.0,
+    ):
+        self.domain = domain
+        self.rate = rate  # 초당 요청 수
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown  # 연달아 실패해도 이 시간 안에서는 한 번만 줄임
+
+        self.tokens = 1.0
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.in_flight = 0
+        # Condition 은 처음 기다린 이벤트 루프에 묶이므로 요청 시점에 루프별로 만듦
+        self.condition: Optional[asyncio.Condition] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.requests = 0
+        self.throttled = 0
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            max(1.0, self.rate), self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def get_condition(self) -> asyncio.Condition:
+        # asyncio.run 을 다시 호출해 루프가 바뀌면 이전 루프의 대기/점유 상태는 버림
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            self.loop = loop
+            self.condition = asyncio.Condition()
+            self.in_flight = 0
+        return self.condition
+
+    async def acquire(self) -> None:
+        async with self.get_condition():
+            await self.condition.wait_for(
+                lambda: self.in_flight < max(1, int(self.concurrency))
+            )
+            self.in_flight += 1
+
+        # 토큰이 찰 때까지 대기 (대기 중 취소되면 잡아 둔 자리를 돌려줌)
+        try:
+            while True:
+                self.refill()
+                wait = max(self.paused_until - time.monotonic(), 0.0)
+                if not wait and self.tokens >= 1:
+                    self.tokens -= 1
+                    break
+                await asyncio.sleep(max(wait, (1 - self.tokens) / self.rate))
+        except BaseException:
+            async with self.get_condition():
+                self.in_flight -= 1
+                self.condition.notify_all()
+            raise
+
+    async def release(
+        self,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        self.requests += 1
+        if status in THROTTLE_STATUSES or (
+            error is not None and is_timeout_error(error)
+        ):
+            self.on_throttled(retry_after)
+        elif error is None:
+            self.on_success()
+
+        async with self.get_condition():
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def on_success(self) -> None:
+        # 대략 한 바퀴(현재 속도만큼의 성공)마다 increase 만큼 증가
+        self.rate = min(self.max_rate, self.rate + self.increase / max(self.rate, 1.0))
+        self.concurrency = min(
+            self.max_concurrency, self.concurrency + 1 / max(self.concurrency, 1.0)
+        )
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        self.throttled += 1
+        now = time.monotonic()
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+        if now - self.last_decrease < self.cooldown:
+            return
+
+        self.last_decrease = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.concurrency = max(1.0, self.concurrency * self.decrease)
+        self.tokens = min(self.tokens, 0.0)
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[RateTicket]:
+        # 사용하는 쪽에서 ticket.status(와 retry_after)를 채우면 속도 조절에 반영
+        ticket = RateTicket()
+        await self.acquire()
+        try:
+            yield ticket
+        except BaseException as e:
+            await self.release(error=e)
+            raise
+        await self.release(status=ticket.status, retry_after=ticket.retry_after)
+
+    def summary(self) -> str:
+        return (
+            f"'{self.domain}' 속도 {self.rate:.2f}회/초, 동시 요청 {int(self.concurrency)}, "
+            f"요청 {self.requests}건, 차단/지연 {self.throttled}건"
+        )
+
+
+# 페이지 이동/요청 API/이미지 다운로드가 같은 도메인 제한을 공유하도록 도메인별로 하나만 만듦
+class RateLimiterRegistry:
+    def __init__(self, **limiter_kwargs):
+        self.limiter_kwargs = limiter_kwargs
+        self.limiters: Dict[str, DomainRateLimiter] = {}
+
+    def get(self, url: str) -> DomainRateLimiter:
+        domain = get_domain(url)
+        if domain not in self.limiters:
+            self.limiters[domain] = DomainRateLimiter(domain, **self.limiter_kwargs)
+        return self.limiters[domain]
+
+    def summary(self) -> str:
+        return "\n".join(
+            limiter.summary() for limiter in self.limiters.values() if limiter.requests
+        )
+
+
+# 사이트/작업별 최근 지연 시간으로 timeout 학습 (p99 x factor, min_timeout ~ max_timeout)
+# 표본은 파일에 남겨서 다음 실행도 처음부터 학습된 값을 사용함.
+class AdaptiveTimeouts:
+    def __init__(
+        self,
+        path: Path,
+        window: int = 200,
+        min_samples: int = 20,
+        quantile: float = 99,
+        factor: float = 3.0,
+        min_timeout: float = 5000,
+        max_timeout: float = 90000,
+    ):
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self.quantile = quantile
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+
+        self.samples: Dict[str, Dict[str, Deque[float]]] = defaultdict(
+            lambda: defaultdict(lambda: deque(maxlen=self.window))
+        )
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            for site, operations in data.get("samples", {}).items():
+                for operation, values in operations.items():
+                    self.samples[site][operation].extend(values)
+
+    def observe(self, site: str, operation: str, elapsed_ms: float) -> None:
+        self.samples[site][operation].append(round(elapsed_ms, 1))
+
+    def get(self, site: str, operation: str, default: float) -> float:
+        samples = self.samples.get(site, {}).get(operation, ())
+        if len(samples) < self.min_samples:
+            return default
+
+        timeout = percentile(samples, self.quantile) * self.factor
+        return min(self.max_timeout, max(self.min_timeout, timeout))
+
+    def save(self) -> None:
+        data = {
+            "samples": {
+                site: {
+                    operation: list(values) for operation, values in operations.items()
+                }
+                for site, operations in self.samples.items()
+            },
+            # 확인용 (불러올 때는 표본으로 다시 계산)
+            "timeouts": {
+                site: {
+                    operation: self.get(site, operation, default=0)
+                    for operation in operations
+                }
+                for site, operations in self.samples.items()
+            },
+        }
+
+        # 임시 파일에 쓰고 교체해서 중간에 종료되어도 이전 파일은 유지
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    def summary(self, site: str) -> str:
+        timeouts = [
+            f"{LatencyRecorder.LABELS.get(operation, operation)} {self.get(site, operation, default=0):,.0f}ms"
+            for operation, values in self.samples.get(site, {}).items()
+            if len(values) >= self.min_samples
+        ]
+        return f"'{site}' 학습된 timeout: {', '.join(timeouts)}" if timeouts else ""
+
+
+# 상품별 재시도 정책 (지수 백오프 + 사이트별 재시도 예산)
+# 예산은 사이트 상품 수의 budget_ratio 만큼(최소 min_budget)이라 셀렉터가 깨진 경우에도 재시도가 무한정 늘지 않음.
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 20.0,
+        budget_ratio: float = 0.1,
+        min_budget: int = 10,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.min_budget = min_budget
+
+        self.budget = min_budget
+        self.retries = 0
+        self.recovered = 0
+
+    def start(self, total: int) -> None:
+        self.budget = max(self.min_budget, int(total * self.budget_ratio))
+
+    def can_retry(self, attempt: int) -> bool:
+        return attempt < self.max_attempts and self.retries < self.budget
+
+    def consume(self) -> bool:
+        if self.retries >= self.budget:
+            return False
+        self.retries += 1
+        return True
+
+    def delay(self, attempt: int) -> float:
+        # 동시에 실패한 요청이 같은 시각에 몰리지 않도록 50~100% 사이로 흔듦
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def summary(self, site: str) -> str:
+        return (
+            f"'{site}' 재시도 {self.retries}건 (예산 {self.budget}건), "
+            f"재시도로 복구 {self.recovered}건"
+        )
@@ -0,0 +1,272 @@
+import asyncio
+import functools
+import re
+from collections import Counter
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from scraper.caches import hash_content
+
+# 사이트에서 이미지 대신 내려주는 빈 이미지 URL
+PLACEHOLDER_URL_PATTERNS = [
+    r"static\.zara\.net/.+/transparent-background\.png",
+    r"^data:image/",
+    r"placeholder",
+    r"/blank\.(gif|png)",
+    r"/spacer\.gif",
+]
+
+# 디코딩 결과: (디코딩 성공, (가로, 세로), 그레이스케일 이미지)
+# OpenCV가 지원하지 않는 형식은 손상 여부만 확인하므로 크기/이미지가 None
+DecodeResult = Tuple[bool, Optional[Tuple[int, int]], Optional[np.ndarray]]
+
+# 파일 시그니처 -> 확장자
+IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"BM", ".bmp"),
+]
+
+
+def guess_image_extension(header: bytes, default: str = ".png") -> str:
+    for signature, extension in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return extension
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    if header[4:12] in (b"ftypavif", b"ftypavis"):
+        return ".avif"
+
+    return default
+
+
+# 이미지 저장 전 검사
+# - URL/용량/해시로 플레이스홀더와 깨진 이미지를 걸러서 저장하지 않음
+# - 같은 상품 안에서 perceptual hash(dHash)가 비슷한 이미지는 중복으로 표시
+# - 여러 상품에 같은 바이트가 나오는 이미지는 기본은 표시만 함 (로고/공용 색상 칩일 수 있음)
+class ImageInspector:
+    def __init__(
+        self,
+        min_bytes: int = 1024,
+        min_dimension: int = 32,
+        min_stddev: float = 2.0,
+        duplicate_distance: int = 5,
+        repeat_threshold: int = 5,
+        skip_duplicates: bool = False,
+        skip_repeated: bool = False,
+    ):
+        self.min_bytes = min_bytes
+        self.min_dimension = min_dimension
+        self.min_stddev = min_stddev  # 픽셀 표준편차가 이보다 낮으면 단색 이미지
+        self.duplicate_distance = duplicate_distance
+        # 이 개수 이상의 상품에 같은 바이트가 나오면 반복 이미지로 표시
+        self.repeat_threshold = repeat_threshold
+        self.skip_duplicates = skip_duplicates
+        self.skip_repeated = skip_repeated  # 반복 이미지를 플레이스홀더로 보고 제외
+
+        self.placeholder_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in PLACEHOLDER_URL_PATTERNS
+        ]
+        self.placeholder_hashes: Set[str] = set()
+        self.hash_groups: Dict[str, Set[str]] = {}
+        self.group_dhashes: Dict[str, List[Tuple[int, str]]] = {}
+
+        self.skipped: List[Tuple[str, str, str]] = []  # (상품, URL, 사유)
+        self.duplicates: List[Tuple[str, str, str]] = []  # (상품, URL, 원본 URL)
+        self.repeated: List[Tuple[str, str, int]] = []  # (상품, URL, 상품 수)
+
+    async def check_url(self, image_url: str, group: str = "") -> bool:
+        if not image_url or not image_url.strip():
+            self.skipped.append((group, image_url, "빈 URL"))
+            return False
+
+        for pattern in self.placeholder_patterns:
+            if pattern.search(image_url):
+                self.skipped.append((group, image_url, "플레이스홀더 URL"))
+                return False
+
+        return True
+
+    async def check_size(
+        self, image_url: str, content_length: Optional[int], group: str = ""
+    ) -> bool:
+        if content_length is not None and content_length < self.min_bytes:
+            self.skipped.append((group, image_url, f"용량 부족 ({content_length}B)"))
+            return False
+        return True
+
+    async def inspect(self, body: bytes, image_url: str, group: str = "") -> bool:
+        return await self.inspect_content(
+            image_url=image_url,
+            group=group,
+            size=len(body),
+            content_hash=hash_content(body),
+            decode=functools.partial(self.decode_bytes, body),
+        )
+
+    async def inspect_file(
+        self,
+        path: Path,
+        image_url: str,
+        group: str,
+        size: int,
+        content_hash: str,
+    ) -> bool:
+        # 스트리밍으로 저장한 원본: 크기/해시는 받으면서 구한 값을 사용
+        return await self.inspect_content(
+            image_url=image_url,
+            group=group,
+            size=size,
+            content_hash=content_hash,
+            decode=functools.partial(self.decode_file, path),
+        )
+
+    async def inspect_content(
+        self,
+        image_url: str,
+        group: str,
+        size: int,
+        content_hash: str,
+        decode: Callable[[], DecodeResult],
+    ) -> bool:
+        if not await self.check_size(image_url, size, group):
+            return False
+
+        if content_hash in self.placeholder_hashes:
+            self.skipped.append((group, image_url, "플레이스홀더 해시"))
+            return False
+
+        if not await self.check_repeated(content_hash, image_url, group):
+            return False
+
+        # 디코딩/dHash 는 이벤트 루프를 막지 않도록 스레드에서 실행
+        decoded, dimensions, stddev, dhash = await asyncio.to_thread(
+            self.analyze, decode
+        )
+        if not decoded:
+            self.skipped.append((group, image_url, "디코딩 실패"))
+            return False
+        if dimensions is None:
+            # OpenCV가 지원하지 않는 형식(GIF 등)은 손상 여부만 확인
+            return True
+
+        width, height = dimensions
+        if min(width, height) < self.min_dimension:
+            self.skipped.append((group, image_url, f"해상도 부족 ({width}x{height})"))
+            return False
+
+        if stddev < self.min_stddev:
+            self.placeholder_hashes.add(content_hash)
+            self.skipped.append((group, image_url, "단색 이미지"))
+            return False
+
+        return await self.check_duplicate(dhash, image_url, group)
+
+    async def check_repeated(
+        self, content_hash: str, image_url: str, group: str
+    ) -> bool:
+        groups = self.hash_groups.setdefault(content_hash, set())
+        groups.add(group)
+        if len(groups) < self.repeat_threshold:
+            return True
+
+        self.repeated.append((group, image_url, len(groups)))
+        if not self.skip_repeated:
+            return True
+
+        self.placeholder_hashes.add(content_hash)
+        self.skipped.append((group, image_url, "여러 상품에 반복되는 이미지"))
+        return False
+
+    @classmethod
+    def decode_bytes(cls, body: bytes) -> DecodeResult:
+        # JPEG은 1/2 크기로 디코딩되어 검사 비용이 작음
+        image = cv2.imdecode(
+            np.frombuffer(body, dtype=np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_2
+        )
+        if image is not None:
+            height, width = image.shape[:2]
+            return True, (width * 2, height * 2), image
+
+        try:
+            Image.open(BytesIO(body)).verify()
+        except Exception:
+            return False, None, None
+        return True, None, None
+
+    @classmethod
+    def decode_file(cls, path: Path, max_side: int = 512) -> DecodeResult:
+        # 파일 전체를 메모리에 올리지 않고 축소 디코딩 (JPEG 은 draft 로 1/8 까지 줄여서 읽음)
+        try:
+            with Image.open(path) as image:
+                dimensions = image.size
+                image.draft("L", (max_side, max_side))
+                image.thumbnail((max_side, max_side))
+                return True, dimensions, np.asarray(image.convert("L"))
+        except Exception:
+            return False, None, None
+
+    @classmethod
+    def analyze(
+        cls, decode: Callable[[], DecodeResult]
+    ) -> Tuple[bool, Optional[Tuple[int, int]], float, int]:
+        decoded, dimensions, image = decode()
+        if image is None:
+            return decoded, None, 0.0, 0
+        return decoded, dimensions, float(image.std()), cls.calculate_dhash(image)
+
+    async def check_duplicate(self, dhash: int, image_url: str, group: str) -> bool:
+        if not group:
+            return True
+
+        seen = self.group_dhashes.setdefault(group, [])
+        for seen_dhash, seen_url in seen:
+            if bin(dhash ^ seen_dhash).count("1") <= self.duplicate_distance:
+                self.duplicates.append((group, image_url, seen_url))
+                return not self.skip_duplicates
+
+        seen.append((dhash, image_url))
+        return True
+
+    @classmethod
+    def calculate_dhash(cls, image: np.ndarray, hash_size: int = 8) -> int:
+        resized = cv2.resize(
+            image, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA
+        )
+        diff = resized[:, 1:] > resized[:, :-1]
+        return int("".join("1" if bit else "0" for bit in diff.flatten()), 2)
+
+    def summary(self) -> str:
+        # 화면에는 사유별 건수만, 항목별 내용은 details() 로 로그에 남김
+        reasons = Counter(reason.split(" (")[0] for _, _, reason in self.skipped)
+        lines = [
+            f"이미지 검사 결과: 제외 {len(self.skipped)}건, 중복 의심 {len(self.duplicates)}건, "
+            f"여러 상품에 반복 {len(self.repeated)}건"
+        ]
+        for reason, count in reasons.most_common():
+            lines.append(f"  [제외] {reason}: {count}건")
+        return "\n".join(lines)
+
+    def details(self) -> str:
+        lines = []
+        for group, image_url, reason in self.skipped:
+            lines.append(
+                f"[제외] 상품번호: '{group}', 사유: '{reason}', 링크: '{image_url}'"
+            )
+        for group, image_url, seen_url in self.duplicates:
+            lines.append(
+                f"[중복] 상품번호: '{group}', 링크: '{image_url}', 유사 이미지: '{seen_url}'"
+            )
+        for group, image_url, count in self.repeated:
+            lines.append(
+                f"[반복] 상품번호: '{group}', 링크: '{image_url}', 같은 이미지 상품 수: {count}"
+            )
+        return "\n".join(lines)
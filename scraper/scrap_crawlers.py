@@ -1,15 +1,37 @@
 import asyncio
 import re
+import time
 import urllib.parse
-from typing import List, Tuple, Dict, Callable
-
-from playwright.async_api import async_playwright, Page, Locator, Playwright, Browser
+from typing import List, Tuple, Dict, Callable, Union, Optional, Awaitable, Set
+
+from playwright.async_api import (
+    async_playwright,
+    Page,
+    Locator,
+    Playwright,
+    Browser,
+    BrowserContext,
+    Response,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from tqdm.asyncio import tqdm
 
+from scraper.caches import normalize_image_url, canonicalize_url, DetailCache
+from scraper.controls import CircuitBreaker, LatencyRecorder, RetryPolicy
+from scraper.snapshots import SnapshotArchive
+from scraper.stores import (
+    ScrapCheckpoint,
+    SeenUrlSet,
+    ResultSink,
+    JsonlSink,
+    ParquetSink,
+    StoreSink,
+)
 from scraper.utils import (
     convert_decimal,
-    download_images,
+    ImageDownloadQueue,
     create_xlsx_file,
+    create_xlsx_file_from_records,
     save_to_xlsx,
     setup_asyncio,
     get_logger,
@@ -18,12 +40,52 @@ from scraper.utils import (
     BASE_DIR,
     get_error_message,
     setup_datetime,
+    get_product_store,
+    CHECKPOINT_PATH,
+    RESULT_DIR,
+    SEEN_URL_DIR,
+    get_detail_cache,
+    SNAPSHOT_DIR,
+    get_rate_limiters,
+    get_adaptive_timeouts,
 )
 
 setup_asyncio()
 
+# 선택 필드는 기다리지 않고 현재 DOM 에서 바로 읽음 (Playwright is_visible 과 같은 기준의 첫 번째 요소)
+OPTIONAL_TEXT_SCRIPT = """
+(elements) => {
+    const element = elements.find((e) =>
+        e.checkVisibility
+            ? e.checkVisibility({ visibilityProperty: true })
+            : e.getClientRects().length > 0
+    );
+    return element ? element.innerText : null;
+}
+"""
+OPTIONAL_ATTRIBUTE_SCRIPT = """
+(elements, name) => elements.length ? elements[0].getAttribute(name) : null
+"""
+
 
 class ScrapUtil:
+    site_name: str = ""
+    # 목록 비교용 셀렉터 (item, link, name, price, sold_out), 없으면 목록 비교 안 함
+    listing_selectors: Optional[Dict[str, str]] = None
+    # 상품 링크에서 남길 쿼리 파라미터 (None 이면 추적 파라미터만 제거)
+    canonical_params: Optional[List[str]] = None
+    # 상세 정보 캐시 유효 시간 (초)
+    detail_cache_ttl: float = 60 * 60 * 6
+    # 상세 페이지 이동 정책: wait_until 까지 기다린 뒤 detail_ready_selector 가 나타나는 것만 기다림
+    # 선택 필드는 기다리지 않고 읽으므로 기본은 load, 상세 정보가 서버에서 그려지는 사이트만
+    # domcontentloaded 로 앞당김 (늦게 그려지는 블록이 있으면 빈 값으로 읽힘)
+    detail_wait_until: str = "load"
+    detail_ready_selector: Optional[str] = None
+    # 현재 상품을 추출하는 동안 다른 탭에서 미리 이동해 둘 다음 상품 수 (0 이면 사용 안 함)
+    prefetch_depth: int = 2
+    # 클릭 후 늦게 그려지는 선택 필드를 기다리는 최대 시간(ms), 넘으면 빈 값으로 처리
+    optional_wait_timeout: float = 1000
+
     def __init__(
         self,
         site_name: str = "",
@@ -33,8 +95,10 @@ class ScrapUtil:
         headless: bool = True,
         timeout: int = 15000,
         init_product_no: int = 1,
+        capture_images: bool = False,
+        use_detail_cache: bool = True,
     ):
-        self.site_name = site_name
+        self.site_name = site_name or self.site_name
         self.url = url
         self.root_category = root_category
         self.root_dirname = root_dirname
@@ -43,11 +107,60 @@ class ScrapUtil:
         self.timeout = timeout
         self.init_product_no = init_product_no
 
+        # 브라우저가 이미 받은 이미지 응답을 저장해 재다운로드 방지
+        self.capture_images = capture_images
+        self.image_responses: Dict[str, Response] = {}
+        self.captured_images: Dict[str, bytes] = {}
+
+        self.categories: Dict[str, str] = {}
+        self.listing_stats: Dict[str, int] = {}
+        self.checkpoint: Optional[ScrapCheckpoint] = None
+        self.product_categories: Dict[str, List[str]] = {}  # 정규화 링크 -> 카테고리
+
+        # 이전 실행에서 수집한 링크, new_only 이면 처음 보는 상품만 방문
+        self.seen_urls: Optional[SeenUrlSet] = None
+        self.new_only = False
+
+        # 상세 페이지 DOM 보관 (셀렉터 수정 후 오프라인 재추출용)
+        self.snapshot_archive: Optional[SnapshotArchive] = None
+
+        # 최근에 추출한 상세 정보 캐시 (재실행/셀렉터 수정 후 재시도 시 페이지 이동 생략)
+        self.detail_cache: Optional[DetailCache] = (
+            get_detail_cache() if use_detail_cache else None
+        )
+        self.sink = None  # emit(product_detail, image_url) 을 가진 객체 (ScrapMain)
+        # 이어받기: 결과 파일에 이미 기록된 상품번호 (다시 방문하지 않음)
+        self.completed_product_nos: Set[int] = set()
+        # 전체 결과 대신 상품 수와 최대 상품번호만 누적 (다음 사이트의 시작 번호)
+        self.product_count = 0
+        self.max_product_no: Optional[int] = None
+
+        # 사이트 개편으로 셀렉터가 깨지면 상품마다 timeout 을 기다리지 않도록 차단
+        self.circuit_breaker = CircuitBreaker(self.site_name)
+        # 일시적인 오류는 탭을 새로 열어 재시도하고, 끝까지 실패한 상품은 사이트 마지막에 한 번 더 시도
+        self.retry_policy = RetryPolicy()
+        self.failed_products: List[Tuple[str, str, int]] = (
+            []
+        )  # (카테고리, 링크, 상품번호)
+        # 고정 timeout 대신 최근 지연 시간으로 학습한 값 사용 (표본이 부족하면 timeout)
+        self.timeouts = get_adaptive_timeouts()
+        self.latency = LatencyRecorder(self.site_name, timeouts=self.timeouts)
+
         self.PRODUCT_URLS_DES = f"{self.site_name} 상품 페이지 링크 추출 중"
         self.PRODUCT_DETAILS_DES = f"{self.site_name} 상품 상세 정보 생성 중"
 
     async def setup_playwright(self, p: Playwright) -> Tuple[Browser, Page]:
-        browser = await p.chromium.launch(channel="chrome", headless=self.headless)
+        browser = await self.launch_browser(p, headless=self.headless)
+        page = await self.setup_page(browser)
+
+        return browser, page
+
+    @classmethod
+    async def launch_browser(cls, p: Playwright, headless: bool = True) -> Browser:
+        return await p.chromium.launch(channel="chrome", headless=headless)
+
+    async def setup_page(self, browser: Browser) -> Page:
+        # 사이트마다 컨텍스트를 따로 만들어 브라우저 하나를 여러 사이트가 공유할 수 있음
         context = await browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/91.0.4472.124 Safari/537.36",
@@ -59,6 +172,9 @@ class ScrapUtil:
             },
         )
 
+        return await self.new_page(context)
+
+    async def new_page(self, context: BrowserContext) -> Page:
         page = await context.new_page()
         await page.add_init_script(
             """
@@ -69,52 +185,752 @@ class ScrapUtil:
         )
         page.set_default_timeout(self.timeout)
 
-        return browser, page
+        if self.capture_images:
+            page.on("response", self.on_image_response)
+            page.on("framenavigated", self.on_frame_navigated)
+
+        return page
+
+    def on_image_response(self, response: Response) -> None:
+        if response.request.resource_type == "image" and response.ok:
+            self.image_responses[normalize_image_url(response.url)] = response
+
+    def on_frame_navigated(self, frame) -> None:
+        # 페이지 이동 시 이전 페이지의 응답은 버림 (미리 이동 중인 다른 탭의 응답은 유지)
+        if frame.parent_frame is None:
+            self.clear_image_responses(frame.page)
+
+    def clear_image_responses(self, page: Optional[Page] = None) -> None:
+        if page is None:
+            self.image_responses.clear()
+            return
+
+        for key, response in list(self.image_responses.items()):
+            if response.frame.page == page:
+                del self.image_responses[key]
 
-    async def create(self) -> Tuple[List[dict], List[str]]:
+    async def capture_product_images(
+        self,
+        image_urls: Union[str, List[str], None],
+        clear: bool = True,
+        page: Optional[Page] = None,
+    ) -> None:
+        if not self.capture_images or not image_urls:
+            return
+
+        if isinstance(image_urls, str):
+            image_urls = [image_urls]
+
+        for image_url in image_urls:
+            if not image_url or image_url in self.captured_images:
+                continue
+
+            key = normalize_image_url(urllib.parse.urljoin("https:", image_url))
+            response = self.image_responses.get(key)
+            if response is None:
+                continue
+
+            try:
+                self.captured_images[image_url] = await response.body()
+            except Exception:
+                # 응답 본문이 이미 해제된 경우 다운로드 단계에서 다시 받음
+                continue
+
+        if clear:
+            self.clear_image_responses(page)
+
+    async def create(self) -> None:
+        # 결과는 sink 로 바로 내보내고 목록은 만들지 않음
         async with async_playwright() as p:
             try:
                 browser, page = await self.setup_playwright(p)
-                await page.goto(self.url)
+                await self.goto(page, self.url)
 
-                product_urls = await self.get_product_urls(page=page)
-                product_details, product_image_urls = await self.get_product_details(
-                    page=page, product_urls=product_urls
+                product_urls = await self.get_frontier(page=page)
+                await self.get_product_details(
+                    page=page, product_urls=product_urls, collect=False
                 )
+                await self.report_detail_stats()
             finally:
                 await page.close()
                 await browser.close()
 
-        return product_details, product_image_urls
-
     async def update(
-        self, product_urls: List[Dict[str, str]]
+        self,
+        product_urls: List[Dict[str, str]],
+        browser: Optional[Browser] = None,
+        previous: Optional[Dict[str, Dict]] = None,
     ) -> Tuple[List[dict], List[str]]:
+        # 공유 브라우저가 주어지면 새 컨텍스트만 열고 닫음
+        if browser is not None:
+            page = await self.setup_page(browser)
+            try:
+                return await self.update_product_details(page, product_urls, previous)
+            finally:
+                await page.context.close()
+
         async with async_playwright() as p:
             try:
                 browser, page = await self.setup_playwright(p)
-                await page.goto(self.url)
-
-                result = await self.get_product_details(
-                    page=page, product_urls=product_urls
-                )
-
-                product_details, product_image_urls = (
-                    result if len(result) == 2 else (result[0], [])
-                )
+                return await self.update_product_details(page, product_urls, previous)
             finally:
                 await page.close()
                 await browser.close()
 
-        return product_details, product_image_urls
+    async def update_product_details(
+        self,
+        page: Page,
+        product_urls: List[Dict[str, str]],
+        previous: Optional[Dict[str, Dict]] = None,
+    ) -> Tuple[List[dict], List[str]]:
+        await self.goto(page, self.url)
+
+        # 목록에서 상품명/가격이 그대로인 상품은 상세 페이지 방문 생략
+        if previous and self.listing_selectors:
+            listing_items = await self.get_listing_items(page)
+            product_urls = await self.filter_changed_products(
+                product_urls, listing_items, previous
+            )
+
+        result = await self.get_product_details(page=page, product_urls=product_urls)
+        if self.detail_cache is not None:
+            print(f"'{self.site_name}' {self.detail_cache.summary()}")
+        await self.report_detail_stats()
+        return result
 
     async def get_product_urls(self, page: Page) -> List[Dict[str, str]]:
         return []
 
+    async def get_frontier(self, page: Page):
+        # 이어받기 중이면 이전에 수집한 링크 목록을 그대로 사용해 상품번호를 유지
+        if self.checkpoint is not None:
+            frontier = self.checkpoint.get_frontier(self.site_name)
+            if frontier is not None:
+                self.init_product_no = frontier["init_product_no"]
+                self.product_categories = frontier["categories"]
+                return frontier["frontier"]
+
+        product_urls = await self.get_product_urls(page=page)
+
+        # H & M 처럼 (링크 목록, 목록 이미지) 를 돌려주는 경우 같이 정리
+        if isinstance(product_urls, tuple):
+            product_urls, *extras = product_urls
+            kept = await self.select_product_urls(product_urls)
+            product_urls = (
+                [product_urls[i] for i in kept],
+                *([extra[i] for i in kept] for extra in extras),
+            )
+        else:
+            kept = await self.select_product_urls(product_urls)
+            product_urls = [product_urls[i] for i in kept]
+
+        if self.checkpoint is not None:
+            self.checkpoint.record_frontier(
+                self.site_name,
+                self.init_product_no,
+                product_urls,
+                self.product_categories,
+            )
+        return product_urls
+
+    def canonicalize_url(self, url: str) -> str:
+        return canonicalize_url(
+            url, base_url=self.url, keep_params=self.canonical_params
+        )
+
+    async def select_product_urls(
+        self, product_urls: List[Dict[str, str]]
+    ) -> List[int]:
+        kept = await self.dedupe_product_urls(product_urls)
+        if not self.new_only or self.seen_urls is None:
+            return kept
+
+        urls = [
+            self.canonicalize_url(url) for i in kept for url in product_urls[i].values()
+        ]
+        seen = self.seen_urls.contains(urls)
+        new = [i for i, is_seen in zip(kept, seen) if not is_seen]
+        print(
+            f"'{self.site_name}' 신상품만: 전체 {len(kept)}건 중 "
+            f"이전 수집 {len(kept) - len(new)}건 제외, 신규 {len(new)}건"
+        )
+        return new
+
+    async def dedupe_product_urls(
+        self, product_urls: List[Dict[str, str]]
+    ) -> List[int]:
+        # 여러 카테고리에 나온 상품은 처음 나온 위치만 방문하고 카테고리는 모두 기록
+        self.product_categories = {}
+        kept = []
+        for i, product_url in enumerate(product_urls):
+            for category, url in product_url.items():
+                categories = self.product_categories.setdefault(
+                    self.canonicalize_url(url), []
+                )
+                if not categories:
+                    kept.append(i)
+                if category not in categories:
+                    categories.append(category)
+
+        duplicates = len(product_urls) - len(kept)
+        if duplicates:
+            print(
+                f"'{self.site_name}' 중복 상품 링크 {duplicates}건 제외 "
+                f"(전체 {len(product_urls)}건)"
+            )
+        return kept
+
+    async def prepare_listing_page(self, page: Page) -> None:
+        await self.scroll_to_the_bottom(page=page, interval=1000, sleep=1)
+
+    async def get_listing_items(self, page: Page) -> List[Dict]:
+        # 목록 타일에서 링크/상품명/가격/품절 여부만 한 번에 추출
+        listing_items = []
+        async for category_key, category_value in tqdm(
+            iterable=self.categories.items(), desc=f"{self.site_name} 목록 비교 중"
+        ):
+            try:
+                await self.goto(page, f"{self.url}{category_value}")
+                await self.prepare_listing_page(page)
+
+                tiles = await page.locator(self.listing_selectors["item"]).evaluate_all(
+                    """
+                    (tiles, selectors) => tiles.map((tile) => {
+                        const find = (selector) => selector ? tile.querySelector(selector) : null;
+                        const text = (selector) => find(selector)?.innerText?.trim() || null;
+                        const link = selectors.link ? find(selectors.link) : tile;
+                        return {
+                            link: link?.getAttribute("href") || null,
+                            name: text(selectors.name),
+                            price: text(selectors.price),
+                            soldOut: !!find(selectors.sold_out),
+                        };
+                    })
+                    """,
+                    self.listing_selectors,
+                )
+            except Exception as e:
+                await self.setup_product_error_log(
+                    page=page,
+                    category=category_key,
+                    url=f"{self.url}{category_value}",
+                    product_no=0,
+                    message="목록 비교 중 에러 발생",
+                )
+                continue
+
+            for tile in tiles:
+                if not tile["link"]:
+                    continue
+
+                price = re.sub(r"[^0-9]", "", tile["price"] or "")
+                listing_items.append(
+                    {
+                        "카테고리": category_key,
+                        "링크": self.canonicalize_url(tile["link"]),
+                        "상품명": tile["name"],
+                        "판매가": int(price) if price else None,
+                        "품절": tile["soldOut"],
+                    }
+                )
+
+        return listing_items
+
+    async def filter_changed_products(
+        self,
+        product_urls: List[Dict[str, str]],
+        listing_items: List[Dict],
+        previous: Dict[str, Dict],
+        include_new: bool = False,
+    ) -> List[Dict[str, str]]:
+        listing = {item["링크"]: item for item in listing_items}
+
+        changed, ambiguous, skipped = [], [], []
+        for product_url in product_urls:
+            for category, url in product_url.items():
+                item = listing.get(self.canonicalize_url(url))
+                stored = previous.get(url)
+
+                # 목록에 없거나 값을 못 읽었으면 판단 불가 -> 상세 방문
+                if item is None or stored is None:
+                    ambiguous.append(product_url)
+                elif item["상품명"] is None or item["판매가"] is None:
+                    ambiguous.append(product_url)
+                elif (
+                    item["품절"]
+                    or item["상품명"] != str(stored.get("상품명") or "").strip()
+                    or item["판매가"] != stored.get("판매가")
+                ):
+                    changed.append(product_url)
+                else:
+                    skipped.append(product_url)
+
+        queued_links = {
+            self.canonicalize_url(url)
+            for product_url in product_urls
+            for url in product_url.values()
+        }
+        new = [
+            {item["카테고리"]: item["링크"]}
+            for item in listing_items
+            if item["링크"] not in queued_links
+        ]
+
+        total = len(product_urls)
+        self.listing_stats = {
+            "전체": total,
+            "생략": len(skipped),
+            "변경": len(changed),
+            "신규": len(new),
+            "불확실": len(ambiguous),
+        }
+        skip_ratio = len(skipped) / total * 100 if total else 0
+        print(
+            f"'{self.site_name}' 목록 비교: 전체 {total}건 중 {len(skipped)}건 생략 "
+            f"({skip_ratio:.1f}%), 변경 {len(changed)}건, 신규 {len(new)}건, "
+            f"불확실 {len(ambiguous)}건"
+        )
+
+        # 신규 상품은 기존 행이 없어 업데이트에 반영되지 않으므로 기본은 집계만 함
+        return changed + ambiguous + (new if include_new else [])
+
     async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[str]]:
-        return [], []
+        self, page: Page, product_urls: List[Dict[str, str]], collect: bool = True
+    ) -> Tuple[Optional[List[dict]], Optional[List[Union[str, List[str], None]]]]:
+        # collect 가 아니면 sink 로만 내보내고 결과 목록은 None
+        completed = {
+            i
+            for i in range(len(product_urls))
+            if self.init_product_no + i in self.completed_product_nos
+        }
+
+        items = [
+            (i, category, url)
+            for i, product_url in enumerate(product_urls)
+            for category, url in product_url.items()
+        ]
+
+        # 결과 파일/캐시로 채울 수 없는 상품만 방문하므로 미리 골라서 탭 순환에 넘김
+        cached = {}
+        for i, category, url in items:
+            if i in completed:
+                continue
+            result = await self.lookup_cached_detail(
+                category=category, url=url, product_no=self.init_product_no + i
+            )
+            if result is not None:
+                cached[i] = result
+        visits = [
+            (i, url) for i, _, url in items if i not in completed and i not in cached
+        ]
+        visit_index = {i: n for n, (i, _) in enumerate(visits)}
+        page_ring = DetailPageRing(
+            self, page, [url for _, url in visits], depth=self.prefetch_depth
+        )
+
+        product_details = [] if collect else None
+        product_image_urls = [] if collect else None
+        self.retry_policy.start(len(visits))
+        self.failed_products = []
+        try:
+            await page_ring.open()
+            async for i, category, url in tqdm(
+                iterable=items,
+                total=len(items),
+                desc=self.PRODUCT_DETAILS_DES,
+            ):
+                product_no = self.init_product_no + i
+
+                # 이전 실행에서 결과 파일에 기록된 상품은 개수만 이어받음
+                if i in completed:
+                    await self.count_product(product_no)
+                    continue
+
+                if self.circuit_breaker.is_open:
+                    self.circuit_breaker.record_skip()
+                    continue
+
+                if i in cached:
+                    result = cached[i]
+                else:
+                    detail_page, navigation = await page_ring.get(visit_index[i])
+                    result = await self.fetch_with_retry(
+                        page_ring=page_ring,
+                        page=detail_page,
+                        category=category,
+                        url=url,
+                        product_no=product_no,
+                        navigation=navigation,
+                    )
+                if result is None:
+                    continue
+
+                await self.collect_product_detail(
+                    category, url, result, product_details, product_image_urls
+                )
+
+            await self.retry_failed_products(page, product_details, product_image_urls)
+        finally:
+            await page_ring.close()
+            self.timeouts.save()
+
+        return product_details, product_image_urls
+
+    async def collect_product_detail(
+        self,
+        category: str,
+        url: str,
+        result: Tuple[dict, Union[str, List[str], None]],
+        product_details: Optional[List[dict]],
+        product_image_urls: Optional[List[Union[str, List[str], None]]],
+    ) -> None:
+        product_detail_dict, image_url = result
+        categories = self.product_categories.get(self.canonicalize_url(url), [])
+        product_detail_dict["추가카테고리"] = ", ".join(
+            c for c in categories if c != category
+        )
+        if product_details is not None:
+            product_details.append(product_detail_dict)
+            product_image_urls.append(image_url)
+        await self.count_product(product_detail_dict["상품번호"])
+
+        if self.seen_urls is not None:
+            self.seen_urls.add(self.canonicalize_url(url))
+        if self.sink is not None:
+            await self.sink.emit(product_detail_dict, image_url)
+
+    async def count_product(self, product_no: int) -> None:
+        # 마지막에 재시도한 상품은 번호가 앞설 수 있으므로 최댓값을 따로 유지
+        self.product_count += 1
+        if self.max_product_no is None or product_no > self.max_product_no:
+            self.max_product_no = product_no
+
+    async def fetch_with_retry(
+        self,
+        page_ring: "DetailPageRing",
+        page: Page,
+        category: str,
+        url: str,
+        product_no: int,
+        navigation: Optional[Awaitable[float]] = None,
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        attempt = 1
+        while True:
+            # 셀렉터가 깨진 상태(성능 저하)에서는 재시도해도 같으므로 바로 기록
+            retry = (
+                self.retry_policy.can_retry(attempt)
+                and not self.circuit_breaker.is_degraded
+            )
+            try:
+                result = await self.fetch_product_detail(
+                    page=page,
+                    category=category,
+                    url=url,
+                    product_no=product_no,
+                    navigation=navigation,
+                    raise_errors=retry,
+                )
+            except Exception as e:
+                self.retry_policy.consume()
+                delay = self.retry_policy.delay(attempt)
+                message = f"'{self.site_name}' 상품번호: '{product_no}' {attempt}번째 시도 실패, {delay:.1f}초 후 새 탭에서 재시도 ({type(e).__name__}), 링크: '{url}'"
+                logger = await get_logger()
+                logger.warning(message)
+
+                # 모달 등으로 망가진 탭을 계속 쓰지 않도록 새 탭으로 교체
+                page = await page_ring.replace(page)
+                navigation = None
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if attempt > 1 and result is not None:
+                self.retry_policy.recovered += 1
+            return result
+
+    async def retry_failed_products(
+        self,
+        page: Page,
+        product_details: Optional[List[dict]],
+        product_image_urls: Optional[List[Union[str, List[str], None]]],
+    ) -> None:
+        failed_products, self.failed_products = self.failed_products, []
+        if not failed_products or self.circuit_breaker.is_open:
+            return
+
+        print(f"'{self.site_name}' 실패한 상품 {len(failed_products)}건 재시도")
+
+        # 쿠키/세션 상태까지 새로 시작하도록 새 컨텍스트 사용
+        retry_page = await self.setup_page(page.context.browser)
+        try:
+            for category, url, product_no in failed_products:
+                if self.circuit_breaker.is_open or not self.retry_policy.consume():
+                    break
+
+                result = await self.fetch_product_detail(
+                    page=retry_page, category=category, url=url, product_no=product_no
+                )
+                if result is None:
+                    continue
+
+                self.retry_policy.recovered += 1
+                await self.collect_product_detail(
+                    category,
+                    url,
+                    result,
+                    product_details,
+                    product_image_urls,
+                )
+        finally:
+            await retry_page.context.close()
+
+    async def lookup_cached_detail(
+        self, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        # 최근에 추출한 상품이면 페이지 이동 없이 캐시 사용
+        if self.detail_cache is None:
+            return None
+
+        cached = await self.detail_cache.lookup(
+            self.site_name, self.canonicalize_url(url), ttl=self.detail_cache_ttl
+        )
+        if cached is None:
+            return None
+
+        product_detail_dict, image_url, cached_category = cached
+        product_detail_dict["상품번호"] = product_no
+        if product_detail_dict.get("카테고리") == cached_category:
+            product_detail_dict["카테고리"] = category
+        return product_detail_dict, image_url
+
+    async def fetch_product_detail(
+        self,
+        page: Page,
+        category: str,
+        url: str,
+        product_no: int,
+        navigation: Optional[Awaitable[float]] = None,
+        raise_errors: bool = False,
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        # navigation 이 있으면 미리 시작한 이동이 끝나기를 기다림 (반환값은 이동 시작 시각)
+        # raise_errors 이면 예외를 기록하지 않고 호출한 쪽(재시도)에 넘김
+        try:
+            if navigation is not None:
+                start = await navigation
+            else:
+                start = time.perf_counter()
+                await self.navigate_to_detail(page, url)
+            result = await self.get_product_detail(
+                page=page, category=category, url=url, product_no=product_no
+            )
+        except Exception as e:
+            if raise_errors:
+                raise
+
+            await self.archive_snapshot(page, category, url, product_no, ok=False)
+            await self.setup_product_error_log(
+                page=page,
+                category=category,
+                url=url,
+                product_no=product_no,
+                message="상품 상세 페이지 에러 발생",
+                # 성능 저하 상태에서는 실패마다 스크린샷을 찍지 않음
+                availability_screenshot=not self.circuit_breaker.is_degraded,
+            )
+            await self.on_product_failure(page, e)
+            self.failed_products.append((category, url, product_no))
+            return None
+
+        if result is not None:
+            self.circuit_breaker.record_success()
+            self.latency.record("extract", (time.perf_counter() - start) * 1000)
+        await self.archive_snapshot(
+            page, category, url, product_no, ok=result is not None
+        )
+        if result is not None and self.detail_cache is not None:
+            await self.detail_cache.store(
+                self.site_name, self.canonicalize_url(url), category, *result
+            )
+        return result
+
+    async def goto(
+        self, page: Page, url: str, wait_until: Optional[str] = None
+    ) -> Optional[Response]:
+        # 도메인별 속도 제한을 거쳐 이동하고 응답 코드로 속도를 조절함
+        async with get_rate_limiters().get(url).request() as ticket:
+            response = await page.goto(url, wait_until=wait_until)
+            if response is not None:
+                ticket.status = response.status
+        return response
+
+    def get_timeout(self, operation: str) -> float:
+        timeout = self.timeouts.get(self.site_name, operation, default=self.timeout)
+        if self.circuit_breaker.is_degraded:
+            timeout = min(timeout, self.circuit_breaker.degraded_timeout)
+        return timeout
+
+    async def navigate_to_detail(self, page: Page, url: str) -> None:
+        limiter = get_rate_limiters().get(url)
+        async with limiter.request() as ticket:
+            with self.latency.measure("goto"):
+                response = await page.goto(
+                    url,
+                    wait_until=self.detail_wait_until,
+                    timeout=self.get_timeout("goto"),
+                )
+            if response is not None:
+                ticket.status = response.status
+
+        # 학습된 값은 측정한 준비 요소 대기에만 사용 (추출 중 대기는 페이지 기본값 유지)
+        if self.detail_ready_selector:
+            with self.latency.measure("selector"):
+                await page.locator(self.detail_ready_selector).first.wait_for(
+                    timeout=self.get_timeout("selector")
+                )
+
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        # 사이트별 상세 페이지 파싱, None 이면 해당 상품은 건너뜀
+        return None
+
+    # 필수 필드: 요소가 나타날 때까지 timeout 만큼 기다리고 없으면 예외 발생
+    # (timeout 이 없으면 페이지 기본값 사용)
+    @classmethod
+    async def read_text(
+        cls,
+        target: Union[Page, Locator],
+        selector: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        locator = target.locator(selector) if selector else target
+        return await locator.first.inner_text(timeout=timeout)
+
+    @classmethod
+    async def read_attribute(
+        cls,
+        target: Union[Page, Locator],
+        selector: Optional[str],
+        name: str,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        locator = target.locator(selector) if selector else target
+        return await locator.first.get_attribute(name, timeout=timeout)
+
+    # 상품 이미지는 필수 필드: 학습된 timeout 만큼 기다리고 비어 있으면 상품 실패로 처리
+    # (names 순서대로 읽어서 처음 값이 있는 속성 사용)
+    async def read_image_url(
+        self, page: Page, selector: str, names: Tuple[str, ...] = ("src",)
+    ) -> str:
+        timeout = self.get_timeout("selector")
+        for name in names:
+            image_url = await self.read_attribute(page, selector, name, timeout=timeout)
+            if image_url:
+                return image_url
+
+        raise ValueError(f"상품 이미지 소스 없음: '{selector}' ({', '.join(names)})")
+
+    # 선택 필드: 기다리지 않고 현재 DOM 에서 바로 읽음, 없으면 default
+    # 필수 필드를 먼저 읽어서 페이지가 그려진 뒤에 사용해야 함
+    @classmethod
+    async def read_optional_text(
+        cls,
+        target: Union[Page, Locator],
+        selector: Optional[str] = None,
+        default: str = "",
+    ) -> str:
+        locator = target.locator(selector) if selector else target
+        text = await locator.evaluate_all(OPTIONAL_TEXT_SCRIPT)
+        return default if text is None else text
+
+    @classmethod
+    async def read_optional_attribute(
+        cls,
+        target: Union[Page, Locator],
+        selector: Optional[str],
+        name: str,
+        default: str = "",
+    ) -> str:
+        locator = target.locator(selector) if selector else target
+        value = await locator.evaluate_all(OPTIONAL_ATTRIBUTE_SCRIPT, name)
+        return default if value is None else value
+
+    @classmethod
+    async def has_element(
+        cls, target: Union[Page, Locator], selector: Optional[str] = None
+    ) -> bool:
+        locator = target.locator(selector) if selector else target
+        return await locator.evaluate_all(OPTIONAL_TEXT_SCRIPT) is not None
+
+    # 선택 필드지만 클릭/펼침 뒤에 그려지는 요소: optional_wait_timeout 까지만 기다림
+    async def wait_optional(
+        self, target: Union[Page, Locator], selector: Optional[str] = None
+    ) -> bool:
+        locator = target.locator(selector) if selector else target
+        try:
+            await locator.first.wait_for(
+                state="attached", timeout=self.optional_wait_timeout
+            )
+        except PlaywrightTimeoutError:
+            return False
+        return True
+
+    async def on_product_failure(self, page: Page, error: Exception) -> None:
+        previous_state = self.circuit_breaker.state
+        state = self.circuit_breaker.record_failure(error)
+        if state == previous_state:
+            return
+
+        if self.circuit_breaker.is_degraded:
+            # 없는 셀렉터를 기다리는 시간을 줄여서 계속 진행 (미리 이동 중인 탭 포함)
+            for context_page in page.context.pages:
+                context_page.set_default_timeout(
+                    min(self.timeout, self.circuit_breaker.degraded_timeout)
+                )
+
+        message = f"'{self.site_name}' 상세 페이지 실패가 반복되어 '{state}' 상태로 전환 ({self.circuit_breaker.trip_reason})"
+        logger = await get_logger()
+        logger.warning(message)
+
+    async def report_detail_stats(self) -> None:
+        if self.latency.histograms:
+            print(self.latency.summary())
+        if timeout_summary := self.timeouts.summary(self.site_name):
+            print(timeout_summary)
+        print(get_rate_limiters().get(self.url).summary())
+
+        if self.retry_policy.retries:
+            print(self.retry_policy.summary(self.site_name))
+
+        breaker = self.circuit_breaker
+        if not (breaker.failures or breaker.skipped):
+            return
+
+        message = breaker.summary()
+        if breaker.trip_reason:
+            logger = await get_logger()
+            logger.warning(message)
+        print(message)
+
+    async def archive_snapshot(
+        self, page: Page, category: str, url: str, product_no: int, ok: bool
+    ) -> None:
+        if self.snapshot_archive is None:
+            return
+
+        try:
+            await self.snapshot_archive.save(
+                site=self.site_name,
+                url=url,
+                category=category,
+                product_no=product_no,
+                html=await page.content(),
+                ok=ok,
+            )
+        except Exception:
+            message = f"'{self.site_name}' 스냅샷 저장 중 예외 발생: '{url}'\n{await get_error_message()}"
+            logger = await get_logger()
+            logger.error(message)
 
     async def setup_screenshot(self, page: Page, category: str) -> None:
         try:
@@ -193,13 +1009,13 @@ class ScrapUtil:
     async def price_position_conversion(
         cls, origin_price_elem: Locator, sale_price_elem: Locator
     ) -> Tuple[int, int]:
-        if await sale_price_elem.is_visible():
-            origin_price = await convert_decimal(await sale_price_elem.inner_text())
-            sale_price = await convert_decimal(await origin_price_elem.inner_text())
-        else:
-            origin_price = await convert_decimal(await origin_price_elem.inner_text())
-            sale_price = await convert_decimal(await origin_price_elem.inner_text())
-        return origin_price, sale_price
+        price = await convert_decimal(await cls.read_text(origin_price_elem))
+
+        # 할인 전 가격(del)이 있으면 정가/판매가 위치가 바뀜
+        del_price = await cls.read_optional_text(sale_price_elem, default=None)
+        if del_price is not None:
+            return await convert_decimal(del_price), price
+        return price, price
 
     @classmethod
     async def click_on_cookie_button(
@@ -227,51 +1043,231 @@ class ScrapUtil:
                 break
 
 
+# 상세 페이지 탭 순환
+# 탭 depth + 1 개를 돌려 쓰면서 n 번째 상품을 추출하는 동안 n + 1 ~ n + depth 번째 상품은 다른 탭에서 이동 중임.
+# n + depth 번째 상품은 방금 추출이 끝난 n - 1 번째 상품의 탭에서 이동을 시작함.
+class DetailPageRing:
+    def __init__(self, scraper: ScrapUtil, page: Page, urls: List[str], depth: int):
+        self.scraper = scraper
+        self.urls = urls
+        self.depth = max(0, min(depth, len(urls) - 1))
+        self.origin = page  # 호출한 쪽에서 닫는 탭
+        self.pages = [page]
+        self.navigations: Dict[int, asyncio.Task] = {}
+
+    async def open(self) -> None:
+        for _ in range(self.depth):
+            self.pages.append(await self.scraper.new_page(self.pages[0].context))
+
+        for n in range(self.depth):
+            self.schedule(n)
+
+    async def navigate(self, page: Page, url: str) -> float:
+        start = time.perf_counter()
+        await self.scraper.navigate_to_detail(page, url)
+        return start
+
+    def schedule(self, n: int) -> None:
+        if n < len(self.urls) and n not in self.navigations:
+            page = self.pages[n % len(self.pages)]
+            self.navigations[n] = asyncio.create_task(self.navigate(page, self.urls[n]))
+
+    async def get(self, n: int) -> Tuple[Page, asyncio.Task]:
+        self.schedule(n)
+        self.schedule(n + self.depth)
+        return self.pages[n % len(self.pages)], self.navigations.pop(n)
+
+    async def replace(self, page: Page) -> Page:
+        # 실패한 탭을 같은 컨텍스트의 새 탭으로 교체 (해당 탭에 예약된 이동은 없음)
+        index = self.pages.index(page)
+        new_page = await self.scraper.new_page(page.context)
+        self.pages[index] = new_page
+        if page is not self.origin:
+            await page.close()
+        return new_page
+
+    async def close(self) -> None:
+        # 중단된 경우 이동 중인 탭 정리
+        for navigation in self.navigations.values():
+            navigation.cancel()
+        await asyncio.gather(*self.navigations.values(), return_exceptions=True)
+        self.navigations.clear()
+
+        for page in self.pages:
+            if page is not self.origin:
+                await page.close()
+        self.pages = [self.origin]
+
+
 class ScrapMain:
     def __init__(
         self,
         scrap_instances: List[Callable],
         init_product_no: int = 1,
+        capture_images: bool = False,
+        use_store: bool = True,
+        resume: bool = False,
+        result_format: str = "jsonl",
+        new_only: bool = False,
+        use_detail_cache: bool = True,
+        archive_snapshots: bool = False,
     ):
         self.scrap_instances = scrap_instances
         self.init_product_no = init_product_no
+        self.capture_images = capture_images
+        self.new_only = new_only
+        self.use_detail_cache = use_detail_cache
+        self.snapshot_archive = (
+            SnapshotArchive(SNAPSHOT_DIR) if archive_snapshots else None
+        )
 
-        self.total_product_details = []
-        self.total_product_image_urls = []
+        # 결과는 저장소에도 누적함
+        self.store = get_product_store() if use_store else None
 
-    async def main(self) -> None:
-        await self.scrap_selector()
+        # 같은 사이트 목록/시작 번호로 중지된 작업이 있으면 이어서 진행
+        self.checkpoint = ScrapCheckpoint(
+            path=CHECKPOINT_PATH,
+            config={
+                "sites": [scraper.site_name for scraper in scrap_instances],
+                "init_product_no": init_product_no,
+                "new_only": new_only,
+            },
+            run_id=setup_datetime("%Y-%m-%d_%H_%M_%S"),
+            resume=resume,
+        )
+        self.run_id = self.checkpoint.run_id
+        if self.checkpoint.resumed:
+            print(f"이전 작업 이어받기: '{self.run_id}'")
+
+        # 상품은 나오는 대로 결과 파일(과 저장소)에 기록하고, 이미지 링크만 모아 둠
+        # 이어받으면 같은 run_id 의 결과 파일에 이어서 기록
+        self.result_path = RESULT_DIR / f"{self.run_id}.{result_format}"
+        if result_format == "parquet" and ParquetSink.is_available():
+            self.result_sink = ParquetSink(
+                self.result_path, resume=self.checkpoint.resumed
+            )
+        else:
+            self.result_path = self.result_path.with_suffix(".jsonl")
+            self.result_sink = JsonlSink(
+                self.result_path, resume=self.checkpoint.resumed
+            )
+        self.sinks: List[ResultSink] = [self.result_sink]
+        if self.store is not None:
+            self.sinks.append(StoreSink(self.store, self.run_id))
+
+        self.total_product_count = 0
+        self.total_captured_images: Dict[str, bytes] = {}
+        # 이어받기: 사이트 -> 결과 파일에 이미 기록된 상품번호
+        self.completed_products: Dict[str, Set[int]] = {}
+
+        # 상품이 나오는 대로 이미지를 받아서 스크랩이 끝날 때쯤 대부분 저장되어 있도록 함
+        self.image_queue = ImageDownloadQueue(
+            captured_images=self.total_captured_images
+        )
 
-        excel_file = await create_xlsx_file(
-            data=self.total_product_details,
+    async def emit(
+        self, product_detail: Dict, image_url: Union[str, List[str], None] = None
+    ) -> None:
+        for sink in self.sinks:
+            await sink.emit(product_detail)
+        await self.image_queue.put(product_detail["상품번호"], image_url)
+
+    async def restore_previous_results(self) -> None:
+        # 이전 실행이 결과 파일에 남긴 상품은 번호만 기억하고 이미지는 이번 폴더에 다시 받음
+        restored = 0
+        for record in self.result_sink.iter_previous_records():
+            product_no = int(record["상품번호"])
+            self.completed_products.setdefault(record["사이트"], set()).add(product_no)
+
+            image_urls = [
+                url.strip()
+                for url in str(record.get("이미지소스") or "").split(";\n")
+                if url.strip()
+            ]
+            await self.image_queue.put(
+                product_no, image_urls if len(image_urls) > 1 else "".join(image_urls)
+            )
+            restored += 1
+
+        if restored:
+            print(
+                f"결과 파일에서 이전 상품 {restored}건 이어받기: '{self.result_path}'"
+            )
+
+    async def main(self) -> None:
+        await self.image_queue.start()
+        try:
+            await self.restore_previous_results()
+            await self.scrap_selector()
+        except BaseException:
+            await self.image_queue.close()
+            raise
+        finally:
+            # 작업 중지(취소)나 브라우저 오류로 끝나도 쌓인 기록은 남김
+            self.checkpoint.close()
+            for sink in self.sinks:
+                await sink.close()
+
+        excel_file = await create_xlsx_file_from_records(
+            records=self.result_sink.iter_records,
         )
 
-        tasks = [
+        await asyncio.gather(
             save_to_xlsx(
                 xlsx_file=excel_file,
             ),
-            download_images(
-                image_urls=self.total_product_image_urls,
-                start_no=(
-                    self.total_product_details[0]["상품번호"]
-                    if self.total_product_details
-                    else self.init_product_no
-                ),
-            ),
-        ]
-        await asyncio.gather(*tasks)
+            self.image_queue.join(),
+        )
+
+        if self.use_detail_cache:
+            print(get_detail_cache().summary())
+        if self.snapshot_archive is not None:
+            print(self.snapshot_archive.summary())
+        print(get_rate_limiters().summary())
+
+        self.checkpoint.remove()
 
     async def scrap_selector(self) -> None:
         async def insert_scraped_data(scraper: Callable):
-            product_details, product_image_urls = await scraper(
-                init_product_no=self.init_product_no
-            ).create()
+            finished = self.checkpoint.get_finished(scraper.site_name)
+            if finished is not None:
+                # 상품은 이미 결과 파일에 있으므로 개수와 다음 시작 번호만 이어받음
+                product_count = finished["product_count"]
+                max_product_no = finished["max_product_no"]
+                print(f"'{scraper.site_name}' 완료된 결과 사용: {product_count}건")
+            else:
+                instance = scraper(
+                    init_product_no=self.init_product_no,
+                    capture_images=self.capture_images,
+                    use_detail_cache=self.use_detail_cache,
+                )
+                instance.checkpoint = self.checkpoint
+                instance.completed_product_nos = self.completed_products.get(
+                    scraper.site_name, set()
+                )
+                instance.sink = self
+                instance.seen_urls = SeenUrlSet.for_site(
+                    SEEN_URL_DIR, scraper.site_name
+                )
+                instance.new_only = self.new_only
+                instance.snapshot_archive = self.snapshot_archive
+                # 브라우저가 받은 이미지를 다운로드 큐와 바로 공유
+                instance.captured_images = self.total_captured_images
+                try:
+                    await instance.create()
+                finally:
+                    # 중지되어도 수집한 상품까지는 기록
+                    instance.seen_urls.save()
+                product_count = instance.product_count
+                max_product_no = instance.max_product_no
+                self.checkpoint.record_finished(
+                    instance.site_name, product_count, max_product_no
+                )
 
-            self.total_product_details.extend(product_details)
-            self.total_product_image_urls.extend(product_image_urls)
+            self.total_product_count += product_count
 
-            if product_details:
-                self.init_product_no = product_details[-1]["상품번호"] + 1
+            if max_product_no is not None:
+                self.init_product_no = max_product_no + 1
 
         for instance in self.scrap_instances:
             await insert_scraped_data(instance)
@@ -280,13 +1276,18 @@ class ScrapMain:
 
 
 class ScrapValentino(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "발렌티노"
+    prefetch_depth = 1  # 봇 차단이 엄격해 동시 이동은 하나까지만
+    detail_ready_selector = "section.productInfo > article > h1"
+    canonical_params = []
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="발렌티노",
             url="https://www.valentino.com",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
         self.categories = {
             "숄더백": "/ko-kr/women/bags?macroCategory=2138879",
@@ -305,7 +1306,7 @@ class ScrapValentino(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
 
             await self.click_on_load_more_button(page=page, sleep=2)
 
@@ -320,120 +1321,87 @@ class ScrapValentino(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(self, page, product_urls: List[Dict[str, str]]):
-
-        product_details = []
-        product_image_urls = []
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = await page.locator(
+            "#container-76ee4dd134 > div.breadcrumb > div > section > ul > li.item.item__lv0 > a"
+        ).inner_text()
+        name = await page.locator(
+            "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
+            "section.productInfo > article > h1"
+        ).inner_text()
+
+        model = await self.read_optional_text(
+            page,
+            "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
+            "section.accordion__section.accordion__wrapperContainer.productDescription.border-top-none > "
+            "div.content-tabs > div:nth-child(1) > p.productDescription__code",
+        )
+        model = await convert_model(model)
 
-        async for i, product_url in tqdm(
-            enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
+        if await self.has_element(
+            page,
+            "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
+            "section.productInfo > p > p.productInfo_price--markdown",
         ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-                    await page.wait_for_load_state()
-
-                    brand = await page.locator(
-                        "#container-76ee4dd134 > div.breadcrumb > div > section > ul > li.item.item__lv0 > a"
-                    ).inner_text()
-                    name = await page.locator(
-                        "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
-                        "section.productInfo > article > h1"
-                    ).inner_text()
-
-                    model = await page.locator(
-                        "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
-                        "section.accordion__section.accordion__wrapperContainer.productDescription.border-top-none > "
-                        "div.content-tabs > div:nth-child(1) > p.productDescription__code"
-                    ).inner_text()
-                    model = await convert_model(model)
-
-                    origin_price_elem = page.locator(
-                        "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
-                        "section.productInfo > p > p.productInfo_price--markdown"
-                    )
-                    if await origin_price_elem.is_visible():
-                        origin_price_element_index = 1
-                        sale_price_element_index = 3
-                    else:
-                        origin_price_element_index = 1
-                        sale_price_element_index = 1
-
-                    origin_price = await page.locator(
-                        f"#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
-                        f"section.productInfo > p > p:nth-child({origin_price_element_index})"
-                    ).inner_text()
-                    sale_price = await page.locator(
-                        f"#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
-                        f"section.productInfo > p > p:nth-child({sale_price_element_index})"
-                    ).inner_text()
-
-                    origin_price, sale_price = await asyncio.gather(
-                        convert_decimal(origin_price),
-                        convert_decimal(sale_price),
-                    )
-
-                    option_1 = await page.locator(
-                        "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__right-container "
-                        "> section.pdpColorSelection > div.pdpColorSelection__header > h2 > span"
-                    ).first.inner_text()
-                    option_2 = await page.locator(
-                        "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__right-container "
-                        "> div.product_size_reactWrap.productSizeSelection.productSizeSelection--oneSize > ul > li > "
-                        "label > p"
-                    ).first.inner_text()
-
-                    image_url_elem = page.locator(
-                        "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__middle-container "
-                        "> section.pdpSwiperProduct > div:not(.hidePDPSwiperProduct) > div.swiper-wrapper > "
-                        "div.swiper-slide.swiper-slide-active > img"
-                    )
-
-                    if not await image_url_elem.get_attribute("src"):
-                        image_url_elem = await image_url_elem.get_attribute(
-                            "data-imgzoomed"
-                        )
-                    else:
-                        image_url_elem = await image_url_elem.get_attribute("src")
-
-                    if not image_url_elem:
-                        await self.setup_product_error_log(
-                            page=page,
-                            url=url,
-                            product_no=self.init_product_no + i,
-                            message="상품 상세 페이지 이미지 로드 실패",
-                        )
+            origin_price_element_index = 1
+            sale_price_element_index = 3
+        else:
+            origin_price_element_index = 1
+            sale_price_element_index = 1
+
+        origin_price = await page.locator(
+            f"#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
+            f"section.productInfo > p > p:nth-child({origin_price_element_index})"
+        ).inner_text()
+        sale_price = await page.locator(
+            f"#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__left-container > "
+            f"section.productInfo > p > p:nth-child({sale_price_element_index})"
+        ).inner_text()
+
+        origin_price, sale_price = await asyncio.gather(
+            convert_decimal(origin_price),
+            convert_decimal(sale_price),
+        )
 
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": model.strip() if model else "",
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip(),
-                        "링크": url.strip(),
-                        "이미지소스": image_url_elem.strip(),
-                    }
+        option_1 = await self.read_optional_text(
+            page,
+            "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__right-container "
+            "> section.pdpColorSelection > div.pdpColorSelection__header > h2 > span",
+        )
+        option_2 = await self.read_optional_text(
+            page,
+            "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__right-container "
+            "> div.product_size_reactWrap.productSizeSelection.productSizeSelection--oneSize > ul > li > "
+            "label > p",
+        )
 
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url_elem)
+        image_url_selector = (
+            "#container-76ee4dd134 > div.product > div > div.pdp-template__main-product__middle-container "
+            "> section.pdpSwiperProduct > div:not(.hidePDPSwiperProduct) > div.swiper-wrapper > "
+            "div.swiper-slide.swiper-slide-active > img"
+        )
+        image_url_elem = await self.read_image_url(
+            page, image_url_selector, names=("src", "data-imgzoomed")
+        )
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=category,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": model.strip() if model else "",
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip(),
+            "링크": url.strip(),
+            "이미지소스": image_url_elem.strip(),
+        }
 
-        return product_details, product_image_urls
+        return product_detail_dict, image_url_elem
 
     @classmethod
     async def click_on_load_more_button(
@@ -453,13 +1421,18 @@ class ScrapValentino(ScrapUtil):
 
 
 class ScrapDior(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "디올"
+    prefetch_depth = 1  # 봇 차단이 엄격해 동시 이동은 하나까지만
+    detail_ready_selector = "div.ProductDetailsHead_row-title__pZsRP > h1"
+    canonical_params = []
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="디올",
             url="https://www.dior.com",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
 
         self.categories = {
@@ -477,7 +1450,7 @@ class ScrapDior(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
             await self.scroll_to_the_bottom(page, interval=1000, sleep=1)
 
             await page.wait_for_load_state()
@@ -492,106 +1465,90 @@ class ScrapDior(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(self, page, product_urls: List[Dict[str, str]]):
-
-        product_details = []
-        product_image_urls = []
-        async for i, product_url in tqdm(
-            enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = "dior"
-
-                    name = await page.locator(
-                        "#main > div.ProductContent_container__i3zzp > div.ProductDetailsPanel_container__1QuVB > "
-                        "div"
-                        "> div > div.ProductDetailsPanel_content__MvVVv > div:nth-child(1) > "
-                        "div.ProductDetailsHead_row-title__pZsRP > h1"
-                    ).inner_text()
-
-                    model = await page.locator(
-                        "#main > div.ProductContent_container__i3zzp > div.ProductDetailsPanel_container__1QuVB > "
-                        "div"
-                        "> div > div.ProductDetailsPanel_content__MvVVv "
-                        "div.ProductDetailsHead_row-subtitle__PeOd4 > span"
-                    ).inner_text()
-                    model = await convert_model(model)
-
-                    origin_price_elem = page.locator(
-                        "#main > div.ProductContent_container__i3zzp > "
-                        "div.ProductDetailsPanel_container__1QuVB > div > div > "
-                        "div.ProductDetailsPanel_content__MvVVv > "
-                        "div.ProductActions_product-actions-container__uuL2o > button > span > span > div > "
-                        "span.price-line"
-                    )
-
-                    if await origin_price_elem.is_visible():
-                        origin_price = await origin_price_elem.inner_text()
-                    else:
-                        continue
-
-                    origin_price = await convert_decimal(origin_price)
-
-                    option_1 = await page.locator(
-                        "#main > div.ProductContent_container__i3zzp > div.ProductDetailsPanel_container__1QuVB > "
-                        "div"
-                        "> div > div.ProductDetailsPanel_content__MvVVv > div:nth-child(1) > "
-                        "div.ProductDetailsHead_row-subtitle__PeOd4 > div > h2"
-                    ).inner_text()
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = "dior"
+
+        name = await page.locator(
+            "#main > div.ProductContent_container__i3zzp > div.ProductDetailsPanel_container__1QuVB > "
+            "div"
+            "> div > div.ProductDetailsPanel_content__MvVVv > div:nth-child(1) > "
+            "div.ProductDetailsHead_row-title__pZsRP > h1"
+        ).inner_text()
+
+        model = await self.read_optional_text(
+            page,
+            "#main > div.ProductContent_container__i3zzp > div.ProductDetailsPanel_container__1QuVB > "
+            "div"
+            "> div > div.ProductDetailsPanel_content__MvVVv "
+            "div.ProductDetailsHead_row-subtitle__PeOd4 > span",
+        )
+        model = await convert_model(model)
+
+        # 가격이 없는 상품(문의 상품)은 건너뜀
+        origin_price = await self.read_optional_text(
+            page,
+            "#main > div.ProductContent_container__i3zzp > "
+            "div.ProductDetailsPanel_container__1QuVB > div > div > "
+            "div.ProductDetailsPanel_content__MvVVv > "
+            "div.ProductActions_product-actions-container__uuL2o > button > span > span > div > "
+            "span.price-line",
+            default=None,
+        )
+        if origin_price is None:
+            return None
 
-                    image_url_elem = page.locator(
-                        "#main > div.ProductContent_container__i3zzp > div.MediaGallery_container__vvOwI ul > "
-                        "li:nth-child(1) img"
-                    )
+        origin_price = await convert_decimal(origin_price)
 
-                    if await image_url_elem.is_visible():
-                        image_url = await image_url_elem.get_attribute("src")
-                    else:
-                        image_url = ""
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": model.strip() if model else "",
-                        "정가": origin_price,
-                        "판매가": origin_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": "",
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
+        option_1 = await self.read_optional_text(
+            page,
+            "#main > div.ProductContent_container__i3zzp > div.ProductDetailsPanel_container__1QuVB > "
+            "div"
+            "> div > div.ProductDetailsPanel_content__MvVVv > div:nth-child(1) > "
+            "div.ProductDetailsHead_row-subtitle__PeOd4 > div > h2",
+        )
 
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url)
+        # 이미지가 없는 상품도 있으므로 선택 필드로 읽음
+        image_url = await self.read_optional_attribute(
+            page,
+            "#main > div.ProductContent_container__i3zzp > div.MediaGallery_container__vvOwI ul > "
+            "li:nth-child(1) img",
+            "src",
+        )
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=category,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": model.strip() if model else "",
+            "정가": origin_price,
+            "판매가": origin_price,
+            "옵션1": option_1.strip(),
+            "옵션2": "",
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
 
-        return product_details, product_image_urls
+        return product_detail_dict, image_url
 
 
 class ScrapBottegaveneta(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "보테가베네타"
+    prefetch_depth = 1  # 봇 차단이 엄격해 동시 이동은 하나까지만
+    detail_wait_until = "domcontentloaded"  # 상품 정보가 서버에서 그려짐
+    detail_ready_selector = "div.l-pdp__productinfos div.c-product h1"
+    canonical_params = []
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="보테가베네타",
             url="https://www.bottegaveneta.com",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
 
         self.categories = {
@@ -613,7 +1570,7 @@ class ScrapBottegaveneta(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_DETAILS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
             await self.scroll_to_the_bottom(page=page, interval=500, sleep=1)
 
             await page.wait_for_load_state()
@@ -627,109 +1584,90 @@ class ScrapBottegaveneta(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[str]]:
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = "bottegaveneta"
+        name = await page.locator(
+            "#main-content > div.l-pdp > div:nth-child(8) > div > div.l-pdp__productinfos > div.c-product >"
+            "div > h1"
+        ).inner_text()
+
+        model = await self.read_optional_text(
+            page, "#productLongDescContainer > div > p.c-product__id > span"
+        )
+        model = await convert_model(model)
+
+        origin_price = await page.locator(
+            "#main-content > div.l-pdp > div:nth-child(8) > div > "
+            "div.l-pdp__productinfos > div.c-product > div > div.l-pdp__prices "
+            "> div > p"
+        ).inner_text()
+        origin_price = await convert_decimal(origin_price)
+        sale_price = origin_price
+
+        option_1 = await self.read_optional_text(
+            page,
+            "#main-content > div.l-pdp > div:nth-child(8) > div > "
+            "div.l-pdp__productinfos > div.c-product > div > div:nth-child("
+            "5)",
+        )
 
-        product_details = []
-        product_image_urls = []
-        async for i, product_url in tqdm(
-            iterable=enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = "bottegaveneta"
-                    name = await page.locator(
-                        "#main-content > div.l-pdp > div:nth-child(8) > div > div.l-pdp__productinfos > div.c-product >"
-                        "div > h1"
-                    ).inner_text()
-
-                    model = await page.locator(
-                        "#productLongDescContainer > div > p.c-product__id > span"
-                    ).inner_text()
-                    model = await convert_model(model)
-
-                    origin_price = await page.locator(
-                        "#main-content > div.l-pdp > div:nth-child(8) > div > "
-                        "div.l-pdp__productinfos > div.c-product > div > div.l-pdp__prices "
-                        "> div > p"
-                    ).inner_text()
-                    origin_price = await convert_decimal(origin_price)
-                    sale_price = origin_price
-
-                    option_1 = await page.locator(
-                        "#main-content > div.l-pdp > div:nth-child(8) > div > "
-                        "div.l-pdp__productinfos > div.c-product > div > div:nth-child("
-                        "5)"
-                    ).inner_text()
-
-                    option_elem_button = page.locator(
-                        "#otherVariations > div:nth-child(1) > button"
-                    )
-                    option_2 = ""
-                    if await option_elem_button.is_visible():
-                        options = []
+        option_2 = ""
+        if await self.has_element(page, "#otherVariations > div:nth-child(1) > button"):
+            options = []
 
-                        await asyncio.sleep(1)
-                        await page.wait_for_load_state()
-                        option_elem_list = await page.locator(
-                            "ul.c-productvariationcarousel__wrapper > li span.c-otherproductvariationscarousel__modellabel"
-                        ).all()
+            option_elem_locator = page.locator(
+                "ul.c-productvariationcarousel__wrapper > li span.c-otherproductvariationscarousel__modellabel"
+            )
+            if await self.wait_optional(option_elem_locator):
+                option_elem_list = await option_elem_locator.all()
 
-                        for option_elem in option_elem_list:
-                            option = await option_elem.inner_text()
-                            options.append(option.strip())
-
-                        option_join = ", ".join(options)
-                        option_2 = f"사이즈: {option_join}"
-
-                    image_url = await page.locator(
-                        "#slider-images-product > div > div > div.c-productcarousel > ul > "
-                        "li:nth-child(1) > button > img"
-                    ).get_attribute("src")
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": model.strip(),
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip(),
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
+                for option_elem in option_elem_list:
+                    option = await option_elem.inner_text()
+                    options.append(option.strip())
 
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url)
+                option_join = ", ".join(options)
+                option_2 = f"사이즈: {option_join}"
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=category,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+        image_url = await self.read_image_url(
+            page,
+            "#slider-images-product > div > div > div.c-productcarousel > ul > "
+            "li:nth-child(1) > button > img",
+        )
 
-        return product_details, product_image_urls
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": model.strip(),
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip(),
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
+
+        return product_detail_dict, image_url
 
 
 class ScrapSaintLaurent(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "생로랑"
+    prefetch_depth = 1  # 봇 차단이 엄격해 동시 이동은 하나까지만
+    detail_wait_until = "domcontentloaded"  # 상품 정보가 서버에서 그려짐
+    detail_ready_selector = "div.c-productinfos > div.c-product > h1"
+    canonical_params = []
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="생로랑",
             url="https://www.ysl.com",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
 
         self.categories = {
@@ -748,7 +1686,7 @@ class ScrapSaintLaurent(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
             await self.scroll_to_the_bottom(page=page, interval=1000, sleep=1)
 
             await page.wait_for_load_state()
@@ -762,118 +1700,99 @@ class ScrapSaintLaurent(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[str]]:
-
-        product_details = []
-        product_image_urls = []
-        async for i, product_url in tqdm(
-            iterable=enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = "saint laurent"
-                    name = await page.locator(
-                        "#main-content > div > div > div:nth-child(10) > div > "
-                        "div.l-pdp__productinfos > div > div > div.c-productinfos > div.c-product >"
-                        " h1"
-                    ).inner_text()
-                    model = await page.locator(
-                        "#productLongDesc > div > ul > li:nth-child(3) > span"
-                    ).inner_text()
-
-                    origin_price = await page.locator(
-                        "#main-content > div > div > div:nth-child(10) > div > "
-                        "div.l-pdp__productinfos > div > div > div.c-productinfos > "
-                        "div.c-product > div.l-pdp__prices > div > div > p"
-                    ).inner_text()
-                    origin_price = await convert_decimal(origin_price)
-                    sale_price = origin_price
-
-                    image_url = await page.locator(
-                        "#slider-images-product > div > div.c-productcarousel > ul > "
-                        "li:nth-child(1) > button > span > img"
-                    ).get_attribute("src")
-
-                    option_label_1 = await page.locator(
-                        "#title-color-variation"
-                    ).inner_text()
-                    option_1 = await page.locator(
-                        "#main-content > div > div > div:nth-child(10) > div > "
-                        "div.l-pdp__productinfos > div > div > div.c-productinfos > "
-                        "div.c-product > div.l-pdp__variants > div > div:nth-child(1) > div > "
-                        "p"
-                    ).inner_text()
-                    option_1 = f"{option_label_1} {option_1}"
-
-                    option_elem_area2 = page.locator(
-                        "div.c-product__othervariationsbuttoncontainer"
-                    )
-                    option_2 = ""
-                    if await option_elem_area2.is_visible():
-                        await option_elem_area2.click()
-
-                        option_label_2 = await option_elem_area2.locator(
-                            "h2.c-product__sizeaccordionlabel"
-                        ).inner_text()
-                        options = []
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = "saint laurent"
+        name = await page.locator(
+            "#main-content > div > div > div:nth-child(10) > div > "
+            "div.l-pdp__productinfos > div > div > div.c-productinfos > div.c-product >"
+            " h1"
+        ).inner_text()
+        model = await self.read_optional_text(
+            page, "#productLongDesc > div > ul > li:nth-child(3) > span"
+        )
 
-                        await asyncio.sleep(1)
-                        await page.wait_for_load_state()
+        origin_price = await page.locator(
+            "#main-content > div > div > div:nth-child(10) > div > "
+            "div.l-pdp__productinfos > div > div > div.c-productinfos > "
+            "div.c-product > div.l-pdp__prices > div > div > p"
+        ).inner_text()
+        origin_price = await convert_decimal(origin_price)
+        sale_price = origin_price
+
+        image_url = await self.read_image_url(
+            page,
+            "#slider-images-product > div > div.c-productcarousel > ul > "
+            "li:nth-child(1) > button > span > img",
+        )
 
-                        option_elem_list = await page.locator(
-                            "span.c-otherproductvariationscarousel__modellabel"
-                        ).all()
+        option_label_1 = await self.read_optional_text(page, "#title-color-variation")
+        option_1 = await self.read_optional_text(
+            page,
+            "#main-content > div > div > div:nth-child(10) > div > "
+            "div.l-pdp__productinfos > div > div > div.c-productinfos > "
+            "div.c-product > div.l-pdp__variants > div > div:nth-child(1) > div > "
+            "p",
+        )
+        option_1 = f"{option_label_1} {option_1}" if option_1 else ""
 
-                        for option_elem in option_elem_list:
-                            option = await option_elem.inner_text()
-                            options.append(f"{option_label_2} {option.strip()}")
-
-                        option_2 = ", ".join(options)
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": model.strip(),
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip(),
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
+        option_elem_area2 = page.locator(
+            "div.c-product__othervariationsbuttoncontainer"
+        )
+        option_2 = ""
+        if await self.has_element(option_elem_area2):
+            await option_elem_area2.click()
 
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url)
+            option_label_2 = await option_elem_area2.locator(
+                "h2.c-product__sizeaccordionlabel"
+            ).inner_text()
+            options = []
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=category,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+            option_elem_locator = page.locator(
+                "span.c-otherproductvariationscarousel__modellabel"
+            )
+            if await self.wait_optional(option_elem_locator):
+                option_elem_list = await option_elem_locator.all()
+
+                for option_elem in option_elem_list:
+                    option = await option_elem.inner_text()
+                    options.append(f"{option_label_2} {option.strip()}")
+
+                option_2 = ", ".join(options)
+
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": model.strip(),
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip(),
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
 
-        return product_details, product_image_urls
+        return product_detail_dict, image_url
 
 
 class ScrapBalenciaga(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "발렌시아가"
+    prefetch_depth = 1  # 봇 차단이 엄격해 동시 이동은 하나까지만
+    detail_wait_until = "domcontentloaded"  # 상품 정보가 서버에서 그려짐
+    detail_ready_selector = "div.l-pdp__productname > h1"
+    canonical_params = []
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="발렌시아가",
             url="https://www.balenciaga.com",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
 
         self.categories = {
@@ -894,7 +1813,7 @@ class ScrapBalenciaga(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
 
             await asyncio.sleep(1)
             await self.scroll_to_the_bottom(page=page, interval=1000, sleep=1.5)
@@ -929,101 +1848,88 @@ class ScrapBalenciaga(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[str]]:
-        product_details = []
-        product_image_urls = []
-        async for i, product_url in tqdm(
-            iterable=enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = "balenciaga"
-                    name = await page.locator(
-                        "#main-content > div > div:nth-child(13) > div > div.l-pdp__watermark > "
-                        "div.l-pdp__productinfos > div > header > div.l-pdp__productname > "
-                        "h1"
-                    ).inner_text()
-
-                    await page.locator(
-                        r"#productShipping > div.c-accordion__section.\.c-productdetails > h2 > button"
-                    ).click()
-                    model_elem = page.locator(
-                        "#accordionPanelDetails > div > div.c-product__id > span"
-                    )
-                    await model_elem.scroll_into_view_if_needed()
-                    model = await model_elem.inner_text()
-                    model = await convert_model(model)
-
-                    origin_price = await page.locator(
-                        "#main-content > div > div:nth-child(13) > div > div.l-pdp__watermark > "
-                        "div.l-pdp__productinfos > div > header > div.l-pdp__productname > div.l-pdp__prices > div > p"
-                    ).inner_text()
-                    origin_price = await convert_decimal(origin_price)
-                    sale_price = origin_price
-
-                    option_1 = ""
-                    option_2 = ""
-
-                    await asyncio.sleep(1)
-                    image_url = await page.locator(
-                        "#slider-images-product > div > div.c-productcarousel > ul > li:nth-child(1) > button > img"
-                    ).get_attribute("src")
-
-                    if not image_url.startswith("https://balenciaga.dam.kering.com/"):
-                        await self.setup_product_error_log(
-                            page=page,
-                            url=url,
-                            product_no=self.init_product_no + i,
-                            message="상품 상세 페이지 이미지 로드 실패",
-                        )
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": model.strip(),
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip(),
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
-
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url)
-
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=category,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
-        return product_details, product_image_urls
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = "balenciaga"
+        name = await page.locator(
+            "#main-content > div > div:nth-child(13) > div > div.l-pdp__watermark > "
+            "div.l-pdp__productinfos > div > header > div.l-pdp__productname > "
+            "h1"
+        ).inner_text()
+
+        await page.locator(
+            r"#productShipping > div.c-accordion__section.\.c-productdetails > h2 > button"
+        ).click()
+        model_elem = page.locator(
+            "#accordionPanelDetails > div > div.c-product__id > span"
+        )
+        await model_elem.scroll_into_view_if_needed()
+        model = await model_elem.inner_text()
+        model = await convert_model(model)
+
+        origin_price = await page.locator(
+            "#main-content > div > div:nth-child(13) > div > div.l-pdp__watermark > "
+            "div.l-pdp__productinfos > div > header > div.l-pdp__productname > div.l-pdp__prices > div > p"
+        ).inner_text()
+        origin_price = await convert_decimal(origin_price)
+        sale_price = origin_price
+
+        option_1 = ""
+        option_2 = ""
+
+        # 지연 로딩 이미지가 실제 주소로 바뀔 때까지 잠깐 기다린 뒤 읽음
+        image_selector = "#slider-images-product > div > div.c-productcarousel > ul > li:nth-child(1) > button > img"
+        image_host = "https://balenciaga.dam.kering.com/"
+        await self.wait_optional(page, f'{image_selector}[src^="{image_host}"]')
+        image_url = await self.read_image_url(page, image_selector)
+
+        if not image_url.startswith(image_host):
+            await self.setup_product_error_log(
+                page=page,
+                url=url,
+                product_no=product_no,
+                message="상품 상세 페이지 이미지 로드 실패",
+            )
 
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": model.strip(),
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip(),
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
 
-# 명품 끝
+        return product_detail_dict, image_url
 
 
-# 종합 시작
 class ScrapGiftKakao(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "카카오"
+    detail_ready_selector = "div.product_subject > h2"
+    canonical_params = []
+    detail_cache_ttl = 60 * 60
+    listing_selectors = {
+        "item": "ul.list_prd > li",
+        "link": "div.thumb_prd > gc-link > a",
+        "name": "strong.txt_prdname",
+        "price": "em.num_price",
+        "sold_out": "span.minor_badge",
+    }
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="카카오",
             url="https://gift.kakao.com",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
 
         self.categories = {
@@ -1058,7 +1964,7 @@ class ScrapGiftKakao(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
             await asyncio.sleep(1)
             await self.scroll_to_the_bottom(page=page, interval=1500, sleep=1)
 
@@ -1101,149 +2007,120 @@ class ScrapGiftKakao(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[str]]:
-
-        product_details = []
-        product_image_urls = []
-        async for i, product_url in tqdm(
-            iterable=enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = await page.locator(
-                        "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div "
-                        "> div.wrap_brand > gc-link > a > div > span.txt_shopname"
-                    ).inner_text()
-
-                    name = await page.locator(
-                        "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div > "
-                        "div.product_subject"
-                        "> h2"
-                    ).inner_text()
-
-                    origin_price_elem = page.locator(
-                        "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div > "
-                        "div.info_product.clear_g > div.wrap_priceinfo.clear_g > span.txt_total"
-                    )
-
-                    sale_price_elem = page.locator(
-                        "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div > "
-                        "div.info_product.clear_g > div.wrap_priceinfo.clear_g > span.txt_price > del"
-                    )
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = await page.locator(
+            "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div "
+            "> div.wrap_brand > gc-link > a > div > span.txt_shopname"
+        ).inner_text()
+
+        name = await page.locator(
+            "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div > "
+            "div.product_subject"
+            "> h2"
+        ).inner_text()
+
+        origin_price_elem = page.locator(
+            "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div > "
+            "div.info_product.clear_g > div.wrap_priceinfo.clear_g > span.txt_total"
+        )
 
-                    origin_price, sale_price = await self.price_position_conversion(
-                        origin_price_elem, sale_price_elem
-                    )
+        sale_price_elem = page.locator(
+            "#mArticle > app-home > div > app-main > div > div > div.wrap_basic_info > div > "
+            "div.info_product.clear_g > div.wrap_priceinfo.clear_g > span.txt_price > del"
+        )
 
-                    image_selector = (
-                        "#mArticle > app-home > div > app-main > div > div > div.warp_thumb_product > div > "
-                        "cu-carousel > swiper-container > swiper-slide.cont_slide.swiper-slide-active > img"
-                    )
-                    await page.wait_for_function(
-                        f"""
-                        () => {{
-                            const img = document.querySelector("{image_selector}");
-                            return img.complete && img.naturalHeight !== 0;
-                        }}
-                        """
-                    )
-                    image_url = await page.locator(image_selector).first.get_attribute(
-                        "src"
-                    )
+        origin_price, sale_price = await self.price_position_conversion(
+            origin_price_elem, sale_price_elem
+        )
 
-                    if not image_url.startswith("https://img1"):
-                        await self.setup_product_error_log(
-                            page=page,
-                            url=url,
-                            product_no=self.init_product_no + i,
-                            message="상품 상세 페이지 이미지 로드 실패",
-                        )
+        image_selector = (
+            "#mArticle > app-home > div > app-main > div > div > div.warp_thumb_product > div > "
+            "cu-carousel > swiper-container > swiper-slide.cont_slide.swiper-slide-active > img"
+        )
+        # src 만 필요하므로 이미지 디코딩 완료까지 기다리지 않음
+        image_url = await self.read_image_url(page, image_selector)
 
-                    option_name_elem = page.locator(
-                        "#buyInfo > app-product-option > app-bottom-layer > div > div > app-options > "
-                        "div.wrap_option.fst.option_on > button > strong > span"
-                    )
+        if not image_url.startswith("https://img1"):
+            await self.setup_product_error_log(
+                page=page,
+                url=url,
+                product_no=product_no,
+                message="상품 상세 페이지 이미지 로드 실패",
+            )
 
-                    # 옵션 & 모델 존재 여부 체크
-                    option_1 = None
-                    model = None
-                    if await option_name_elem.is_visible():
-                        option_name = await option_name_elem.inner_text()
+        option_name_elem = page.locator(
+            "#buyInfo > app-product-option > app-bottom-layer > div > div > app-options > "
+            "div.wrap_option.fst.option_on > button > strong > span"
+        )
 
-                        await page.wait_for_load_state()
-                        option_elem_list = await page.locator(
-                            "#buyInfo > app-product-option > app-bottom-layer > div > div > app-options > div > ul > li"
-                        ).all()
+        # 옵션 & 모델 존재 여부 체크
+        option_1 = None
+        model = None
+        option_name = await self.read_optional_text(option_name_elem, default=None)
+        if option_name is not None:
+            option_elem_list = await page.locator(
+                "#buyInfo > app-product-option > app-bottom-layer > div > div > app-options > div > ul > li"
+            ).all()
 
-                        option_list1 = []
-                        for option_elem in option_elem_list:
-                            option = await option_elem.locator("label").inner_text()
-
-                            # 품절 상태 확인
-                            check_for_option = option_elem.locator("span.txt_soldout")
-                            if await check_for_option.is_visible():
-                                sold_out = await check_for_option.inner_text()
-                                option = f"{option.strip()} ({sold_out.strip()})"
-
-                            option_list1.append(option)
-
-                            # 모델명
-                            if option_name == "모델명":
-                                model = re.sub(r"\s*\([^)]*\)\s*", "", option)
-
-                        option_1 = ", ".join(option_list1)
-                    else:
-                        option_name = None
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": model.strip() if model else "",
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": (
-                            f"{option_name.strip()}: {option_1.strip()}"
-                            if option_name and option_1
-                            else ""
-                        ),
-                        "옵션2": "",
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
+            option_list1 = []
+            for option_elem in option_elem_list:
+                option = await option_elem.locator("label").inner_text()
 
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url)
+                # 품절 상태 확인
+                sold_out = await self.read_optional_text(
+                    option_elem, "span.txt_soldout"
+                )
+                if sold_out:
+                    option = f"{option.strip()} ({sold_out.strip()})"
+
+                option_list1.append(option)
+
+                # 모델명
+                if option_name == "모델명":
+                    model = re.sub(r"\s*\([^)]*\)\s*", "", option)
+
+            option_1 = ", ".join(option_list1)
+
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": model.strip() if model else "",
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": (
+                f"{option_name.strip()}: {option_1.strip()}"
+                if option_name and option_1
+                else ""
+            ),
+            "옵션2": "",
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=category,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+        await self.capture_product_images(image_url, page=page)
 
-        return product_details, product_image_urls
+        return product_detail_dict, image_url
 
 
 class ScrapNaverBrandStore(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "네이버"
+    detail_ready_selector = "fieldset div._1eddO7u4UC > h3"
+    canonical_params = []
+    detail_cache_ttl = 60 * 60
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="네이버",
             url="https://brand.naver.com",
             root_category="디지털/가전",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
 
         self.categories = {
@@ -1258,7 +2135,7 @@ class ScrapNaverBrandStore(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
 
             await page.wait_for_load_state()
             product_elem_list = await page.locator(
@@ -1271,121 +2148,89 @@ class ScrapNaverBrandStore(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[str]]:
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        await page.locator(
+            "#INTRODUCE > div > div.attribute_wrapper > div"
+        ).scroll_into_view_if_needed()
 
-        product_details = []
-        product_image_urls = []
-        async for i, data in tqdm(
-            enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for sub_site_name, url in data.items():
-                try:
-                    await page.goto(url)
+        name = await page.locator(
+            "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div._3k440DUKzy > "
+            "div._1eddO7u4UC > h3"
+        ).inner_text()
 
-                    await page.wait_for_load_state()
-                    await page.locator(
-                        "#INTRODUCE > div > div.attribute_wrapper > div"
-                    ).scroll_into_view_if_needed()
-
-                    brand_elem = page.locator(
-                        '//th[text()="브랜드"]/following-sibling::td'
-                    )
-
-                    brand = ""
-                    if await brand_elem.is_visible():
-                        brand = await brand_elem.inner_text()
-                        brand = brand.strip().replace("ANKER", "앤커")
-
-                    name = await page.locator(
-                        "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div._3k440DUKzy > "
-                        "div._1eddO7u4UC > h3"
-                    ).inner_text()
-
-                    model_elem = page.locator(
-                        '//th[text()="모델명"]/following-sibling::td'
-                    ).first
-
-                    model = ""
-                    if await model_elem.is_visible():
-                        model = await model_elem.inner_text()
+        brand = await self.read_optional_text(
+            page, '//th[text()="브랜드"]/following-sibling::td'
+        )
+        brand = brand.strip().replace("ANKER", "앤커")
 
-                    if re.search(r"[가-힣]", model):
-                        model = ""
+        model = await self.read_optional_text(
+            page, '//th[text()="모델명"]/following-sibling::td'
+        )
 
-                    origin_price_elem = page.locator(
-                        "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div._3k440DUKzy > "
-                        "div.WrkQhIlUY0 >"
-                        "div > strong > span._1LY7DqCnwR"
-                    )
-                    sale_price_elem = page.locator(
-                        "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > "
-                        "div._3k440DUKzy > div.WrkQhIlUY0 > div > del > span._1LY7DqCnwR"
-                    )
+        if re.search(r"[가-힣]", model):
+            model = ""
 
-                    origin_price, sale_price = await self.price_position_conversion(
-                        origin_price_elem, sale_price_elem
-                    )
+        origin_price_elem = page.locator(
+            "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div._3k440DUKzy > "
+            "div.WrkQhIlUY0 >"
+            "div > strong > span._1LY7DqCnwR"
+        )
+        sale_price_elem = page.locator(
+            "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > "
+            "div._3k440DUKzy > div.WrkQhIlUY0 > div > del > span._1LY7DqCnwR"
+        )
 
-                    option_elem_1 = page.locator(
-                        "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div.bd_2dy3Y > "
-                        "div:nth-child(1)"
-                    )
-                    option_elem_2 = page.locator(
-                        "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div.bd_2dy3Y > "
-                        "div:nth-child(2)"
-                    )
+        origin_price, sale_price = await self.price_position_conversion(
+            origin_price_elem, sale_price_elem
+        )
 
-                    option_1, option_2 = await self.get_options(
-                        page, option_elem_1=option_elem_1, option_elem_2=option_elem_2
-                    )
+        option_elem_1 = page.locator(
+            "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div.bd_2dy3Y > "
+            "div:nth-child(1)"
+        )
+        option_elem_2 = page.locator(
+            "#content > div > div._2-I30XS1lA > div._2QCa6wHHPy > fieldset > div.bd_2dy3Y > "
+            "div:nth-child(2)"
+        )
 
-                    image_url = await page.locator(
-                        "#content > div > div._2-I30XS1lA > div._3rXou9cfw2 > div > div img"
-                    ).first.get_attribute("src")
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": self.root_category,
-                        "브랜드": brand.strip() if brand else sub_site_name,
-                        "상품명": name.strip(),
-                        "모델명": model.strip(),
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip(),
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
+        option_1, option_2 = await self.get_options(
+            page, option_elem_1=option_elem_1, option_elem_2=option_elem_2
+        )
 
-                    product_details.append(product_detail_dict)
-                    product_image_urls.append(image_url)
+        image_url = await self.read_image_url(
+            page,
+            "#content > div > div._2-I30XS1lA > div._3rXou9cfw2 > div > div img",
+        )
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        category=sub_site_name,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": self.root_category,
+            "브랜드": brand.strip() if brand else category,
+            "상품명": name.strip(),
+            "모델명": model.strip(),
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip(),
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
 
-        return product_details, product_image_urls
+        return product_detail_dict, image_url
 
     @classmethod
     async def get_options(
         cls, page: Page, option_elem_1: Locator, option_elem_2: Locator
     ):
         async def get_option_names(option_elem: Locator):
-            if await option_elem.is_visible():
-                option_root_name = await option_elem.inner_text()
+            option_root_name = await cls.read_optional_text(option_elem, default=None)
+            if option_root_name is not None:
                 await option_elem.get_by_role("button").click()
 
-                await page.wait_for_load_state()
+                await option_elem.locator("ul > li").first.wait_for()
                 option_child_elem_list = await option_elem.locator("ul > li").all()
 
                 option_child_names = []
@@ -1409,42 +2254,58 @@ class ScrapNaverBrandStore(ScrapUtil):
 
 
 class ScrapHM(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "H & M"
+    detail_ready_selector = "#js-product-name > div > h1"
+    canonical_params = []
+    detail_cache_ttl = 60 * 60 * 3
+    listing_selectors = {
+        "item": "#page-content > div > div > ul > li > article",
+        "link": "div.image-container a",
+        "name": "h3.item-heading",
+        "price": "strong.item-price > span",
+        "sold_out": "div.out-of-stock",
+    }
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="H & M",
             url="https://www2.hm.com",
             root_category="패션/잡화",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
         self.categories = {"Women": "/ko_kr/ladies/new-arrivals/view-all.html"}
+        self.listing_images: Dict[str, str] = {}
 
-    async def create(self) -> Tuple[List[dict], List[str]]:
+    async def create(self) -> None:
         async with async_playwright() as p:
             try:
                 browser, page = await self.setup_playwright(p)
-                await page.goto(self.url)
+                await self.goto(page, self.url)
 
-                product_urls, product_image_urls = await self.get_product_urls(
-                    page=page
-                )
+                product_urls, product_image_urls = await self.get_frontier(page=page)
 
-                product_details = await self.get_product_details(
-                    page=page, product_urls=product_urls
+                # 상세 페이지 대신 목록 이미지를 사용하므로 링크로 찾아서 넣음
+                self.listing_images = dict(
+                    zip(
+                        (
+                            url
+                            for product_url in product_urls
+                            for url in product_url.values()
+                        ),
+                        product_image_urls,
+                    )
                 )
-
-                for product_detail, product_image_url in zip(
-                    product_details, product_image_urls
-                ):
-                    product_detail["이미지소스"] = product_image_url
+                await self.get_product_details(
+                    page=page, product_urls=product_urls, collect=False
+                )
+                await self.report_detail_stats()
 
             finally:
                 await page.close()
                 await browser.close()
 
-        return product_details, product_image_urls
-
     async def get_product_urls(self, page: Page) -> Tuple[List[Dict], List[str]]:
 
         await self.click_on_cookie_button(
@@ -1456,7 +2317,7 @@ class ScrapHM(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
 
             await self.click_on_load_more_button(
                 page=page,
@@ -1481,103 +2342,104 @@ class ScrapHM(ScrapUtil):
 
                 product_urls.append({category_key: f"{self.url}{product_link}"})
                 product_image_urls.append(product_image)
+                # 목록 이미지는 앞쪽 타일을 처리하는 동안 미리 로드되므로 버퍼 유지
+                await self.capture_product_images(product_image, clear=False)
 
             print(product_urls)
 
         return product_urls, product_image_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> List[dict]:
-
-        product_details = []
-        async for i, product_url in tqdm(
-            iterable=enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = self.site_name
-                    name = await page.locator(
-                        "#js-product-name > div > h1"
-                    ).inner_text()
-
-                    origin_price_elem = page.locator("#product-price > div > .d9ca8b")
-                    origin_price = await origin_price_elem.inner_text()
-                    origin_price = await convert_decimal(origin_price)
-                    sale_price = origin_price
-
-                    option_1 = await page.locator(
-                        "#main-content > div.product.parbase > "
-                        "div.layout.pdp-wrapper.product-detail.sticky-footer-wrapper.js-reviews > "
-                        "div.module.product-description.sticky-wrapper.pdp-container > div.column2 > "
-                        "div > div > div.product-colors.miniatures.clearfix.slider-completed.loaded > "
-                        "h3"
-                    ).inner_text()
-                    option_1 = f"색상: {option_1.strip()}"
-                    option_2 = ""
-                    option_area = page.locator("div.product-item-buttons.BOSS")
-                    option_label_elem = option_area.locator(
-                        "#size-selector > div > span"
-                    )
-                    if await option_label_elem.is_visible():
-                        option_label = await option_label_elem.inner_text()
-
-                        await page.wait_for_load_state()
-                        option_elem_list = await option_area.locator(
-                            "#size-selector > ul > li"
-                        ).all()
+    async def prepare_listing_page(self, page: Page) -> None:
+        await self.click_on_cookie_button(
+            page=page, selector="#onetrust-accept-btn-handler", sleep=1
+        )
+        await self.click_on_load_more_button(
+            page=page,
+            selector="#page-content > div > div > div.load-more-products > button",
+            sleep=2,
+        )
+        await page.wait_for_load_state()
+
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = self.site_name
+        name = await page.locator("#js-product-name > div > h1").inner_text()
+
+        origin_price_elem = page.locator("#product-price > div > .d9ca8b")
+        origin_price = await origin_price_elem.inner_text()
+        origin_price = await convert_decimal(origin_price)
+        sale_price = origin_price
+
+        option_1 = await self.read_optional_text(
+            page,
+            "#main-content > div.product.parbase > "
+            "div.layout.pdp-wrapper.product-detail.sticky-footer-wrapper.js-reviews > "
+            "div.module.product-description.sticky-wrapper.pdp-container > div.column2 > "
+            "div > div > div.product-colors.miniatures.clearfix.slider-completed.loaded > "
+            "h3",
+        )
+        option_1 = f"색상: {option_1.strip()}" if option_1 else ""
+        option_2 = ""
+        option_area = page.locator("div.product-item-buttons.BOSS")
+        option_label = await self.read_optional_text(
+            option_area, "#size-selector > div > span", default=None
+        )
+        if option_label is not None:
+            option_elem_list = await option_area.locator(
+                "#size-selector > ul > li"
+            ).all()
 
-                        options = []
-                        for option_elem in option_elem_list:
-                            if await option_elem.locator("div").is_disabled():
-                                continue
+            options = []
+            for option_elem in option_elem_list:
+                if await option_elem.locator("div").is_disabled():
+                    continue
 
-                            option = await option_elem.locator(
-                                "div > label"
-                            ).inner_text()
-                            option = option.strip().replace("재고가 거의 없습니다.", "")
-                            options.append(f"{option_label.strip()}: {option.strip()}")
-
-                        option_2 = ", ".join(options)
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": self.root_category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": "",
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip(),
-                        "링크": url.strip(),
-                    }
-                    product_details.append(product_detail_dict)
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+                option = await option_elem.locator("div > label").inner_text()
+                option = option.strip().replace("재고가 거의 없습니다.", "")
+                options.append(f"{option_label.strip()}: {option.strip()}")
+
+            option_2 = ", ".join(options)
+
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": self.root_category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": "",
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip(),
+            "링크": url.strip(),
+            "이미지소스": self.listing_images.get(url, ""),
+        }
 
-        return product_details
+        return product_detail_dict, product_detail_dict["이미지소스"]
 
 
 class ScrapZARA(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "ZARA"
+    detail_ready_selector = "div.product-detail-info__header h1"
+    canonical_params = ["v1"]
+    detail_cache_ttl = 60 * 60 * 3
+    listing_selectors = {
+        "item": "#main > article > div.product-groups > section > ul > li",
+        "link": "div.product-grid-product__figure > a",
+        "name": "a.product-grid-product-info__name",
+        "price": "span.price-current__amount",
+        "sold_out": "span.product-grid-product-info__product-tag--out-of-stock",
+    }
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="ZARA",
             url="https://www.zara.com",
             root_category="패션/잡화",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
         self.categories = {
             "woman": "/kr/ko/woman-must-have-l4108.html?v1=2352612&page=2"
@@ -1593,7 +2455,7 @@ class ScrapZARA(ScrapUtil):
         async for category_key, category_value in tqdm(
             iterable=self.categories.items(), desc=self.PRODUCT_URLS_DES
         ):
-            await page.goto(f"{self.url}{category_value}")
+            await self.goto(page, f"{self.url}{category_value}")
 
             await self.scroll_to_the_bottom(page=page, interval=1000, sleep=1)
 
@@ -1609,129 +2471,105 @@ class ScrapZARA(ScrapUtil):
 
         return product_urls
 
-    async def get_product_details(
-        self, page: Page, product_urls: List[Dict[str, str]]
-    ) -> Tuple[List[dict], List[List[str]]]:
+    async def get_product_detail(
+        self, page: Page, category: str, url: str, product_no: int
+    ) -> Optional[Tuple[dict, Union[str, List[str], None]]]:
+        brand = self.site_name
+        name = await page.locator(
+            "#main > article > div > div.product-detail-view__main > "
+            "div.product-detail-view__side-bar > div > div.product-detail-info__info > "
+            "div.product-detail-info__header > div > h1"
+        ).inner_text()
+        origin_price = await page.locator(
+            "#main > article > div.product-detail-view__content > "
+            "div.product-detail-view__main > div.product-detail-view__side-bar > "
+            "div > div.product-detail-info__info > div.product-detail-info__price > "
+            "div > span > span > span > div > span"
+        ).inner_text()
+        origin_price = await convert_decimal(origin_price)
+        sale_price = origin_price
+
+        option_1 = await self.read_optional_text(
+            page, "div.product-detail-info__actions p"
+        )
+        if option_1:
+            option_1 = f"색상: {await convert_string(option_1)}".replace("컬러", "")
 
-        product_details = []
-        product_image_urls = []
-        async for i, product_url in tqdm(
-            iterable=enumerate(product_urls),
-            total=len(product_urls),
-            desc=self.PRODUCT_DETAILS_DES,
-        ):
-            for category, url in product_url.items():
-                try:
-                    await page.goto(url)
-
-                    brand = self.site_name
-                    name = await page.locator(
-                        "#main > article > div > div.product-detail-view__main > "
-                        "div.product-detail-view__side-bar > div > div.product-detail-info__info > "
-                        "div.product-detail-info__header > div > h1"
-                    ).inner_text()
-                    origin_price = await page.locator(
-                        "#main > article > div.product-detail-view__content > "
-                        "div.product-detail-view__main > div.product-detail-view__side-bar > "
-                        "div > div.product-detail-info__info > div.product-detail-info__price > "
-                        "div > span > span > span > div > span"
-                    ).inner_text()
-                    origin_price = await convert_decimal(origin_price)
-                    sale_price = origin_price
-
-                    option_1 = await page.locator(
-                        "div.product-detail-info__actions p"
-                    ).inner_text()
-                    option_1 = f"색상: {await convert_string(option_1)}".replace(
-                        "컬러", ""
-                    )
+        option_elem_list = await page.locator(
+            "ul.size-selector-list > li.size-selector-list__item"
+        ).all()
 
-                    await page.wait_for_load_state()
-                    option_elem_list = await page.locator(
-                        "ul.size-selector-list > li.size-selector-list__item"
-                    ).all()
-
-                    options = []
-                    for option_elem in option_elem_list:
-                        sold_out = await option_elem.get_attribute("class")
-
-                        if "size-selector-list__item--is-disabled" in sold_out:
-                            continue
-
-                        option = await option_elem.locator(
-                            "div.product-size-info__size > div.product-size-info__main-label"
-                        ).inner_text()
-                        options.append(f"사이즈: {option.strip()}")
-
-                    option_2 = ", ".join(options)
-
-                    await page.wait_for_load_state()
-                    image_elem_list = await page.locator(
-                        "#main > article > div.product-detail-view__content > div.product-detail-view__main > "
-                        "div.product-detail-view__main-content > section > div.product-detail-images__frame > ul > "
-                        "li > button > div > div > picture > img"
-                    ).all()
-
-                    image_urls = []
-                    for image_elem in image_elem_list:
-                        await image_elem.scroll_into_view_if_needed()
-                        await asyncio.sleep(0.3)
-                        image_url = await image_elem.get_attribute("src")
-                        image_urls.append(image_url)
-
-                        if image_url.startswith(
-                            "https://static.zara.net/stdstatic/6.11.0/images/transparent"
-                            "-background.png"
-                        ):
-                            logger = await get_logger()
-                            logger.error(
-                                f"'{self.init_product_no + i}' 번째 '{self.site_name}' 이미지를 불러오는 중에 오류가 발생했습니다."
-                            )
+        options = []
+        for option_elem in option_elem_list:
+            sold_out = await option_elem.get_attribute("class") or ""
 
-                    product_image_urls.append(image_urls)
-                    image_url = ";\n".join(image_urls)
-
-                    product_detail_dict = {
-                        "상품번호": self.init_product_no + i,
-                        "사이트": self.site_name,
-                        "카테고리": self.root_category,
-                        "브랜드": brand.strip(),
-                        "상품명": name.strip(),
-                        "모델명": "",
-                        "정가": origin_price,
-                        "판매가": sale_price,
-                        "옵션1": option_1.strip(),
-                        "옵션2": option_2.strip() if option_2 else "",
-                        "링크": url.strip(),
-                        "이미지소스": image_url.strip(),
-                    }
-                    product_details.append(product_detail_dict)
+            if "size-selector-list__item--is-disabled" in sold_out:
+                continue
 
-                except Exception as e:
-                    await self.setup_product_error_log(
-                        page=page,
-                        url=url,
-                        product_no=self.init_product_no + i,
-                        message="상품 상세 페이지 에러 발생",
-                    )
+            option = await option_elem.locator(
+                "div.product-size-info__size > div.product-size-info__main-label"
+            ).inner_text()
+            options.append(f"사이즈: {option.strip()}")
 
-        return product_details, product_image_urls
+        option_2 = ", ".join(options)
 
+        image_elem_locator = page.locator(
+            "#main > article > div.product-detail-view__content > div.product-detail-view__main > "
+            "div.product-detail-view__main-content > section > div.product-detail-images__frame > ul > "
+            "li > button > div > div > picture > img"
+        )
+        await image_elem_locator.first.wait_for(state="attached")
+        image_elem_list = await image_elem_locator.all()
+
+        image_urls = []
+        for image_elem in image_elem_list:
+            await image_elem.scroll_into_view_if_needed()
+            await asyncio.sleep(0.3)
+            image_url = await image_elem.get_attribute("src")
+            image_urls.append(image_url)
+
+            if image_url.startswith(
+                "https://static.zara.net/stdstatic/6.11.0/images/transparent"
+                "-background.png"
+            ):
+                logger = await get_logger()
+                logger.error(
+                    f"'{product_no}' 번째 '{self.site_name}' 이미지를 불러오는 중에 오류가 발생했습니다."
+                )
 
-# 종합 끝
+        await self.capture_product_images(image_urls, page=page)
+        image_url = ";\n".join(image_urls)
+
+        product_detail_dict = {
+            "상품번호": product_no,
+            "사이트": self.site_name,
+            "카테고리": self.root_category,
+            "브랜드": brand.strip(),
+            "상품명": name.strip(),
+            "모델명": "",
+            "정가": origin_price,
+            "판매가": sale_price,
+            "옵션1": option_1.strip(),
+            "옵션2": option_2.strip() if option_2 else "",
+            "링크": url.strip(),
+            "이미지소스": image_url.strip(),
+        }
+
+        return product_detail_dict, image_urls
 
 
-# 리뷰 시작
 class ScrapGooglePlayReView(ScrapUtil):
-    def __init__(self, init_product_no: int = 1):
+    site_name = "구글 플레이"
+
+    def __init__(self, init_product_no: int = 1, **kwargs):
         super().__init__(
-            site_name="구글 플레이",
             url="https://play.google.com/store",
             root_dirname="구글 플레이 리뷰",
             root_category="리뷰",
             headless=False,
             timeout=30000,
             init_product_no=init_product_no,
+            **kwargs,
         )
         self.categories = {
             "럭키탕": "/apps/details?id=com.didimstory.luckyTang",
@@ -1753,7 +2591,7 @@ class ScrapGooglePlayReView(ScrapUtil):
         async with async_playwright() as p:
             try:
                 browser, page = await self.setup_playwright(p)
-                await page.goto(self.url)
+                await self.goto(page, self.url)
                 await self.get_review_details(page)
 
             finally:
@@ -1764,7 +2602,7 @@ class ScrapGooglePlayReView(ScrapUtil):
         for key, url in self.categories.items():
             url = f"{self.url}{url}"
             try:
-                await page.goto(url)
+                await self.goto(page, url)
 
                 # not modal start
                 appname = await page.locator("div.hnnXjf > div > div > h1").inner_text()
@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import base64
+import gzip
+import hashlib
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 저장 시 제거하는 스크립트 태그 (오프라인 재추출 중에 사이트 스크립트가 DOM 을 바꾸지 않도록)
+SCRIPT_PATTERN = re.compile(
+    r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL
+)
+HEAD_PATTERN = re.compile(r"<head\b[^>]*>", re.IGNORECASE)
+
+# 재추출 시 이미지 요청에 돌려주는 1x1 PNG (이미지 로드 완료를 기다리는 사이트용)
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+# 상세 페이지 DOM 스냅샷 보관소
+# 파싱이 끝난(또는 실패한) 시점의 HTML 을 gzip 으로 압축해 내용 해시로 저장하므로 같은 페이지는 한 번만 저장됨.
+# 셀렉터를 고친 뒤 `python -m scraper.snapshots --site 카카오` 로 다시 크롤링하지 않고 재추출할 수 있음.
+class SnapshotArchive:
+    def __init__(self, root_path: Path):
+        self.root_path = root_path
+        self.objects_path = root_path / "objects"
+        self.objects_path.mkdir(parents=True, exist_ok=True)
+
+        self.saved = 0
+        self.deduplicated = 0
+
+        self.connection = sqlite3.connect(root_path / "index.sqlite3")
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                site TEXT NOT NULL,
+                url TEXT NOT NULL,
+                category TEXT,
+                product_no INTEGER,
+                content_hash TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                captured_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_snapshots_site_url
+                ON snapshots (site, url, captured_at);
+            """
+        )
+
+    def blob_path(self, content_hash: str) -> Path:
+        return self.objects_path / content_hash[:2] / f"{content_hash}.html.gz"
+
+    async def save(
+        self,
+        site: str,
+        url: str,
+        category: str,
+        product_no: int,
+        html: str,
+        ok: bool = True,
+    ) -> str:
+        html = SCRIPT_PATTERN.sub("", html)
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        blob_path = self.blob_path(content_hash)
+        if blob_path.exists():
+            self.deduplicated += 1
+        else:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = await asyncio.to_thread(gzip.compress, data, 6)
+            temp_path = blob_path.with_suffix(".tmp")
+            temp_path.write_bytes(compressed)
+            temp_path.replace(blob_path)
+            self.saved += 1
+
+        self.connection.execute(
+            """
+            INSERT INTO snapshots (
+                site, url, category, product_no, content_hash, ok, captured_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (site, url, category, product_no, content_hash, int(ok), time.time()),
+        )
+        self.connection.commit()
+        return content_hash
+
+    async def load(self, content_hash: str) -> str:
+        data = await asyncio.to_thread(self.blob_path(content_hash).read_bytes)
+        return gzip.decompress(data).decode("utf-8")
+
+    async def get_entries(self, site: str, only_failed: bool = False) -> List[Dict]:
+        # 링크별 가장 최근 스냅샷
+        rows = self.connection.execute(
+            """
+            SELECT * FROM snapshots
+            WHERE id IN (SELECT MAX(id) FROM snapshots WHERE site = ? GROUP BY url)
+                AND (? = 0 OR ok = 0)
+            ORDER BY product_no, id
+            """,
+            (site, int(only_failed)),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def summary(self) -> str:
+        return f"스냅샷 저장: {self.saved}건, 중복 생략: {self.deduplicated}건"
+
+
+async def re_extract(
+    site_name: str,
+    archive: SnapshotArchive,
+    only_failed: bool = False,
+    timeout: int = 3000,
+) -> Optional[Path]:
+    # 순환 import 방지
+    from playwright.async_api import async_playwright, Route
+
+    from scraper.scrap_crawlers import ScrapUtil
+    from scraper.stores import JsonlSink
+    from scraper.utils import (
+        RESULT_DIR,
+        create_xlsx_file_from_records,
+        save_to_xlsx,
+        setup_datetime,
+    )
+
+    scrapers = {
+        scraper.site_name: scraper
+        for scraper in ScrapUtil.__subclasses__()
+        if scraper.site_name
+    }
+    if site_name not in scrapers:
+        print(f"지원하지 않는 사이트: '{site_name}' (가능: {', '.join(scrapers)})")
+        return None
+
+    entries = await archive.get_entries(site_name, only_failed=only_failed)
+    if not entries:
+        print(f"'{site_name}' 스냅샷이 없습니다.")
+        return None
+
+    # 상세 캐시를 거치지 않고 스냅샷 DOM 에서 바로 추출
+    instance = scrapers[site_name](use_detail_cache=False)
+    instance.timeout = timeout
+
+    async def handle_route(route: Route) -> None:
+        # 오프라인 재추출: 이미지는 빈 PNG, 나머지 요청은 모두 차단
+        if route.request.resource_type == "image":
+            await route.fulfill(status=200, content_type="image/png", body=BLANK_PNG)
+        else:
+            await route.abort()
+
+    timestamp = setup_datetime("%Y-%m-%d_%H_%M")
+    sink = JsonlSink(RESULT_DIR / f"{site_name}_재추출_{timestamp}.jsonl")
+    failed = []
+
+    async with async_playwright() as p:
+        browser = await ScrapUtil.launch_browser(p, headless=True)
+        try:
+            page = await instance.setup_page(browser)
+            await page.route("**/*", handle_route)
+
+            for entry in entries:
+                html = await archive.load(entry["content_hash"])
+                html = HEAD_PATTERN.sub(
+                    lambda m: f'{m.group(0)}<base href="{entry["url"]}">', html, count=1
+                )
+                try:
+                    await page.set_content(html, wait_until="domcontentloaded")
+                    result = await instance.get_product_detail(
+                        page=page,
+                        category=entry["category"],
+                        url=entry["url"],
+                        product_no=entry["product_no"],
+                    )
+                except Exception as e:
+                    failed.append((entry["product_no"], entry["url"], repr(e)))
+                    continue
+
+                if result is None:
+                    failed.append((entry["product_no"], entry["url"], "건너뜀"))
+                    continue
+                await sink.emit(result[0])
+        finally:
+            await sink.close()
+            await browser.close()
+
+    print(
+        f"'{site_name}' 재추출: 전체 {len(entries)}건, 성공 {sink.count}건, "
+        f"실패 {len(failed)}건"
+    )
+    for product_no, url, reason in failed:
+        print(f"  [실패] 상품번호: '{product_no}', 사유: '{reason}', 링크: '{url}'")
+
+    if sink.count:
+        excel_file = await create_xlsx_file_from_records(
+            records=sink.iter_records, file_name=f"{site_name}_재추출"
+        )
+        await save_to_xlsx(xlsx_file=excel_file)
+    return sink.path
+
+
+def main() -> None:
+    from scraper.utils import SNAPSHOT_DIR, setup_asyncio, setup_logging
+
+    parser = argparse.ArgumentParser(description="저장된 상세 페이지 스냅샷으로 재추출")
+    parser.add_argument("--site", required=True, help="사이트 이름 (예: 카카오)")
+    parser.add_argument("--archive", type=Path, default=SNAPSHOT_DIR)
+    parser.add_argument(
+        "--failed", action="store_true", help="추출에 실패했던 페이지만 재추출"
+    )
+    parser.add_argument("--timeout", type=int, default=3000, help="요소 대기 시간(ms)")
+    args = parser.parse_args()
+
+    setup_asyncio()
+    setup_logging()
+    asyncio.run(
+        re_extract(
+            args.site,
+            SnapshotArchive(args.archive),
+            only_failed=args.failed,
+            timeout=args.timeout,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
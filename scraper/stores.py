@@ -0,0 +1,552 @@
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# 엑셀 컬럼 -> 상품 테이블 컬럼
+PRODUCT_COLUMNS = {
+    "사이트": "site",
+    "카테고리": "category",
+    "브랜드": "brand",
+    "상품명": "name",
+    "모델명": "model",
+    "정가": "origin_price",
+    "판매가": "sale_price",
+    "옵션1": "option_1",
+    "옵션2": "option_2",
+    "링크": "link",
+    "이미지소스": "image_source",
+}
+
+# 값이 바뀌면 이력에 한 줄 추가되는 컬럼
+HISTORY_COLUMNS = ["name", "origin_price", "sale_price", "option_1", "option_2"]
+
+
+# 스크랩 결과 저장소 (SQLite)
+# 상품은 (사이트, 링크) 당 한 행으로 최신 값을 유지하고, 가격/옵션 변경은 이력 테이블에 누적함.
+# 엑셀은 실행별 결과 파일로 만들고, 저장소는 실행을 넘나드는 변경 이력 조회(get_changes)에 사용함.
+class ProductStore:
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS products (
+                site TEXT NOT NULL,
+                link TEXT NOT NULL,
+                category TEXT,
+                brand TEXT,
+                name TEXT,
+                model TEXT,
+                origin_price,
+                sale_price,
+                option_1 TEXT,
+                option_2 TEXT,
+                image_source TEXT,
+                first_seen_at REAL NOT NULL,
+                last_seen_at REAL NOT NULL,
+                PRIMARY KEY (site, link)
+            );
+            CREATE INDEX IF NOT EXISTS idx_products_last_seen
+                ON products (site, last_seen_at);
+
+            CREATE TABLE IF NOT EXISTS product_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                site TEXT NOT NULL,
+                link TEXT NOT NULL,
+                run_id TEXT,
+                name TEXT,
+                origin_price,
+                sale_price,
+                option_1 TEXT,
+                option_2 TEXT,
+                recorded_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_product_history_link
+                ON product_history (site, link, recorded_at);
+            CREATE INDEX IF NOT EXISTS idx_product_history_recorded
+                ON product_history (recorded_at);
+            """
+        )
+
+    async def upsert_products(
+        self, product_details: Iterable[Dict], run_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        # 최신 값은 덮어쓰고, 처음 보거나 값이 바뀐 상품만 이력에 추가
+        counts = {"신규": 0, "변경": 0, "동일": 0}
+        now = time.time()
+
+        with self.connection:
+            for product_detail in product_details:
+                row = {
+                    column: product_detail.get(key)
+                    for key, column in PRODUCT_COLUMNS.items()
+                }
+                if not row["site"] or not row["link"]:
+                    continue
+
+                stored = self.connection.execute(
+                    f"SELECT {', '.join(HISTORY_COLUMNS)} FROM products "
+                    "WHERE site = ? AND link = ?",
+                    (row["site"], row["link"]),
+                ).fetchone()
+
+                changed = stored is None or any(
+                    stored[column] != row[column] for column in HISTORY_COLUMNS
+                )
+                if stored is None:
+                    counts["신규"] += 1
+                elif changed:
+                    counts["변경"] += 1
+                else:
+                    counts["동일"] += 1
+
+                columns = list(row)
+                update_columns = [
+                    column for column in columns if column not in ("site", "link")
+                ]
+                self.connection.execute(
+                    f"""
+                    INSERT INTO products (
+                        {', '.join(columns)}, first_seen_at, last_seen_at
+                    ) VALUES ({', '.join('?' for _ in columns)}, ?, ?)
+                    ON CONFLICT (site, link) DO UPDATE SET
+                        {', '.join(f'{column} = excluded.{column}' for column in update_columns)},
+                        last_seen_at = excluded.last_seen_at
+                    """,
+                    (*row.values(), now, now),
+                )
+
+                if changed:
+                    self.connection.execute(
+                        f"""
+                        INSERT INTO product_history (
+                            site, link, run_id, {', '.join(HISTORY_COLUMNS)}, recorded_at
+                        ) VALUES (?, ?, ?, {', '.join('?' for _ in HISTORY_COLUMNS)}, ?)
+                        """,
+                        (
+                            row["site"],
+                            row["link"],
+                            run_id,
+                            *(row[column] for column in HISTORY_COLUMNS),
+                            now,
+                        ),
+                    )
+
+        return counts
+
+    async def get_changes(self, since: float, site: Optional[str] = None) -> List[Dict]:
+        # since 이후 추가된 이력과 직전 이력을 비교 (이력 인덱스만 사용)
+        rows = self.connection.execute(
+            """
+            SELECT * FROM (
+                SELECT
+                    site, link, name, sale_price, option_1, option_2, recorded_at,
+                    LAG(id) OVER w AS previous_id,
+                    LAG(name) OVER w AS previous_name,
+                    LAG(sale_price) OVER w AS previous_sale_price,
+                    LAG(option_1) OVER w AS previous_option_1,
+                    LAG(option_2) OVER w AS previous_option_2
+                FROM product_history
+                WHERE (site, link) IN (
+                    SELECT site, link FROM product_history
+                    WHERE recorded_at >= ? AND (? IS NULL OR site = ?)
+                )
+                WINDOW w AS (PARTITION BY site, link ORDER BY recorded_at, id)
+            )
+            WHERE recorded_at >= ? AND previous_id IS NOT NULL
+            ORDER BY site, link
+            """,
+            (since, site, site, since),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+# 스크랩 진행 기록 (브라우저 종료/작업 중지 후 이어받기용)
+# 사이트별 상품 링크 목록과 끝난 사이트 표시만 JSONL 로 누적함.
+# 완료된 상품 자체는 결과 파일에 있으므로 이어받을 때 결과 파일에서 다시 읽음.
+class ScrapCheckpoint:
+    def __init__(
+        self,
+        path: Path,
+        config: Dict,
+        run_id: str,
+        resume: bool = True,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.config = config
+        self.run_id = run_id  # 이어받으면 이전 실행의 run_id 를 그대로 사용
+
+        self.frontiers: Dict[str, Dict] = {}
+        self.finished_sites: Dict[str, Dict] = {}  # 사이트 -> 상품 수/최대 상품번호
+        self.resumed = False
+
+        if resume and path.exists():
+            self.load()
+
+        if self.resumed:
+            self.file = open(path, mode="a", encoding="utf-8")
+        else:
+            self.frontiers.clear()
+            self.finished_sites.clear()
+            self.file = open(path, mode="w", encoding="utf-8")
+            self.write({"config": config, "run_id": run_id})
+
+    def load(self) -> None:
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 중에 종료된 마지막 줄
+                    break
+
+                if "config" in record:
+                    if record["config"] != self.config:
+                        print("이전 작업과 설정이 달라 처음부터 다시 시작합니다.")
+                        return
+                    self.resumed = True
+                    self.run_id = record["run_id"]
+                elif "frontier" in record:
+                    self.frontiers[record["site"]] = record
+                elif "finished" in record:
+                    self.finished_sites[record["site"]] = record
+
+    def write(self, record: Dict) -> None:
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def get_frontier(self, site_name: str) -> Optional[Dict]:
+        return self.frontiers.get(site_name)
+
+    def record_frontier(
+        self,
+        site_name: str,
+        init_product_no: int,
+        product_urls: Any,
+        categories: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        record = {
+            "site": site_name,
+            "init_product_no": init_product_no,
+            "frontier": product_urls,
+            "categories": categories or {},
+        }
+        self.frontiers[site_name] = record
+        self.write(record)
+
+    def get_finished(self, site_name: str) -> Optional[Dict]:
+        return self.finished_sites.get(site_name)
+
+    def record_finished(
+        self, site_name: str, product_count: int, max_product_no: Optional[int]
+    ) -> None:
+        record = {
+            "site": site_name,
+            "finished": True,
+            "product_count": product_count,
+            "max_product_no": max_product_no,
+        }
+        self.finished_sites[site_name] = record
+        self.write(record)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def remove(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+# 스크랩 결과를 상품 단위로 받아 바로 내보내는 출력 대상
+# 버퍼가 찰 때마다 기록하므로 전체 결과를 메모리에 모아 둘 필요가 없음
+class ResultSink:
+    def __init__(self, buffer_size: int = 100):
+        self.buffer_size = buffer_size
+        self.buffer: List[Dict] = []
+        self.count = 0
+
+    async def emit(self, product_detail: Dict) -> None:
+        self.buffer.append(product_detail)
+        self.count += 1
+        if len(self.buffer) >= self.buffer_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self.buffer:
+            await self.write(self.buffer)
+            self.buffer = []
+
+    async def write(self, records: List[Dict]) -> None:
+        pass
+
+    def iter_previous_records(self) -> Iterator[Dict]:
+        return iter(())
+
+    async def close(self) -> None:
+        await self.flush()
+
+
+class JsonlSink(ResultSink):
+    def __init__(self, path: Path, buffer_size: int = 100, resume: bool = False):
+        super().__init__(buffer_size=buffer_size)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+
+        # 이어받으면 이전 실행이 남긴 줄 뒤에 이어서 기록
+        self.previous_size = 0
+        if resume and path.exists():
+            self.previous_size = self.trim_partial_line(path)
+        self.file = open(
+            path, mode="a" if self.previous_size else "w", encoding="utf-8"
+        )
+
+    @classmethod
+    def trim_partial_line(cls, path: Path, chunk_size: int = 65536) -> int:
+        # 기록 중에 종료되어 줄바꿈 없이 끝난 마지막 줄을 잘라냄 (파일 끝에서부터 탐색)
+        with open(path, mode="r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - chunk_size)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position != end:
+                f.truncate(position)
+        return position
+
+    async def write(self, records: List[Dict]) -> None:
+        self.file.write(
+            "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        )
+        self.file.flush()
+
+    async def close(self) -> None:
+        await super().close()
+        self.file.close()
+
+    def iter_records(self) -> Iterator[Dict]:
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def iter_previous_records(self) -> Iterator[Dict]:
+        # 이어받기 전에 이미 기록되어 있던 상품만
+        with open(self.path, mode="rb") as f:
+            position = 0
+            for line in f:
+                position += len(line)
+                if position > self.previous_size:
+                    return
+                yield json.loads(line)
+
+
+class ParquetSink(ResultSink):
+    # pyarrow 가 설치된 경우에만 사용, 버퍼 하나가 row group 하나가 됨
+    INTEGER_COLUMNS = {"상품번호", "정가", "판매가"}
+
+    def __init__(self, path: Path, buffer_size: int = 1000, resume: bool = False):
+        super().__init__(buffer_size=buffer_size)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.writer = None
+
+        # Parquet 는 이어 쓸 수 없으므로 이전 파일의 row group 을 새 파일로 옮긴 뒤 이어서 기록
+        # 정상적으로 닫히지 않은 파일은 읽을 수 없어 해당 상품은 다시 스크랩함
+        self.previous_path: Optional[Path] = None
+        if resume and path.exists():
+            self.previous_path = path.with_name(f"{path.stem}.previous{path.suffix}")
+            os.replace(path, self.previous_path)
+            self.restore_previous()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def restore_previous(self) -> None:
+        import pyarrow.parquet as pq
+
+        try:
+            previous = pq.ParquetFile(self.previous_path)
+        except Exception:
+            print(f"이전 결과 파일을 읽을 수 없어 처음부터 기록합니다: '{self.path}'")
+            self.previous_path.unlink(missing_ok=True)
+            self.previous_path = None
+            return
+
+        self.writer = pq.ParquetWriter(self.path, previous.schema_arrow)
+        for i in range(previous.num_row_groups):
+            self.writer.write_table(previous.read_row_group(i))
+        self.count = previous.metadata.num_rows
+
+    async def write(self, records: List[Dict]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns: Dict[str, List] = {}
+        for record in records:
+            for key in record:
+                columns.setdefault(key, [])
+        for record in records:
+            for key, values in columns.items():
+                values.append(record.get(key))
+
+        # 첫 묶음으로 스키마를 정하고 이후 묶음은 그 타입에 맞춰 변환
+        if self.writer is None:
+            schema = pa.schema(
+                [(key, self.infer_type(key, values)) for key, values in columns.items()]
+            )
+            self.writer = pq.ParquetWriter(self.path, schema)
+
+        table = pa.Table.from_pydict(
+            {
+                field.name: [
+                    self.convert_value(value, field.type)
+                    for value in columns.get(field.name, [None] * len(records))
+                ]
+                for field in self.writer.schema
+            },
+            schema=self.writer.schema,
+        )
+        self.writer.write_table(table)
+
+    @classmethod
+    def infer_type(cls, key: str, values: List):
+        import pyarrow as pa
+
+        # 엑셀의 정수 컬럼(Int64)은 가격이 비어 있어도 숫자로 유지
+        if key in cls.INTEGER_COLUMNS:
+            return pa.int64()
+
+        present = [value for value in values if value is not None]
+        if present and all(isinstance(value, bool) for value in present):
+            return pa.bool_()
+        if present and all(
+            isinstance(value, int) and not isinstance(value, bool) for value in present
+        ):
+            return pa.int64()
+        if present and all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in present
+        ):
+            return pa.float64()
+        # 타입이 섞인 컬럼만 문자열로 저장
+        return pa.string()
+
+    @classmethod
+    def convert_value(cls, value: Any, data_type) -> Any:
+        import pyarrow as pa
+
+        if value is None:
+            return None
+        if pa.types.is_integer(data_type) or pa.types.is_floating(data_type):
+            cast = int if pa.types.is_integer(data_type) else float
+            try:
+                return cast(value)
+            except (TypeError, ValueError):
+                return None
+        if pa.types.is_boolean(data_type):
+            return bool(value)
+        return value if isinstance(value, str) else str(value)
+
+    async def close(self) -> None:
+        await super().close()
+        if self.writer is not None:
+            self.writer.close()
+        if self.previous_path is not None:
+            self.previous_path.unlink(missing_ok=True)
+
+    def iter_records(self) -> Iterator[Dict]:
+        yield from self.read_records(self.path)
+
+    def iter_previous_records(self) -> Iterator[Dict]:
+        if self.previous_path is not None:
+            yield from self.read_records(self.previous_path)
+
+    @classmethod
+    def read_records(cls, path: Path) -> Iterator[Dict]:
+        import pyarrow.parquet as pq
+
+        if not path.exists():
+            return
+        for batch in pq.ParquetFile(path).iter_batches():
+            yield from batch.to_pylist()
+
+
+# 상품 저장소로 묶음 단위 반영
+class StoreSink(ResultSink):
+    def __init__(self, store: ProductStore, run_id: str, buffer_size: int = 100):
+        super().__init__(buffer_size=buffer_size)
+        self.store = store
+        self.run_id = run_id
+
+    async def write(self, records: List[Dict]) -> None:
+        await self.store.upsert_products(records, run_id=self.run_id)
+
+
+# 사이트별로 이미 수집한 상품 링크 집합
+# 정규화된 링크의 8바이트 해시를 정렬된 배열로 파일에 저장하고 이진 탐색으로 조회함 (링크당 8바이트)
+class SeenUrlSet:
+    def __init__(self, path: Path):
+        self.path = path
+        self.hashes = (
+            np.fromfile(path, dtype="<u8") if path.exists() else np.empty(0, "<u8")
+        )
+        self.pending: List[int] = []
+
+    @classmethod
+    def for_site(cls, root_path: Path, site_name: str) -> "SeenUrlSet":
+        return cls(root_path / f"{re.sub(r'[^0-9A-Za-z가-힣]+', '_', site_name)}.bin")
+
+    @classmethod
+    def hash_url(cls, url: str) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(url.encode(), digest_size=8).digest(), "little"
+        )
+
+    def __len__(self) -> int:
+        return len(self.hashes) + len(self.pending)
+
+    def contains(self, urls: List[str]) -> np.ndarray:
+        keys = np.array([self.hash_url(url) for url in urls], dtype="<u8")
+        positions = np.searchsorted(self.hashes, keys)
+        found = np.zeros(len(keys), dtype=bool)
+        in_range = positions < len(self.hashes)
+        found[in_range] = self.hashes[positions[in_range]] == keys[in_range]
+        if self.pending:
+            found |= np.isin(keys, np.array(self.pending, dtype="<u8"))
+        return found
+
+    def add(self, url: str) -> None:
+        self.pending.append(self.hash_url(url))
+
+    def save(self) -> None:
+        if not self.pending:
+            return
+        self.hashes = np.union1d(self.hashes, np.array(self.pending, dtype="<u8"))
+        self.pending = []
+
+        # 임시 파일에 쓰고 교체해서 중간에 종료되어도 이전 파일은 유지
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        self.hashes.tofile(temp_path)
+        os.replace(temp_path, self.path)
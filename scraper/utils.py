@@ -1,27 +1,50 @@
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
+import importlib.util
 import sys
+import time
 import traceback
 from io import BytesIO
 from pathlib import Path
-from typing import Union, List, Tuple
+from typing import (
+    Union,
+    List,
+    Tuple,
+    Optional,
+    NamedTuple,
+    Set,
+    Iterable,
+    Callable,
+)
 
 import aiofiles
 import aiohttp
 import nest_asyncio
+import numpy as np
 import openpyxl
 import pandas as pd
 from PIL import Image
 from openpyxl.styles import PatternFill, Font, Border, Side
 from openpyxl.styles.fills import fills
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 from tqdm.asyncio import tqdm
 from datetime import datetime
 from typing_extensions import Dict
 
+from scraper.caches import ImageCache, DetailCache, hash_content
+from scraper.controls import (
+    RateLimiterRegistry,
+    AdaptiveTimeouts,
+    parse_retry_after,
+)
+from scraper.images import ImageInspector, guess_image_extension
+from scraper.stores import ProductStore
 
 if getattr(sys, "frozen", False):
     # test.exe로 실행한 경우,test.exe를 보관한 디렉토리의 full path를 취득
@@ -34,6 +57,36 @@ os.chdir(BASE_DIR)
 
 DEFAULT_DIR_NAME = "종합 상품"
 ILLEGAL_CHAR_PATTERN = r"[\x00\x0B\x0C]"  # 제어 문자 정규식
+IMAGE_CACHE_DIR = BASE_DIR / "cache" / "images"
+PRODUCT_STORE_PATH = BASE_DIR / "스크랩 결과" / "products.sqlite3"
+CHECKPOINT_PATH = BASE_DIR / "스크랩 결과" / "checkpoint.jsonl"
+RESULT_DIR = BASE_DIR / "스크랩 결과" / "데이터"
+SEEN_URL_DIR = BASE_DIR / "cache" / "seen"
+DETAIL_CACHE_PATH = BASE_DIR / "cache" / "details.sqlite3"
+SNAPSHOT_DIR = BASE_DIR / "cache" / "snapshots"
+TIMEOUT_PATH = BASE_DIR / "cache" / "timeouts.json"
+
+# 엑셀 컬럼별 타입 (문자 컬럼의 빈 셀은 "" 로 읽음)
+EXCEL_COLUMN_DTYPES = {
+    "상품번호": "Int64",
+    "사이트": "string",
+    "카테고리": "string",
+    "브랜드": "string",
+    "상품명": "string",
+    "모델명": "string",
+    "정가": "Int64",
+    "판매가": "Int64",
+    "옵션1": "string",
+    "옵션2": "string",
+    "링크": "string",
+    "이미지소스": "string",
+}
+
+_image_cache: Optional[ImageCache] = None
+_product_store: Optional[ProductStore] = None
+_detail_cache: Optional[DetailCache] = None
+_rate_limiters: Optional[RateLimiterRegistry] = None
+_adaptive_timeouts: Optional[AdaptiveTimeouts] = None
 
 
 def setup_asyncio() -> None:
@@ -47,6 +100,41 @@ def setup_datetime(date_format: str = "%Y-%m-%d_%H_%M") -> str:
     return timestamp
 
 
+def get_image_cache() -> ImageCache:
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache(IMAGE_CACHE_DIR)
+    return _image_cache
+
+
+def get_detail_cache() -> DetailCache:
+    global _detail_cache
+    if _detail_cache is None:
+        _detail_cache = DetailCache(DETAIL_CACHE_PATH)
+    return _detail_cache
+
+
+def get_rate_limiters() -> RateLimiterRegistry:
+    global _rate_limiters
+    if _rate_limiters is None:
+        _rate_limiters = RateLimiterRegistry()
+    return _rate_limiters
+
+
+def get_adaptive_timeouts() -> AdaptiveTimeouts:
+    global _adaptive_timeouts
+    if _adaptive_timeouts is None:
+        _adaptive_timeouts = AdaptiveTimeouts(TIMEOUT_PATH)
+    return _adaptive_timeouts
+
+
+def get_product_store() -> ProductStore:
+    global _product_store
+    if _product_store is None:
+        _product_store = ProductStore(PRODUCT_STORE_PATH)
+    return _product_store
+
+
 def setup_logging() -> None:
     output_path = BASE_DIR / "logs"
     output_path.mkdir(parents=True, exist_ok=True)
@@ -225,6 +313,86 @@ async def create_xlsx_file(
     return io
 
 
+async def create_xlsx_file_from_records(
+    records: Callable[[], Iterable[Dict]],
+    file_name: str = DEFAULT_DIR_NAME,
+    sheet_name: str = DEFAULT_DIR_NAME,
+    head_fill_color: str = "4472C4",
+    head_font_color: str = "FFFFFF",
+    body_fill_color: str = "D9E1F2",
+    head_border_color: str = "2E5C99",
+    body_border_color: str = "B4C6E7",
+) -> BytesIO:
+    # 결과 파일을 두 번 읽어서(폭 계산 -> 쓰기) 전체 행을 메모리에 올리지 않고 엑셀 생성
+    # 서식은 create_xlsx_file 과 동일
+    columns: List[str] = []
+    widths: Dict[str, int] = {}
+    for record in records():
+        for key, value in record.items():
+            if key not in widths:
+                columns.append(key)
+                widths[key] = len(str(key))
+            widths[key] = max(widths[key], len(str(value)))
+
+    io = BytesIO()
+    io.name = file_name
+    try:
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+        for index, column in enumerate(columns, start=1):
+            worksheet.column_dimensions[get_column_letter(index)].width = (
+                widths[column] + 2
+            ) * 1.2
+
+        def create_style(fill_color: str, font: Font, border_color: str) -> Dict:
+            side = Side(border_style="thin", color=border_color)
+            return {
+                "fill": PatternFill(
+                    start_color=fill_color, end_color=fill_color, fill_type="solid"
+                ),
+                "font": font,
+                "border": Border(left=side, right=side, top=side, bottom=side),
+            }
+
+        def styled_cell(value, style: Optional[Dict]) -> WriteOnlyCell:
+            cell = WriteOnlyCell(worksheet, value=value)
+            if style:
+                cell.fill = style["fill"]
+                cell.font = style["font"]
+                cell.border = style["border"]
+            return cell
+
+        head_style = create_style(
+            head_fill_color, Font(color=head_font_color, bold=True), head_border_color
+        )
+        body_style = create_style(
+            body_fill_color, Font(color="000000"), body_border_color
+        )
+
+        worksheet.append([styled_cell(column, head_style) for column in columns])
+
+        async for i, record in tqdm(
+            iterable=enumerate(records()), desc=f"{file_name} 엑셀 파일 생성중"
+        ):
+            record = await clean_data(record)
+            style = body_style if i % 2 == 0 else None
+            worksheet.append(
+                [styled_cell(record.get(column), style) for column in columns]
+            )
+
+        workbook.save(io)
+
+    except Exception as e:
+        message = f"엑셀 생성 중에 예외 발생: \n{await get_error_message()}"
+        logger = await get_logger()
+        logger.error(message)
+        print(message)
+        raise e
+
+    io.seek(0)
+    return io
+
+
 async def save_to_xlsx(
     xlsx_file: BytesIO,
     output_path=BASE_DIR / "스크랩 결과" / "엑셀",
@@ -254,35 +422,334 @@ async def save_to_xlsx(
         raise e
 
 
+def get_excel_engine(engine: str = "auto") -> str:
+    # calamine(러스트 기반) 이 설치되어 있으면 우선 사용, 없으면 openpyxl 읽기 전용 스트리밍
+    if engine == "auto":
+        return "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+    return engine
+
+
+def apply_column_dtypes(df: pd.DataFrame, dtype: Dict[str, str]) -> pd.DataFrame:
+    for column, column_dtype in dtype.items():
+        if column not in df.columns:
+            continue
+
+        if column_dtype == "string":
+            df[column] = df[column].fillna("").astype(str).astype("string")
+        elif column_dtype == "Int64":
+            values = pd.to_numeric(df[column], errors="coerce")
+            df[column] = (
+                values.astype("Int64")
+                if (values.dropna() % 1 == 0).all()
+                else values.astype("Float64")
+            )
+        else:
+            df[column] = df[column].astype(column_dtype)
+
+    return df
+
+
+def frame_from_rows(
+    rows: Iterable[tuple],
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame(columns=usecols or [])
+
+    header = [str(name) if name is not None else "" for name in header]
+    positions = [
+        i for i, name in enumerate(header) if usecols is None or name in usecols
+    ]
+    columns = {header[i]: [] for i in positions}
+    names = [header[i] for i in positions]
+
+    # 필요한 컬럼만 모음 (행 번호가 시트와 맞도록 중간의 빈 행은 유지)
+    row_count = 0
+    for count, row in enumerate(rows, start=1):
+        for name, i in zip(names, positions):
+            columns[name].append(row[i] if i < len(row) else None)
+        if any(value is not None for value in row):
+            row_count = count
+
+    df = pd.DataFrame({name: values[:row_count] for name, values in columns.items()})
+    return apply_column_dtypes(df, dtype if dtype is not None else EXCEL_COLUMN_DTYPES)
+
+
+def load_excel_frame(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str] = None,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    engine: str = "auto",
+) -> pd.DataFrame:
+    engine = get_excel_engine(engine)
+    dtype = dtype if dtype is not None else EXCEL_COLUMN_DTYPES
+
+    if engine == "calamine":
+        df = pd.read_excel(
+            file_path,
+            sheet_name=sheet_name if sheet_name is not None else 0,
+            usecols=(lambda name: name in usecols) if usecols else None,
+            engine="calamine",
+        )
+        return apply_column_dtypes(df, dtype)
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name is not None else workbook.active
+        return frame_from_rows(sheet.iter_rows(values_only=True), usecols, dtype)
+    finally:
+        workbook.close()
+
+
+async def read_excel_frame(
+    file_path: Union[str, Path],
+    sheet_name: Optional[str] = None,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    engine: str = "auto",
+) -> pd.DataFrame:
+    start = time.perf_counter()
+    df = await asyncio.to_thread(
+        load_excel_frame, file_path, sheet_name, usecols, dtype, engine
+    )
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"엑셀 로드: '{Path(file_path).name}', {len(df)}행 {len(df.columns)}열, "
+        f"{elapsed:.2f}초 ({get_excel_engine(engine)})"
+    )
+    return df
+
+
+def encode_image_to_file(
+    body: bytes, file_path: Path, target_size: Tuple[int, int]
+) -> None:
+    # 받은 버퍼에서 바로 디코딩하고 파일 핸들에 바로 인코딩 (중간 BytesIO 없음)
+    with Image.open(BytesIO(body)) as image:
+        image = image.resize(target_size)
+        with open(file_path, mode="wb") as f:
+            image.save(f, format="PNG")
+
+
+async def save_image_bytes(
+    body: bytes,
+    image_url: str,
+    file_path: Path,
+    target_size: Optional[Tuple[int, int]],
+    cache: Optional[ImageCache] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    inspector: Optional[ImageInspector] = None,
+    group: str = "",
+) -> None:
+    # 플레이스홀더/깨진 이미지는 인코딩하지 않음
+    if inspector and not await inspector.inspect(body, image_url, group):
+        return
+
+    variant = get_image_variant(target_size)
+    content_hash = hash_content(body) if cache else ""
+    blob_name = await cache.find_blob(content_hash, variant) if cache else None
+
+    if target_size is None:
+        file_path = file_path.with_suffix(guess_image_extension(body))
+
+    # 캐시와 하드링크된 파일을 덮어쓰지 않도록 먼저 삭제
+    file_path.unlink(missing_ok=True)
+
+    if blob_name:
+        # 바이트가 같으면 다시 인코딩하지 않음
+        await cache.materialize(blob_name, file_path)
+        cache.dedup += 1
+    else:
+        if target_size is None:
+            async with aiofiles.open(file_path, mode="wb") as f:
+                await f.write(body)
+        else:
+            await asyncio.to_thread(encode_image_to_file, body, file_path, target_size)
+
+        if cache:
+            cache.misses += 1
+
+    if cache:
+        await cache.store(
+            image_url=image_url,
+            variant=variant,
+            content_hash=content_hash,
+            source_path=file_path,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+
+async def stream_image_to_file(
+    resp: aiohttp.ClientResponse,
+    image_url: str,
+    file_path: Path,
+    cache: Optional[ImageCache] = None,
+    chunk_size: int = 64 * 1024,
+    inspector: Optional[ImageInspector] = None,
+    group: str = "",
+) -> None:
+    # 원본 유지 모드: 본문을 메모리에 모으지 않고 청크 단위로 바로 파일에 기록
+    temp_path = file_path.with_name(f"{file_path.name}.part")
+    digest = hashlib.sha256()
+    size = 0
+    extension = None
+
+    try:
+        async with aiofiles.open(temp_path, mode="wb") as f:
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                if extension is None:
+                    extension = guess_image_extension(chunk, default=file_path.suffix)
+                digest.update(chunk)
+                size += len(chunk)
+                await f.write(chunk)
+    except Exception as e:
+        temp_path.unlink(missing_ok=True)
+        raise e
+
+    # 바꿔 넣기 전에 리사이즈 모드와 같은 기준으로 검사 (플레이스홀더/깨진 이미지 제외)
+    # 본문을 다시 읽지 않고 받으면서 구한 크기/해시를 쓰고, 디코딩은 파일에서 축소해서 함
+    if inspector and not await inspector.inspect_file(
+        temp_path, image_url, group, size=size, content_hash=digest.hexdigest()
+    ):
+        temp_path.unlink(missing_ok=True)
+        return
+
+    file_path = file_path.with_suffix(extension or file_path.suffix)
+    file_path.unlink(missing_ok=True)
+    temp_path.replace(file_path)
+
+    if cache:
+        cache.misses += 1
+        await cache.store(
+            image_url=image_url,
+            variant=get_image_variant(None),
+            content_hash=digest.hexdigest(),
+            source_path=file_path,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+
+async def materialize_cached_image(
+    cache: ImageCache, blob_name: str, file_path: Path, keep_original: bool
+) -> None:
+    if keep_original:
+        with open(cache.blob_path(blob_name), mode="rb") as f:
+            file_path = file_path.with_suffix(guess_image_extension(f.read(16)))
+    await cache.materialize(blob_name, file_path)
+
+
+def get_image_variant(target_size: Optional[Tuple[int, int]]) -> str:
+    return "original" if target_size is None else f"{target_size[0]}x{target_size[1]}"
+
+
 async def download_and_save_image(
     image_url: str,
     output_path: Path,
     filename: str,
-    target_size: Tuple[int, int],
-) -> None:
+    target_size: Optional[Tuple[int, int]],
+    cache: Optional[ImageCache] = None,
+    image_data: Optional[bytes] = None,
+    inspector: Optional[ImageInspector] = None,
+    group: str = "",
+    session: Optional[aiohttp.ClientSession] = None,
+) -> bool:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/91.0.4472.124 Safari/537.36"
     }
+    # target_size 가 None 이면 리사이즈 없이 원본 유지
+    keep_original = target_size is None
+    file_path = output_path / filename
+    variant = get_image_variant(target_size)
+    own_session = session is None
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url, headers=headers) as resp:
-                if resp.status == 200:
-                    image_data = BytesIO(await resp.read())
-                    image = Image.open(image_data)
-                    image = image.resize(target_size)
+        if inspector and not await inspector.check_url(image_url, group):
+            return True
+
+        # 브라우저에서 이미 받은 이미지는 다시 요청하지 않음
+        if image_data is not None:
+            await save_image_bytes(
+                body=image_data,
+                image_url=image_url,
+                file_path=file_path,
+                target_size=target_size,
+                cache=cache,
+                inspector=inspector,
+                group=group,
+            )
+            return True
 
-                    output_image_data = BytesIO()
-                    image.save(output_image_data, format="PNG")
-                    output_image_data.seek(0)
+        cache_entry = await cache.lookup(image_url, variant) if cache else None
+
+        # 최근에 검증된 캐시는 요청 없이 바로 사용
+        if cache_entry and cache.is_fresh(cache_entry):
+            await materialize_cached_image(
+                cache, cache_entry["blob_name"], file_path, keep_original
+            )
+            await cache.touch(cache_entry)
+            cache.hits += 1
+            return True
 
-                    async with aiofiles.open(output_path / filename, mode="wb") as f:
-                        await f.write(output_image_data.read())
+        if cache_entry:
+            headers.update(cache.conditional_headers(cache_entry))
+
+        if own_session:
+            session = aiohttp.ClientSession()
+
+        # 스크랩 중인 페이지 이동과 같은 도메인 속도 제한을 공유
+        async with get_rate_limiters().get(image_url).request() as ticket:
+            async with session.get(image_url, headers=headers) as resp:
+                ticket.status = resp.status
+                ticket.retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if resp.status == 304 and cache_entry:
+                    await materialize_cached_image(
+                        cache, cache_entry["blob_name"], file_path, keep_original
+                    )
+                    await cache.touch(cache_entry, validated=True)
+                    cache.revalidated += 1
+
+                elif resp.status == 200:
+                    if inspector and not await inspector.check_size(
+                        image_url, resp.content_length, group
+                    ):
+                        return True
+
+                    if keep_original:
+                        await stream_image_to_file(
+                            resp=resp,
+                            image_url=image_url,
+                            file_path=file_path,
+                            cache=cache,
+                            inspector=inspector,
+                            group=group,
+                        )
+                    else:
+                        await save_image_bytes(
+                            body=await resp.read(),
+                            image_url=image_url,
+                            file_path=file_path,
+                            target_size=target_size,
+                            cache=cache,
+                            etag=resp.headers.get("ETag"),
+                            last_modified=resp.headers.get("Last-Modified"),
+                            inspector=inspector,
+                            group=group,
+                        )
                 else:
                     message = f"이미지 다운로드 실패: '{filename}', '{image_url}', 상태코드: '{resp.status}'"
                     logger = await get_logger()
                     logger.error(message)
                     print(message)
+                    return False
+
+        return True
 
     except Exception as e:
         message = f"이미지 저장 중 예외 발생: '{filename}'\n{await get_error_message()}"
@@ -290,80 +757,410 @@ async def download_and_save_image(
         logger.error(message)
         print(message)
         # raise e
+        return False
+
+    finally:
+        if own_session and session is not None:
+            await session.close()
+
+
+class ImageJob(NamedTuple):
+    product_no: str
+    index: int
+    url: str
+    filename: str
+
+
+# 이미지 다운로드 진행 기록 (중지된 작업 이어받기용)
+class ImageDownloadManifest:
+    filename = "manifest.jsonl"
+
+    def __init__(self, output_path: Path, source: str = ""):
+        self.path = output_path / self.filename
+        self.source = source
+        self.completed: Set[str] = set()
+        self.finished = False
+
+        if self.path.exists():
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    if "source" in record:
+                        self.source = record["source"]
+                    elif record.get("finished"):
+                        self.finished = True
+                    elif "filename" in record:
+                        self.completed.add(record["filename"])
+            self.file = open(self.path, mode="a", encoding="utf-8")
+        else:
+            self.file = open(self.path, mode="w", encoding="utf-8")
+            self.write({"source": source})
+
+    def write(self, record: Dict) -> None:
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def is_done(self, job: ImageJob) -> bool:
+        return job.filename in self.completed
+
+    def mark_done(self, job: ImageJob) -> None:
+        self.completed.add(job.filename)
+        self.write({"filename": job.filename, "url": job.url})
+
+    def finish(self) -> None:
+        self.finished = True
+        self.write({"finished": True})
+
+    def close(self) -> None:
+        self.file.close()
+
+    @classmethod
+    def find_unfinished(cls, root_path: Path, source: str) -> Optional[Path]:
+        # 같은 엑셀로 시작했다가 끝나지 않은 가장 최근 작업 폴더
+        if not root_path.exists():
+            return None
+
+        for output_path in sorted(root_path.iterdir(), reverse=True):
+            manifest_path = output_path / cls.filename
+            if not manifest_path.exists():
+                continue
+
+            manifest = cls(output_path)
+            manifest.close()
+            if manifest.source == source and not manifest.finished:
+                return output_path
+
+        return None
+
+
+def build_image_jobs(
+    product_nos: pd.Series,
+    image_sources: pd.Series,
+    separator: str = ";\n",
+    extension: str = ".png",
+) -> List[ImageJob]:
+    # 행 단위 반복 없이 split/explode 로 (상품번호, 순번, URL) 목록 생성
+    sources = pd.DataFrame(
+        {"상품번호": product_nos.astype(str), "이미지소스": image_sources}
+    ).dropna(subset=["이미지소스"])
+
+    sources["이미지소스"] = sources["이미지소스"].astype(str).str.split(separator)
+    # 순번/_N 접미사는 셀 안의 원래 위치 기준 (빈 값/중복을 빼도 update_image_match 와 번호가 맞도록)
+    multiple = sources["이미지소스"].str.len() > 1
+    sources = sources.explode("이미지소스")
+    sources["순번"] = sources.groupby(level=0).cumcount()
+    sources["여러장"] = multiple.reindex(sources.index).to_numpy()
+
+    sources["이미지소스"] = sources["이미지소스"].str.strip()
+    keep = (sources["이미지소스"] != "") & ~sources.duplicated(
+        subset=["상품번호", "이미지소스"]
+    )
+    sources = sources[keep.to_numpy()]
+
+    sources["파일명"] = (
+        sources["상품번호"].where(
+            ~sources["여러장"],
+            sources["상품번호"] + "_" + (sources["순번"] + 1).astype(str),
+        )
+        + extension
+    )
+
+    return [
+        ImageJob(product_no, index, url, filename)
+        for product_no, index, url, filename in zip(
+            sources["상품번호"],
+            sources["순번"],
+            sources["이미지소스"],
+            sources["파일명"],
+        )
+    ]
+
+
+async def download_image_jobs(
+    jobs: List[ImageJob],
+    output_path: Path,
+    target_size: Optional[Tuple[int, int]] = (800, 800),
+    cache: Optional[ImageCache] = None,
+    inspector: Optional[ImageInspector] = None,
+    captured_images: Optional[Dict[str, bytes]] = None,
+    manifest: Optional[ImageDownloadManifest] = None,
+    concurrency: int = 8,
+    desc: str = " 이미지 다운로드 중",
+) -> None:
+    captured_images = captured_images if captured_images is not None else {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    if manifest:
+        jobs = [job for job in jobs if not manifest.is_done(job)]
+
+    async def run_job(session: aiohttp.ClientSession, job: ImageJob) -> None:
+        async with semaphore:
+            done = await download_and_save_image(
+                image_url=job.url,
+                output_path=output_path,
+                filename=job.filename,
+                target_size=target_size,
+                cache=cache,
+                image_data=captured_images.pop(job.url, None),
+                inspector=inspector,
+                group=job.product_no,
+                session=session,
+            )
+        if done and manifest:
+            manifest.mark_done(job)
+
+    async with aiohttp.ClientSession() as session:
+        tasks = [run_job(session, job) for job in jobs]
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc=desc):
+            await task
+
+
+def get_image_output_path(dirname: str = DEFAULT_DIR_NAME) -> Path:
+    timestamp = setup_datetime("%Y-%m-%d_%H_%M")
+    output_path = BASE_DIR / "스크랩 결과" / "이미지" / dirname / f"{timestamp}"
+    output_path.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+def build_product_image_jobs(
+    product_no: Union[int, str],
+    image_url: Union[str, List[str], None],
+    extension: str = ".png",
+) -> List[ImageJob]:
+    # 이미지가 여러 장이면 {상품번호}_{순번}, 한 장이면 {상품번호}
+    product_no = str(product_no)
+    if isinstance(image_url, list):
+        return [
+            ImageJob(product_no, j, url, f"{product_no}_{j + 1}{extension}")
+            for j, url in enumerate(image_url)
+        ]
+    if image_url:
+        return [ImageJob(product_no, 0, image_url, f"{product_no}{extension}")]
+    return []
 
 
 async def download_images(
     image_urls: Union[List[str], List[List[str]]],
     dirname: str = DEFAULT_DIR_NAME,
     start_no: int = 1,
-    target_size: Tuple[int, int] = (800, 800),
+    target_size: Optional[Tuple[int, int]] = (800, 800),
+    use_cache: bool = True,
+    captured_images: Optional[Dict[str, bytes]] = None,
+    inspect_images: bool = True,
+    concurrency: int = 8,
 ) -> None:
 
     if image_urls:
-        timestamp = setup_datetime("%Y-%m-%d_%H_%M")
+        cache = get_image_cache() if use_cache else None
+        inspector = ImageInspector() if inspect_images else None
+        output_path = get_image_output_path(dirname)
+
+        jobs = []
+        for i, image_url in enumerate(image_urls):
+            jobs.extend(build_product_image_jobs(start_no + i, image_url))
+
+        await download_image_jobs(
+            jobs=jobs,
+            output_path=output_path,
+            target_size=target_size,
+            cache=cache,
+            inspector=inspector,
+            captured_images=captured_images,
+            concurrency=concurrency,
+        )
 
-        output_path = BASE_DIR / "스크랩 결과" / "이미지" / dirname / f"{timestamp}"
-        output_path.mkdir(parents=True, exist_ok=True)
-        extension = ".png"
+        if cache:
+            # 정리 간격에 못 미친 마지막 저장분까지 용량 정리
+            await cache.evict()
+            print(cache.summary())
+        if inspector:
+            await report_image_inspection(inspector)
+
+
+# 스크랩 중에 상품이 나올 때마다 이미지를 받는 백그라운드 다운로드 큐
+# 파일명 규칙은 download_images 와 같음
+class ImageDownloadQueue:
+    def __init__(
+        self,
+        dirname: str = DEFAULT_DIR_NAME,
+        target_size: Optional[Tuple[int, int]] = (800, 800),
+        use_cache: bool = True,
+        captured_images: Optional[Dict[str, bytes]] = None,
+        inspect_images: bool = True,
+        concurrency: int = 8,
+    ):
+        self.dirname = dirname
+        self.target_size = target_size
+        self.cache = get_image_cache() if use_cache else None
+        self.inspector = ImageInspector() if inspect_images else None
+        self.captured_images = captured_images if captured_images is not None else {}
+        self.concurrency = concurrency
+
+        self.output_path: Optional[Path] = None
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.workers: List[asyncio.Task] = []
+        self.progress: Optional[tqdm] = None
+        self.failed: List[ImageJob] = []
+
+    async def start(self) -> None:
+        self.output_path = get_image_output_path(self.dirname)
+        self.session = aiohttp.ClientSession()
+        self.progress = tqdm(total=0, desc=" 이미지 다운로드 중")
+        self.workers = [
+            asyncio.create_task(self.worker()) for _ in range(self.concurrency)
+        ]
 
-        for i, image_url in tqdm(
-            enumerate(image_urls),
-            total=len(image_urls),
-            desc=f" 이미지 다운로드 중",
-        ):
-            if isinstance(image_url, list):
-                for j, url in enumerate(image_url):
-                    await download_and_save_image(
-                        image_url=url,
-                        output_path=output_path,
-                        filename=f"{start_no + i}_{j + 1}{extension}",
-                        target_size=target_size,
-                    )
-            else:
-                await download_and_save_image(
-                    image_url=image_url,
-                    output_path=output_path,
-                    filename=f"{start_no + i}{extension}",
-                    target_size=target_size,
+    async def put(
+        self, product_no: Union[int, str], image_url: Union[str, List[str], None]
+    ) -> None:
+        jobs = build_product_image_jobs(product_no, image_url)
+        self.progress.total += len(jobs)
+        self.progress.refresh()
+        for job in jobs:
+            self.queue.put_nowait(job)
+
+    async def worker(self) -> None:
+        while True:
+            job = await self.queue.get()
+            try:
+                done = await download_and_save_image(
+                    image_url=job.url,
+                    output_path=self.output_path,
+                    filename=job.filename,
+                    target_size=self.target_size,
+                    cache=self.cache,
+                    image_data=self.captured_images.pop(job.url, None),
+                    inspector=self.inspector,
+                    group=job.product_no,
+                    session=self.session,
                 )
+                if not done:
+                    self.failed.append(job)
+            except Exception:
+                message = f"이미지 다운로드 중 예외 발생: '{job.url}'\n{await get_error_message()}"
+                logger = await get_logger()
+                logger.error(message)
+                self.failed.append(job)
+            finally:
+                self.progress.update(1)
+                self.queue.task_done()
+
+    async def join(self) -> None:
+        # 남은 이미지를 모두 받을 때까지 기다린 뒤 정리
+        await self.queue.join()
+        await self.close()
+
+        if self.cache:
+            # 정리 간격에 못 미친 마지막 저장분까지 용량 정리
+            await self.cache.evict()
+            print(self.cache.summary())
+        if self.inspector:
+            await report_image_inspection(self.inspector)
+
+    async def close(self) -> None:
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.progress is not None:
+            self.progress.close()
+
+
+async def report_image_inspection(inspector: ImageInspector) -> None:
+    # 항목별 내용은 로그에만 남기고 화면에는 사유별 건수만 출력
+    details = inspector.details()
+    if details:
+        logger = await get_logger()
+        logger.warning(details)
+    print(inspector.summary())
 
 
 async def read_data_info_excel_and_download_images(
     file_path: str,
     sheet_name: str = DEFAULT_DIR_NAME,
-    target_size: Tuple[int, int] = (800, 800),
+    target_size: Optional[Tuple[int, int]] = (800, 800),
+    use_cache: bool = True,
+    inspect_images: bool = True,
+    concurrency: int = 8,
+    resume: bool = True,
 ) -> None:
 
-    df = pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
+    df = await read_excel_frame(
+        file_path, sheet_name=sheet_name, usecols=["상품번호", "이미지소스"]
+    )
 
     if not df.empty:
-        timestamp = setup_datetime("%Y-%m-%d_%H_%M")
+        cache = get_image_cache() if use_cache else None
+        inspector = ImageInspector() if inspect_images else None
 
-        output_path = BASE_DIR / "스크랩 이미지 업데이트" / "이미지" / timestamp
+        root_path = BASE_DIR / "스크랩 이미지 업데이트" / "이미지"
+        source = f"{Path(file_path).resolve()}::{sheet_name}::{get_image_variant(target_size)}"
+
+        # 중지된 작업이 있으면 같은 폴더에서 남은 이미지만 받음
+        output_path = (
+            ImageDownloadManifest.find_unfinished(root_path, source) if resume else None
+        )
+        if output_path is None:
+            output_path = root_path / setup_datetime("%Y-%m-%d_%H_%M")
         output_path.mkdir(parents=True, exist_ok=True)
-        extension = ".png"
 
-        for _, row in tqdm(
-            df.iterrows(), total=len(df), desc=f"'{sheet_name}' 이미지 다운로드 중"
-        ):
+        manifest = ImageDownloadManifest(output_path, source=source)
+        jobs = build_image_jobs(df["상품번호"], df["이미지소스"])
+
+        try:
+            await download_image_jobs(
+                jobs=jobs,
+                output_path=output_path,
+                target_size=target_size,
+                cache=cache,
+                inspector=inspector,
+                manifest=manifest,
+                concurrency=concurrency,
+                desc=f"'{sheet_name}' 이미지 다운로드 중",
+            )
+            if len(manifest.completed) >= len(jobs):
+                manifest.finish()
+        finally:
+            manifest.close()
+
+        if cache:
+            # 정리 간격에 못 미친 마지막 저장분까지 용량 정리
+            await cache.evict()
+            print(cache.summary())
+        if inspector:
+            await report_image_inspection(inspector)
+
+
+def select_image_sources(
+    image_sources: pd.Series, image_num_list: List[int], separator: str = ","
+) -> pd.Series:
+    # 행마다 image_num_list 번째 URL 선택 (범위를 벗어나거나 비어 있으면 제외)
+    count = min(len(image_sources), len(image_num_list))
+    if count == 0:
+        return pd.Series(dtype=object)
+
+    parts = (
+        image_sources.iloc[:count]
+        .fillna("")
+        .astype(str)
+        .str.split(separator, expand=True)
+    )
+    image_nums = np.asarray(image_num_list[:count], dtype=np.int64)
+    valid = (image_nums >= 0) & (image_nums < parts.notna().sum(axis=1).to_numpy())
 
-            image_src = row["이미지소스"]
-            image_src = image_src.split(";\n")
-            if isinstance(image_src, list) and len(image_src) > 1:
-                for i, src in enumerate(image_src):
-                    await download_and_save_image(
-                        image_url=src,
-                        output_path=output_path,
-                        filename=f"{row['상품번호']}_{i + 1}{extension}",
-                        target_size=target_size,
-                    )
-            else:
-                await download_and_save_image(
-                    image_url=row["이미지소스"],
-                    output_path=output_path,
-                    filename=f"{row['상품번호']}{extension}",
-                    target_size=target_size,
-                )
+    positions = np.clip(image_nums, 0, parts.shape[1] - 1)[:, None]
+    selected = np.take_along_axis(parts.to_numpy(dtype=object), positions, axis=1)[:, 0]
+
+    selected = (
+        pd.Series(selected, index=parts.index, dtype=object).where(valid).dropna()
+    )
+    # 이미지소스가 빈 행은 빈 값을 쓰거나 빈 URL 을 받지 않도록 건너뜀
+    return selected[selected.astype(str).str.strip() != ""]
 
 
 # 거의 사용 안해서 함수 빼놨음
@@ -371,45 +1168,64 @@ async def update_image_sources(
     file_path: str,
     image_num_list: List[int],
     sheet_name: str = DEFAULT_DIR_NAME,
-    target_size: Tuple[int, int] = (800, 800),
+    target_size: Optional[Tuple[int, int]] = (800, 800),
+    use_cache: bool = True,
+    inspect_images: bool = True,
+    concurrency: int = 8,
+    download: bool = True,
 ) -> None:
 
-    # 기존 코드
-    df = pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
+    # 엑셀 파일은 한 번만 열고, 같은 워크북에서 데이터프레임 생성
+    workbook = openpyxl.load_workbook(file_path)
+    sheet = workbook[sheet_name]
 
-    if not df.empty:
+    header = next(sheet.iter_rows(max_row=1, values_only=True), None)
+    if header is None:
+        return
+
+    df = frame_from_rows(
+        sheet.iter_rows(values_only=True), usecols=["상품번호", "이미지소스"]
+    )
+    if df.empty:
+        return
+
+    selected_sources = select_image_sources(df["이미지소스"], image_num_list)
+
+    # 엑셀 파일 업데이트 (셀 변경 후 한 번에 저장)
+    source_column = list(header).index("이미지소스") + 1
+    for idx, image_src in selected_sources.items():
+        sheet.cell(row=idx + 2, column=source_column).value = image_src
+
+    if download and not selected_sources.empty:
         timestamp = setup_datetime("%Y-%m-%d_%H_%M")
 
         output_path = BASE_DIR / "스크랩 이미지 업데이트" / "이미지" / timestamp
         output_path.mkdir(parents=True, exist_ok=True)
         extension = ".png"
 
-        # 엑셀 파일 열기
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook[sheet_name]
-
-        for idx, row in tqdm(
-            df.iterrows(), total=len(df), desc=f"'{sheet_name}' 이미지 다운로드 중"
-        ):
-            image_src = row["이미지소스"]
-            image_src = image_src.split(",")
-            if isinstance(image_src, list) and image_num_list:
-
-                image_num = image_num_list[idx]  # noqa
-                image_src = image_src[image_num]
-
-                # 엑셀 파일 업데이트
-                cell = sheet.cell(
-                    row=idx + 2, column=df.columns.get_loc("이미지소스") + 1  # noqa
-                )
-                cell.value = image_src
+        product_nos = df.loc[selected_sources.index, "상품번호"].astype(str)
+        jobs = [
+            ImageJob(product_no, 0, image_src, f"{product_no}{extension}")
+            for product_no, image_src in zip(product_nos, selected_sources)
+        ]
+        cache = get_image_cache() if use_cache else None
+        inspector = ImageInspector() if inspect_images else None
+        await download_image_jobs(
+            jobs=jobs,
+            output_path=output_path,
+            target_size=target_size,
+            cache=cache,
+            inspector=inspector,
+            concurrency=concurrency,
+            desc=f"'{sheet_name}' 이미지 다운로드 중",
+        )
 
-                await download_and_save_image(
-                    image_url=image_src,
-                    output_path=output_path,
-                    filename=f"{row['상품번호']}{extension}",
-                    target_size=target_size,
-                )
+        if cache:
+            # 정리 간격에 못 미친 마지막 저장분까지 용량 정리
+            await cache.evict()
+            print(cache.summary())
+        if inspector:
+            await report_image_inspection(inspector)
 
-        # 엑셀 파일 저장
-        workbook.save(file_path)
+    # 엑셀 파일 저장
+    workbook.save(file_path)
@@ -0,0 +1,213 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from scraper.caches import (
+    DetailCache,
+    ImageCache,
+    canonicalize_url,
+    normalize_image_url,
+)
+from scraper.utils import save_image_bytes
+
+
+class NormalizeImageUrlTest(unittest.TestCase):
+    def test_equivalent_urls_share_a_key(self):
+        self.assertEqual(
+            normalize_image_url("//CDN.Example.com:443/a.jpg?b=2&a=1#top"),
+            "https://cdn.example.com/a.jpg?a=1&b=2",
+        )
+        self.assertEqual(
+            ImageCache.url_key("https://cdn.example.com/a.jpg?a=1&b=2"),
+            ImageCache.url_key("https://CDN.example.com/a.jpg?b=2&a=1"),
+        )
+
+    def test_empty_path_becomes_root(self):
+        self.assertEqual(normalize_image_url("http://a.com"), "http://a.com/")
+
+
+class CanonicalizeUrlTest(unittest.TestCase):
+    def test_host_scheme_and_path_are_unified(self):
+        expected = "https://shop.com/p/1"
+        for url in [
+            "http://www.shop.com/p/1",
+            "https://m.shop.com:443/p/1/",
+            "HTTPS://WWW.SHOP.COM//p//1#reviews",
+            " https://shop.com/p/1 ",
+        ]:
+            self.assertEqual(canonicalize_url(url), expected)
+
+    def test_relative_urls_are_joined(self):
+        self.assertEqual(
+            canonicalize_url("/p/1?b=2&a=1", base_url="https://www.shop.com/list"),
+            "https://shop.com/p/1?a=1&b=2",
+        )
+
+    def test_tracking_params_are_dropped(self):
+        self.assertEqual(
+            canonicalize_url("https://shop.com/p?id=3&utm_source=x&fbclid=y&ref=home"),
+            "https://shop.com/p?id=3",
+        )
+
+    def test_keep_params_keeps_only_given_params(self):
+        url = "https://shop.com/p?id=3&color=red&sort=new"
+        self.assertEqual(
+            canonicalize_url(url, keep_params=["id"]), "https://shop.com/p?id=3"
+        )
+        self.assertEqual(canonicalize_url(url, keep_params=[]), "https://shop.com/p")
+
+
+class ImageCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root_path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.cache.connection.close()
+        self.directory.cleanup()
+
+    def write_source(self, name: str, size: int) -> Path:
+        path = self.root_path / name
+        path.write_bytes(b"x" * size)
+        return path
+
+    async def test_store_and_lookup(self):
+        self.cache = ImageCache(self.root_path / "cache", max_age=60)
+        source = self.write_source("a.png", 10)
+        await self.cache.store(
+            "https://a.com/a.png", "original", "hash-a", source, etag='"v1"'
+        )
+
+        entry = await self.cache.lookup("https://A.com/a.png", "original")
+        self.assertEqual(entry["blob_name"], "hash-a_original")
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertEqual(
+            ImageCache.conditional_headers(entry), {"If-None-Match": '"v1"'}
+        )
+        self.assertEqual(
+            await self.cache.find_blob("hash-a", "original"), "hash-a_original"
+        )
+        self.assertIsNone(await self.cache.lookup("https://a.com/a.png", "800x800"))
+
+        entry["validated_at"] = time.time() - 120
+        self.assertFalse(self.cache.is_fresh(entry))
+
+    async def test_missing_blob_drops_entry(self):
+        self.cache = ImageCache(self.root_path / "cache")
+        await self.cache.store(
+            "https://a.com/a.png", "original", "hash-a", self.write_source("a", 10)
+        )
+        self.cache.blob_path("hash-a_original").unlink()
+        self.assertIsNone(await self.cache.lookup("https://a.com/a.png", "original"))
+
+    async def test_eviction_runs_every_100_stores(self):
+        self.cache = ImageCache(self.root_path / "cache", max_bytes=50)
+        for i in range(99):
+            await self.cache.store(
+                f"https://a.com/{i}.png",
+                "original",
+                f"hash-{i}",
+                self.write_source(f"{i}", 10),
+            )
+        (count,) = self.cache.connection.execute(
+            "SELECT COUNT(*) FROM image_cache"
+        ).fetchone()
+        self.assertEqual(count, 99)
+
+        await self.cache.store(
+            "https://a.com/99.png", "original", "hash-99", self.write_source("99", 10)
+        )
+        rows = self.cache.connection.execute(
+            "SELECT url FROM image_cache ORDER BY accessed_at"
+        ).fetchall()
+        self.assertEqual(len(rows), 5)
+        # 가장 최근에 쓴 항목이 남음
+        self.assertEqual(rows[-1]["url"], "https://a.com/99.png")
+
+    async def test_same_bytes_from_another_url_count_as_dedup(self):
+        self.cache = ImageCache(self.root_path / "cache")
+        body = b"\x89PNG\r\n\x1a\n" + b"0" * 100
+        output_path = self.root_path / "out"
+        output_path.mkdir()
+
+        for i in range(2):
+            await save_image_bytes(
+                body=body,
+                image_url=f"https://a.com/{i}.png",
+                file_path=output_path / f"{i}.png",
+                target_size=None,
+                cache=self.cache,
+            )
+
+        self.assertEqual((self.cache.misses, self.cache.dedup), (1, 1))
+        self.assertEqual(self.cache.revalidated, 0)
+        self.assertEqual((output_path / "1.png").read_bytes(), body)
+
+
+class DetailCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DetailCache(
+            Path(self.directory.name) / "details.sqlite3", max_entries=3
+        )
+
+    def tearDown(self):
+        self.cache.connection.close()
+        self.directory.cleanup()
+
+    def count_entries(self) -> int:
+        return self.cache.connection.execute(
+            "SELECT COUNT(*) FROM detail_cache"
+        ).fetchone()[0]
+
+    async def test_hit_miss_and_expired_counters(self):
+        detail = {"상품명": "가방", "판매가": 1000}
+        await self.cache.store("테스트", "https://shop.com/p/1", "가방", detail, ["a"])
+
+        self.assertEqual(
+            await self.cache.lookup("테스트", "https://shop.com/p/1", ttl=60),
+            (detail, ["a"], "가방"),
+        )
+        self.assertIsNone(await self.cache.lookup("테스트", "https://shop.com/p/2", 60))
+        self.assertIsNone(
+            await self.cache.lookup("다른사이트", "https://shop.com/p/1", 60)
+        )
+        self.assertIsNone(await self.cache.lookup("테스트", "https://shop.com/p/1", 0))
+
+        self.assertEqual(
+            (self.cache.hits, self.cache.misses, self.cache.expired), (1, 2, 1)
+        )
+        self.assertEqual(
+            self.cache.summary(), "상세 정보 캐시 적중: 1, 만료: 1, 미적중: 2"
+        )
+
+    async def test_evict_keeps_recently_accessed_entries(self):
+        for i in range(5):
+            await self.cache.store("테스트", f"u{i}", "가방", {"i": i}, None)
+        self.assertEqual(self.count_entries(), 5)  # 1000건마다만 정리
+
+        # 가장 먼저 저장한 항목을 다시 조회하면 정리 대상에서 빠짐
+        self.cache.connection.execute(
+            "UPDATE detail_cache SET accessed_at = accessed_at - 100 WHERE url != 'u4'"
+        )
+        await self.cache.lookup("테스트", "u0", ttl=60)
+        await self.cache.evict()
+
+        urls = {
+            row["url"]
+            for row in self.cache.connection.execute("SELECT url FROM detail_cache")
+        }
+        self.assertEqual(len(urls), 3)
+        self.assertIn("u0", urls)
+        self.assertIn("u4", urls)
+
+    async def test_periodic_evict_every_thousand_stores(self):
+        for i in range(1000):
+            await self.cache.store("테스트", f"u{i}", "가방", {}, None)
+        self.assertEqual(self.cache.stores, 1000)
+        self.assertEqual(self.count_entries(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from scraper.controls import (
+    AdaptiveTimeouts,
+    CircuitBreaker,
+    DomainRateLimiter,
+    LatencyRecorder,
+    RetryPolicy,
+    percentile,
+)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_consecutive_failures_degrade_then_open(self):
+        breaker = CircuitBreaker("테스트", consecutive_limit=3, min_samples=100)
+        for _ in range(2):
+            self.assertEqual(breaker.record_failure(), CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.record_failure(), CircuitBreaker.DEGRADED)
+        self.assertTrue(breaker.is_degraded)
+        self.assertEqual(breaker.trip_reason, "연속 실패 3회")
+
+        # 성공이 끼면 연속 횟수는 처음부터
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertTrue(breaker.is_degraded)
+        self.assertEqual(breaker.record_failure(), CircuitBreaker.OPEN)
+        self.assertTrue(breaker.is_open)
+
+    def test_failure_rate_over_window_trips(self):
+        breaker = CircuitBreaker(
+            "테스트", consecutive_limit=100, failure_rate=0.5, window=10, min_samples=4
+        )
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)  # 표본 부족
+        self.assertEqual(breaker.record_failure(), CircuitBreaker.DEGRADED)
+        self.assertEqual(breaker.trip_reason, "최근 4건 중 실패율 50%")
+        self.assertEqual(len(breaker.recent), 0)
+
+    def test_summary_groups_reasons(self):
+        breaker = CircuitBreaker("테스트", consecutive_limit=100, min_samples=100)
+        breaker.record_success()
+        breaker.record_failure(TimeoutError("Timeout 3000ms exceeded.\n상세"))
+        breaker.record_failure(TimeoutError("Timeout 3000ms exceeded."))
+        breaker.record_failure(ValueError())
+        breaker.record_skip()
+
+        self.assertEqual(
+            breaker.summary().splitlines(),
+            [
+                "'테스트' 상세 페이지: 성공 1건, 실패 3건, 미방문 1건, 상태: 정상",
+                "  [2건] TimeoutError: Timeout 3000ms exceeded.",
+                "  [1건] ValueError: ",
+            ],
+        )
+
+
+class PercentileTest(unittest.TestCase):
+    def test_nearest_rank(self):
+        samples = list(range(100, 0, -1))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 90), 90)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile(samples, 0), 1)
+        self.assertEqual(percentile(samples, 100), 100)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertIsNone(percentile([], 50))
+
+
+class LatencyRecorderTest(unittest.TestCase):
+    def test_histogram_buckets_and_window(self):
+        recorder = LatencyRecorder("테스트", window=3)
+        for elapsed_ms in [50, 100, 101, 40000]:
+            recorder.record("goto", elapsed_ms)
+
+        self.assertEqual(recorder.histograms["goto"], [2, 1, 0, 0, 0, 0, 0, 0, 1])
+        # 백분위는 최근 window 건만 사용
+        self.assertEqual(list(recorder.samples["goto"]), [100, 101, 40000])
+        self.assertEqual(recorder.percentile("goto", 50), 101)
+        self.assertIsNone(recorder.percentile("selector", 50))
+
+        summary = recorder.summary().splitlines()
+        self.assertEqual(
+            summary[0],
+            "'테스트' 페이지 이동 4건: p50 101ms, p90 40,000ms, p99 40,000ms",
+        )
+        self.assertEqual(len(summary), 4)
+
+    def test_measure_skips_failed_operations(self):
+        recorder = LatencyRecorder("테스트")
+        with recorder.measure("extract"):
+            pass
+        with self.assertRaises(ValueError):
+            with recorder.measure("extract"):
+                raise ValueError()
+        self.assertEqual(sum(recorder.histograms["extract"]), 1)
+
+
+class DomainRateLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_while_waiting_for_token_releases_slot(self):
+        limiter = DomainRateLimiter("example.com", rate=1.0, concurrency=2)
+        limiter.tokens = 0.0  # 다음 토큰까지 약 1초 대기
+
+        async def request():
+            async with limiter.request():
+                pass
+
+        task = asyncio.create_task(request())
+        await asyncio.sleep(0.05)
+        self.assertEqual(limiter.in_flight, 1)
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_cancelled_while_waiting_for_slot_does_not_leak(self):
+        limiter = DomainRateLimiter("example.com", rate=100.0, concurrency=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.request():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.05)
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.05)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        await holder
+        self.assertEqual(limiter.in_flight, 0)
+
+        # 남은 자리가 없으면 여기서 멈춤
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        self.assertEqual(limiter.in_flight, 1)
+
+
+class DomainRateLimiterLoopTest(unittest.TestCase):
+    def test_limiter_is_reusable_across_event_loops(self):
+        # 전역 레지스트리의 제한기를 asyncio.run 을 여러 번 호출해 사용하는 경우
+        limiter = DomainRateLimiter(
+            "example.com", rate=100.0, concurrency=1, max_concurrency=1
+        )
+
+        async def run():
+            async def request():
+                async with limiter.request():
+                    await asyncio.sleep(0.01)
+
+            # 동시 요청 한 개라서 두 번째 요청은 Condition 에서 기다림
+            await asyncio.gather(request(), request())
+
+        asyncio.run(run())
+        asyncio.run(run())
+        self.assertEqual(limiter.requests, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+class AdaptiveTimeoutsTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "timeouts.json"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def make_timeouts(self) -> AdaptiveTimeouts:
+        return AdaptiveTimeouts(
+            self.path, window=10, min_samples=5, min_timeout=1000, max_timeout=20000
+        )
+
+    def test_default_until_enough_samples_then_clamped(self):
+        timeouts = self.make_timeouts()
+        for _ in range(4):
+            timeouts.observe("테스트", "goto", 500)
+        self.assertEqual(timeouts.get("테스트", "goto", default=15000), 15000)
+
+        timeouts.observe("테스트", "goto", 800)
+        self.assertEqual(timeouts.get("테스트", "goto", default=15000), 2400)
+
+        # 최근 window 건만 사용하고 하한/상한으로 제한
+        for _ in range(10):
+            timeouts.observe("테스트", "goto", 100)
+        self.assertEqual(timeouts.get("테스트", "goto", default=15000), 1000)
+        for _ in range(10):
+            timeouts.observe("테스트", "goto", 10000)
+        self.assertEqual(timeouts.get("테스트", "goto", default=15000), 20000)
+        self.assertEqual(timeouts.get("다른사이트", "goto", default=15000), 15000)
+
+    def test_save_and_reload(self):
+        timeouts = self.make_timeouts()
+        for elapsed_ms in [400, 500, 600, 700, 1000]:
+            timeouts.observe("테스트", "selector", elapsed_ms)
+        timeouts.observe("테스트", "goto", 100)
+        timeouts.save()
+        self.assertFalse(self.path.with_suffix(".tmp").exists())
+
+        loaded = self.make_timeouts()
+        self.assertEqual(loaded.get("테스트", "selector", default=0), 3000)
+        self.assertEqual(
+            loaded.summary("테스트"), "'테스트' 학습된 timeout: 요소 대기 3,000ms"
+        )
+
+    def test_broken_file_is_ignored(self):
+        self.path.write_text("{", encoding="utf-8")
+        timeouts = self.make_timeouts()
+        self.assertEqual(timeouts.get("테스트", "goto", default=15000), 15000)
+        self.assertEqual(timeouts.summary("테스트"), "")
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_budget_scales_with_site_size(self):
+        policy = RetryPolicy(budget_ratio=0.1, min_budget=10)
+        policy.start(50)
+        self.assertEqual(policy.budget, 10)
+        policy.start(500)
+        self.assertEqual(policy.budget, 50)
+
+    def test_attempts_and_budget_limit_retries(self):
+        policy = RetryPolicy(max_attempts=3, min_budget=2)
+        policy.start(0)
+        self.assertTrue(policy.can_retry(1))
+        self.assertTrue(policy.can_retry(2))
+        self.assertFalse(policy.can_retry(3))
+
+        self.assertTrue(policy.consume())
+        self.assertTrue(policy.consume())
+        self.assertFalse(policy.consume())
+        self.assertFalse(policy.can_retry(1))
+        self.assertEqual(policy.retries, 2)
+        self.assertEqual(
+            policy.summary("테스트"),
+            "'테스트' 재시도 2건 (예산 2건), 재시도로 복구 0건",
+        )
+
+    def test_delay_is_exponential_capped_and_jittered(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        for attempt, upper in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+            for _ in range(20):
+                delay = policy.delay(attempt)
+                self.assertGreaterEqual(delay, upper * 0.5)
+                self.assertLessEqual(delay, upper)
+
+
+if __name__ == "__main__":
+    unittest.main()
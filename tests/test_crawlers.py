@@ -0,0 +1,166 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from scraper.scrap_crawlers import DetailPageRing, ScrapUtil
+
+
+class FakeResponse:
+    def __init__(self, url: str, page=None, body: bytes = b"image"):
+        self.url = url
+        self.ok = True
+        self.request = SimpleNamespace(resource_type="image")
+        self.frame = SimpleNamespace(page=page)
+        self.data = body
+
+    async def body(self) -> bytes:
+        return self.data
+
+
+class CaptureImagesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_captures_matching_responses(self):
+        scraper = ScrapUtil(capture_images=True, use_detail_cache=False)
+        scraper.on_image_response(
+            FakeResponse("https://CDN.a.com/1.jpg?b=1&a=2", body=b"one")
+        )
+
+        await scraper.capture_product_images(
+            ["//cdn.a.com/1.jpg?a=2&b=1", "https://cdn.a.com/2.jpg"]
+        )
+
+        self.assertEqual(scraper.captured_images, {"//cdn.a.com/1.jpg?a=2&b=1": b"one"})
+        self.assertEqual(scraper.image_responses, {})
+
+    async def test_clear_keeps_other_tabs_responses(self):
+        scraper = ScrapUtil(capture_images=True, use_detail_cache=False)
+        current, prefetching = object(), object()
+        scraper.on_image_response(FakeResponse("https://a.com/1.jpg", page=current))
+        scraper.on_image_response(FakeResponse("https://a.com/2.jpg", page=prefetching))
+
+        await scraper.capture_product_images("https://a.com/1.jpg", page=current)
+
+        self.assertEqual(list(scraper.image_responses), ["https://a.com/2.jpg"])
+
+    async def test_disabled_capture_does_nothing(self):
+        scraper = ScrapUtil(capture_images=False, use_detail_cache=False)
+        scraper.on_image_response(FakeResponse("https://a.com/1.jpg"))
+        await scraper.capture_product_images("https://a.com/1.jpg")
+        self.assertEqual(scraper.captured_images, {})
+
+
+class FakeLocator:
+    def __init__(self, attached: bool):
+        self.attached = attached
+        self.timeouts = []
+
+    @property
+    def first(self) -> "FakeLocator":
+        return self
+
+    def locator(self, selector: str) -> "FakeLocator":
+        return self
+
+    async def wait_for(self, state: str, timeout: float) -> None:
+        self.timeouts.append(timeout)
+        if not self.attached:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+
+
+class WaitOptionalTest(unittest.IsolatedAsyncioTestCase):
+    async def test_missing_element_returns_false_after_short_wait(self):
+        scraper = ScrapUtil(timeout=30000, use_detail_cache=False)
+        locator = FakeLocator(attached=False)
+
+        self.assertFalse(await scraper.wait_optional(locator))
+        self.assertEqual(locator.timeouts, [scraper.optional_wait_timeout])
+
+    async def test_attached_element_returns_true(self):
+        scraper = ScrapUtil(use_detail_cache=False)
+        self.assertTrue(await scraper.wait_optional(FakeLocator(True), "span"))
+
+
+class FakePage:
+    def __init__(self, name: str):
+        self.name = name
+        self.context = SimpleNamespace()
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeScraper:
+    def __init__(self):
+        self.opened = 0
+        self.navigations = []
+        self.release = asyncio.Event()
+
+    async def new_page(self, context) -> FakePage:
+        self.opened += 1
+        return FakePage(f"tab{self.opened}")
+
+    async def navigate_to_detail(self, page: FakePage, url: str) -> None:
+        self.navigations.append((page.name, url))
+        await self.release.wait()
+
+
+class DetailPageRingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_prefetches_depth_ahead_in_rotating_tabs(self):
+        scraper = FakeScraper()
+        origin = FakePage("origin")
+        urls = ["u0", "u1", "u2", "u3"]
+        ring = DetailPageRing(scraper, origin, urls, depth=2)
+        await ring.open()
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(ring.pages), 3)
+        self.assertEqual(scraper.navigations, [("origin", "u0"), ("tab1", "u1")])
+
+        scraper.release.set()
+        for n, url in enumerate(urls):
+            page, navigation = await ring.get(n)
+            self.assertIs(page, ring.pages[n % 3])
+            await navigation
+
+        self.assertEqual(
+            scraper.navigations,
+            [("origin", "u0"), ("tab1", "u1"), ("tab2", "u2"), ("origin", "u3")],
+        )
+        self.assertEqual(ring.navigations, {})
+
+        await ring.close()
+        self.assertFalse(origin.closed)
+        self.assertEqual(ring.pages, [origin])
+
+    async def test_depth_is_limited_by_url_count(self):
+        ring = DetailPageRing(FakeScraper(), FakePage("origin"), ["u0"], depth=3)
+        self.assertEqual(ring.depth, 0)
+        ring = DetailPageRing(FakeScraper(), FakePage("origin"), [], depth=3)
+        self.assertEqual(ring.depth, 0)
+
+    async def test_replace_and_close_clean_up_tabs(self):
+        scraper = FakeScraper()
+        origin = FakePage("origin")
+        ring = DetailPageRing(scraper, origin, ["u0", "u1", "u2"], depth=1)
+        await ring.open()
+
+        prefetch_tab = ring.pages[1]
+        new_tab = await ring.replace(prefetch_tab)
+        self.assertTrue(prefetch_tab.closed)
+        self.assertIs(ring.pages[1], new_tab)
+
+        # 원래 탭은 호출한 쪽에서 닫음
+        await ring.replace(origin)
+        self.assertFalse(origin.closed)
+
+        pending = ring.navigations[0]
+        await ring.close()
+        self.assertTrue(pending.cancelled())
+        self.assertTrue(new_tab.closed)
+        self.assertEqual(ring.pages, [origin])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from scraper.images import ImageInspector
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    return cv2.imencode(".png", image)[1].tobytes()
+
+
+class ImageInspectorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_solid_image_is_skipped_as_placeholder(self):
+        inspector = ImageInspector(min_bytes=0)
+        body = encode_png(np.full((100, 100, 3), 255, np.uint8))
+
+        self.assertFalse(await inspector.inspect(body, "https://a/1.png", "1"))
+        self.assertEqual(inspector.skipped[-1][2], "단색 이미지")
+
+        # 같은 바이트는 해시만으로 제외
+        self.assertFalse(await inspector.inspect(body, "https://a/2.png", "2"))
+        self.assertEqual(inspector.skipped[-1][2], "플레이스홀더 해시")
+
+    async def test_repeated_image_is_kept_unless_requested(self):
+        rng = np.random.default_rng(0)
+        body = encode_png(rng.integers(0, 255, (64, 64, 3), dtype=np.uint8))
+
+        inspector = ImageInspector(min_bytes=0, repeat_threshold=3)
+        results = [
+            await inspector.inspect(body, f"https://a/{i}.png", str(i))
+            for i in range(4)
+        ]
+        self.assertEqual(results, [True] * 4)
+        self.assertEqual(len(inspector.repeated), 2)
+
+        inspector = ImageInspector(min_bytes=0, repeat_threshold=3, skip_repeated=True)
+        results = [
+            await inspector.inspect(body, f"https://a/{i}.png", str(i))
+            for i in range(4)
+        ]
+        self.assertEqual(results, [True, True, False, False])
+
+    async def test_broken_bytes_fail_decoding(self):
+        inspector = ImageInspector(min_bytes=0)
+        self.assertFalse(await inspector.inspect(b"not an image", "https://a/x", "1"))
+        self.assertEqual(inspector.skipped[-1][2], "디코딩 실패")
+
+    async def test_inspect_file_uses_streamed_size_and_hash(self):
+        rng = np.random.default_rng(1)
+        images = {
+            "solid": encode_png(np.full((600, 800, 3), 0, np.uint8)),
+            "noise": encode_png(rng.integers(0, 255, (600, 800, 3), dtype=np.uint8)),
+        }
+        inspector = ImageInspector(min_bytes=0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            results = {}
+            for name, body in images.items():
+                path = Path(directory) / f"{name}.png.part"
+                path.write_bytes(body)
+                results[name] = await inspector.inspect_file(
+                    path,
+                    f"https://a/{name}.png",
+                    name,
+                    size=len(body),
+                    content_hash=hashlib.sha256(body).hexdigest(),
+                )
+
+        self.assertEqual(results, {"solid": False, "noise": True})
+        self.assertEqual(inspector.skipped[-1][2], "단색 이미지")
+
+    async def test_summary_counts_per_reason(self):
+        inspector = ImageInspector(min_bytes=2048)
+        for i in range(3):
+            await inspector.check_size(f"https://a/{i}", 100 + i, str(i))
+        await inspector.check_url("", "9")
+
+        summary = inspector.summary().splitlines()
+        self.assertEqual(len(summary), 3)
+        self.assertIn("용량 부족: 3건", summary[1])
+        self.assertIn("빈 URL: 1건", summary[2])
+        self.assertEqual(len(inspector.details().splitlines()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import pandas as pd
+
+from read_file.read import Read
+
+
+def make_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "링크": ["a", "b", "a", "c"],
+            "상품명": ["가방", "지갑", "가방", "모자"],
+            "판매가": [100, 200, 100, 300],
+            "옵션1": ["S", "M", "S", None],
+            "옵션2": ["", "", "", ""],
+            # 엑셀에서 빈 컬럼은 값이 없는 컬럼으로 읽힘
+            "변경상품명": None,
+            "차액": None,
+            "변경옵션1": None,
+            "변경옵션2": None,
+            "품절": "품절",
+        }
+    )
+
+
+class ApplyProductDiffsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_changes_are_written_to_the_first_matching_row(self):
+        product_details = [
+            {"링크": "a", "상품명": "새 가방", "판매가": 80, "옵션1": "S", "옵션2": ""},
+            {"링크": "b", "상품명": "지갑", "판매가": 200, "옵션1": "L", "옵션2": ""},
+        ]
+        df = await Read.apply_product_diffs(make_frame(), product_details)
+
+        self.assertEqual(df.loc[0, "변경상품명"], "새 가방")
+        self.assertEqual(df.loc[0, "차액"], 20)
+        self.assertEqual(df.loc[0, "판매가"], 80)
+        self.assertIsNone(df.loc[0, "변경옵션1"])
+        self.assertIsNone(df.loc[1, "변경상품명"])
+        self.assertIsNone(df.loc[1, "차액"])
+        self.assertEqual(df.loc[1, "변경옵션1"], "L")
+
+        # 중복 링크의 두 번째 행과 스크랩되지 않은 행은 그대로
+        self.assertEqual(df.loc[2, "판매가"], 100)
+        self.assertEqual(df.loc[2, "품절"], "품절")
+        self.assertEqual(df.loc[3, "품절"], "품절")
+        self.assertEqual(df.loc[0, "품절"], "")
+        self.assertEqual(df.loc[1, "품절"], "")
+
+    async def test_last_scraped_value_wins_and_missing_values_count_as_changed(self):
+        product_details = [
+            {"링크": "c", "상품명": "모자", "판매가": 310, "옵션1": "M", "옵션2": ""},
+            {"링크": "c", "상품명": "모자", "판매가": 300, "옵션1": "F", "옵션2": ""},
+        ]
+        df = await Read.apply_product_diffs(make_frame(), product_details)
+
+        self.assertIsNone(df.loc[3, "차액"])
+        self.assertEqual(df.loc[3, "변경옵션1"], "F")
+
+    async def test_unmatched_or_empty_results_leave_frame_unchanged(self):
+        expected = make_frame()
+        df = await Read.apply_product_diffs(make_frame(), [])
+        pd.testing.assert_frame_equal(df, expected)
+
+        df = await Read.apply_product_diffs(
+            make_frame(), [{"링크": "없음", "상품명": "x", "판매가": 1}]
+        )
+        pd.testing.assert_frame_equal(df, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scraper.stores import (
+    JsonlSink,
+    ParquetSink,
+    ProductStore,
+    ScrapCheckpoint,
+    SeenUrlSet,
+)
+
+
+def make_product(link: str, price: int, option_1: str = "S") -> dict:
+    return {
+        "사이트": "테스트",
+        "카테고리": "가방",
+        "상품명": f"상품 {link}",
+        "판매가": price,
+        "옵션1": option_1,
+        "링크": link,
+    }
+
+
+class ProductStoreTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = ProductStore(Path(self.directory.name) / "products.sqlite3")
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def history_count(self) -> int:
+        return self.store.connection.execute(
+            "SELECT COUNT(*) FROM product_history"
+        ).fetchone()[0]
+
+    async def test_upsert_counts_new_changed_and_unchanged(self):
+        counts = await self.store.upsert_products(
+            [make_product("a", 100), make_product("b", 200)], run_id="1"
+        )
+        self.assertEqual(counts, {"신규": 2, "변경": 0, "동일": 0})
+        self.assertEqual(self.history_count(), 2)
+
+        counts = await self.store.upsert_products(
+            [make_product("a", 100), make_product("b", 150)], run_id="2"
+        )
+        self.assertEqual(counts, {"신규": 0, "변경": 1, "동일": 1})
+        # 값이 그대로인 상품은 이력이 늘지 않음
+        self.assertEqual(self.history_count(), 3)
+
+    async def test_rows_without_site_or_link_are_skipped(self):
+        product = make_product("", 100)
+        counts = await self.store.upsert_products([product])
+        self.assertEqual(counts, {"신규": 0, "변경": 0, "동일": 0})
+        self.assertEqual(self.history_count(), 0)
+
+    async def test_get_changes_pairs_with_previous_history(self):
+        await self.store.upsert_products([make_product("a", 100)])
+        since = self.store.connection.execute(
+            "SELECT MAX(recorded_at) FROM product_history"
+        ).fetchone()[0]
+        await self.store.upsert_products(
+            [make_product("a", 90, option_1="M"), make_product("b", 50)]
+        )
+
+        changes = await self.store.get_changes(since=since)
+        self.assertEqual(len(changes), 1)  # 신규 상품 b 는 직전 이력이 없음
+        self.assertEqual(changes[0]["link"], "a")
+        self.assertEqual(changes[0]["previous_sale_price"], 100)
+        self.assertEqual(changes[0]["sale_price"], 90)
+        self.assertEqual(changes[0]["previous_option_1"], "S")
+        self.assertEqual(changes[0]["option_1"], "M")
+
+        self.assertEqual(await self.store.get_changes(since=since, site="없음"), [])
+
+
+class ScrapCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "checkpoint.jsonl"
+        self.config = {"sites": ["테스트"], "limit": 10}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_keeps_run_id_and_markers(self):
+        checkpoint = ScrapCheckpoint(self.path, self.config, run_id="첫번째")
+        checkpoint.record_frontier(
+            "테스트", 1, {"가방": ["a", "b"]}, {"가방": ["가방"]}
+        )
+        checkpoint.record_finished("끝난사이트", product_count=3, max_product_no=7)
+        checkpoint.close()
+
+        resumed = ScrapCheckpoint(self.path, self.config, run_id="두번째")
+        self.assertTrue(resumed.resumed)
+        self.assertEqual(resumed.run_id, "첫번째")
+        self.assertEqual(
+            resumed.get_frontier("테스트")["frontier"], {"가방": ["a", "b"]}
+        )
+        self.assertEqual(resumed.get_finished("끝난사이트")["max_product_no"], 7)
+        self.assertIsNone(resumed.get_finished("테스트"))
+        resumed.remove()
+        self.assertFalse(self.path.exists())
+
+    def test_partial_last_line_is_ignored(self):
+        checkpoint = ScrapCheckpoint(self.path, self.config, run_id="1")
+        checkpoint.record_finished("테스트", product_count=1, max_product_no=1)
+        checkpoint.close()
+        with open(self.path, mode="a", encoding="utf-8") as f:
+            f.write('{"site": "다른사이트", "fini')
+
+        resumed = ScrapCheckpoint(self.path, self.config, run_id="2")
+        self.assertTrue(resumed.resumed)
+        self.assertIsNotNone(resumed.get_finished("테스트"))
+        self.assertIsNone(resumed.get_finished("다른사이트"))
+        resumed.close()
+
+    def test_changed_config_starts_over(self):
+        checkpoint = ScrapCheckpoint(self.path, self.config, run_id="1")
+        checkpoint.record_finished("테스트", product_count=1, max_product_no=1)
+        checkpoint.close()
+
+        restarted = ScrapCheckpoint(self.path, {"sites": []}, run_id="2")
+        self.assertFalse(restarted.resumed)
+        self.assertEqual(restarted.run_id, "2")
+        self.assertIsNone(restarted.get_finished("테스트"))
+        restarted.close()
+
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+
+class JsonlSinkTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "result.jsonl"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_trim_partial_line(self):
+        self.path.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c": ')
+        self.assertEqual(JsonlSink.trim_partial_line(self.path, chunk_size=4), 18)
+        self.assertEqual(self.path.read_bytes(), b'{"a": 1}\n{"b": 2}\n')
+
+        # 줄바꿈이 하나도 없으면 전부 잘라냄
+        self.path.write_bytes(b'{"a": 1')
+        self.assertEqual(JsonlSink.trim_partial_line(self.path), 0)
+        self.assertEqual(self.path.read_bytes(), b"")
+
+    async def test_resume_appends_after_previous_records(self):
+        sink = JsonlSink(self.path, buffer_size=2)
+        for i in range(3):
+            await sink.emit({"상품번호": i + 1})
+        await sink.close()
+        with open(self.path, mode="a", encoding="utf-8") as f:
+            f.write('{"상품번호": 4')
+
+        sink = JsonlSink(self.path, buffer_size=2, resume=True)
+        self.assertEqual(
+            [record["상품번호"] for record in sink.iter_previous_records()], [1, 2, 3]
+        )
+        await sink.emit({"상품번호": 4})
+        await sink.close()
+        self.assertEqual(
+            [record["상품번호"] for record in sink.iter_records()], [1, 2, 3, 4]
+        )
+
+    async def test_without_resume_overwrites(self):
+        self.path.write_text(json.dumps({"상품번호": 1}) + "\n", encoding="utf-8")
+        sink = JsonlSink(self.path)
+        self.assertEqual(list(sink.iter_previous_records()), [])
+        await sink.emit({"상품번호": 2})
+        await sink.close()
+        self.assertEqual(list(sink.iter_records()), [{"상품번호": 2}])
+
+
+@unittest.skipUnless(ParquetSink.is_available(), "pyarrow 가 설치되지 않음")
+class ParquetSinkTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "result.parquet"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_resume_copies_previous_row_groups(self):
+        sink = ParquetSink(self.path, buffer_size=2)
+        await sink.emit({"상품번호": 1, "판매가": "1000", "상품명": "가방"})
+        await sink.emit({"상품번호": 2, "판매가": None, "상품명": 3})
+        await sink.close()
+
+        sink = ParquetSink(self.path, buffer_size=2, resume=True)
+        self.assertEqual(sink.count, 2)
+        self.assertEqual(
+            [record["상품번호"] for record in sink.iter_previous_records()], [1, 2]
+        )
+        await sink.emit({"상품번호": 3, "판매가": 500, "상품명": "지갑"})
+        await sink.close()
+
+        records = list(sink.iter_records())
+        self.assertEqual([record["상품번호"] for record in records], [1, 2, 3])
+        self.assertEqual([record["판매가"] for record in records], [1000, None, 500])
+        self.assertEqual(records[1]["상품명"], "3")
+        self.assertFalse(sink.previous_path.exists())
+
+    async def test_unreadable_previous_file_starts_over(self):
+        self.path.write_bytes(b"PAR1 broken")
+        sink = ParquetSink(self.path, resume=True)
+        self.assertIsNone(sink.previous_path)
+        self.assertEqual(list(sink.iter_previous_records()), [])
+        await sink.emit({"상품번호": 1})
+        await sink.close()
+        self.assertEqual(list(sink.iter_records()), [{"상품번호": 1}])
+
+
+class SeenUrlSetTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root_path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pending_and_saved_urls_are_found(self):
+        seen = SeenUrlSet.for_site(self.root_path, "테스트 사이트/1")
+        self.assertEqual(seen.path.name, "테스트_사이트_1.bin")
+        self.assertEqual(seen.contains(["a"]).tolist(), [False])
+
+        seen.add("a")
+        seen.add("c")
+        self.assertEqual(seen.contains(["a", "b", "c"]).tolist(), [True, False, True])
+
+        seen.save()
+        seen.add("b")
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(seen.contains(["a", "b", "c"]).tolist(), [True, True, True])
+
+    def test_saved_hashes_are_sorted_and_reloaded(self):
+        seen = SeenUrlSet.for_site(self.root_path, "테스트")
+        urls = [f"https://shop.com/p/{i}" for i in range(50)]
+        for url in urls:
+            seen.add(url)
+        seen.add(urls[0])
+        seen.save()
+        self.assertFalse(seen.path.with_suffix(".tmp").exists())
+
+        loaded = SeenUrlSet.for_site(self.root_path, "테스트")
+        self.assertEqual(len(loaded), 50)
+        self.assertTrue((loaded.hashes[1:] > loaded.hashes[:-1]).all())
+        self.assertTrue(loaded.contains(urls).all())
+        self.assertFalse(loaded.contains(["https://shop.com/p/50"]).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import pandas as pd
+
+from scraper.utils import build_image_jobs, select_image_sources
+
+
+class BuildImageJobsTest(unittest.TestCase):
+    def test_suffix_follows_position_in_cell(self):
+        df = pd.DataFrame(
+            {
+                "상품번호": [1, 2, 3, 4],
+                "이미지소스": ["a;\nb;\nc", " ;\nx;\nx", "solo", None],
+            }
+        )
+        jobs = build_image_jobs(df["상품번호"], df["이미지소스"])
+
+        self.assertEqual(
+            [(job.product_no, job.index, job.url, job.filename) for job in jobs],
+            [
+                ("1", 0, "a", "1_1.png"),
+                ("1", 1, "b", "1_2.png"),
+                ("1", 2, "c", "1_3.png"),
+                # 빈 값과 중복을 빼도 두 번째 위치는 _2 로 유지
+                ("2", 1, "x", "2_2.png"),
+                ("3", 0, "solo", "3.png"),
+            ],
+        )
+
+
+class SelectImageSourcesTest(unittest.TestCase):
+    def test_selects_nth_source_per_row(self):
+        sources = pd.Series(["a,b", "c", "d,e,f"])
+        selected = select_image_sources(sources, [1, 0, 2])
+        self.assertEqual(selected.to_dict(), {0: "b", 1: "c", 2: "f"})
+
+    def test_out_of_range_and_empty_rows_are_skipped(self):
+        sources = pd.Series(["a,b", "", None, " ,d", "e"])
+        selected = select_image_sources(sources, [5, 0, 0, 0, -1])
+        self.assertEqual(selected.to_dict(), {})
+
+        selected = select_image_sources(sources, [0, 0, 0, 1, 0])
+        self.assertEqual(selected.to_dict(), {0: "a", 3: "d", 4: "e"})
+
+    def test_shorter_num_list_limits_rows(self):
+        selected = select_image_sources(pd.Series(["a", "b", "c"]), [0])
+        self.assertEqual(selected.to_dict(), {0: "a"})
+
+
+if __name__ == "__main__":
+    unittest.main()